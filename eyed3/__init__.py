@@ -29,10 +29,11 @@ class Error(Exception):
 
 
 from .utils.log import log                                          # noqa: E402
-from .core import load, AudioFile                                   # noqa: E402
+from .core import load, probe, AudioFile                            # noqa: E402
 
 del sys
 del codecs
 del locale
 
-__all__ = ["AudioFile", "load", "log", "version", "LOCAL_ENCODING", "LOCAL_FS_ENCODING", "Error"]
+__all__ = ["AudioFile", "load", "probe", "log", "version", "LOCAL_ENCODING", "LOCAL_FS_ENCODING",
+           "Error"]
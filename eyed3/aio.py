@@ -0,0 +1,123 @@
+"""asyncio coroutines for loading and saving tags.
+
+File access and parsing block, so the work of :func:`eyed3.core.load` and
+:meth:`eyed3.id3.tag.Tag.save` is run in a pool of threads, by default one
+shared by this module, while the event loop carries on. For example::
+
+    async for path, audio_file in eyed3.aio.loadMany(paths, concurrency=16):
+        ...
+"""
+import io
+import asyncio
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+from . import core
+from .utils.log import getLogger
+
+log = getLogger(__name__)
+
+# The default number of files loaded at once by loadMany.
+DEFAULT_CONCURRENCY = 8
+# The size of the reads from streams passed to loadStream.
+STREAM_READ_SIZE = 64 * 1024
+
+_executor = None
+
+
+def _getExecutor(executor):
+    global _executor
+    if executor is not None:
+        return executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="eyed3-aio")
+    return _executor
+
+
+async def _run(executor, func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_getExecutor(executor),
+                                      functools.partial(func, *args, **kwargs))
+
+
+async def load(path, executor=None, **kwargs):
+    """Load ``path`` with :func:`eyed3.core.load`, which is passed
+    ``kwargs``, in ``executor`` (a ``concurrent.futures.Executor``) or the
+    module's thread pool."""
+    return await _run(executor, core.load, path, **kwargs)
+
+
+async def loadMany(paths, concurrency=DEFAULT_CONCURRENCY, executor=None,
+                   return_exceptions=False, **kwargs):
+    """An asynchronous iterator of ``(path, audio_file)`` pairs, in the
+    order of ``paths``, an iterable or asynchronous iterable. Up to
+    ``concurrency`` files are loaded at once, and no more paths are taken from
+    ``paths`` until the oldest result is consumed. Exceptions are raised
+    unless ``return_exceptions`` is True, then they are yielded in place of
+    the audio file. See :func:`load` for the other arguments."""
+    concurrency = max(1, concurrency or 1)
+    pending = collections.deque()
+
+    async def _result():
+        path, task = pending.popleft()
+        try:
+            return path, await task
+        except Exception as ex:
+            if not return_exceptions:
+                raise
+            log.debug(f"Unable to load {path}: {ex}")
+            return path, ex
+
+    try:
+        async for path in _aiter(paths):
+            if len(pending) >= concurrency:
+                yield await _result()
+            pending.append((path, asyncio.ensure_future(load(path, executor=executor,
+                                                             **kwargs))))
+        while pending:
+            yield await _result()
+    finally:
+        # The iteration was abandoned or failed.
+        for _, task in pending:
+            task.cancel()
+
+
+async def _aiter(iterable):
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def loadStream(source, name, executor=None, **kwargs):
+    """Load audio from ``source``, without writing it to a file, with
+    :func:`eyed3.core.loadFileObj`; ``name`` and ``kwargs`` are passed to
+    it. ``source`` is bytes, an object with a ``read(size)`` coroutine
+    (e.g. ``asyncio.StreamReader``), or an asynchronous iterable of bytes
+    (e.g. the chunks of an upload). The whole stream is read."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    else:
+        buf = io.BytesIO()
+        if hasattr(source, "read"):
+            while True:
+                chunk = await source.read(STREAM_READ_SIZE)
+                if not chunk:
+                    break
+                buf.write(chunk)
+        else:
+            async for chunk in source:
+                buf.write(chunk)
+        data = buf.getvalue()
+
+    return await _run(executor, core.loadFileObj, io.BytesIO(data), name, **kwargs)
+
+
+async def save(tag, executor=None, **kwargs):
+    """Save ``tag`` with :meth:`eyed3.id3.tag.Tag.save`, which is passed
+    ``kwargs``, returning its result. See :func:`load` for ``executor``. The
+    tag must not be modified, or saved again, until this completes."""
+    return await _run(executor, tag.save, **kwargs)
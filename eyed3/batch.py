@@ -0,0 +1,142 @@
+"""Edit and save the tags of many files at once.
+
+Each (path, edit) pair is loaded with :func:`eyed3.core.load`, edited, and
+saved with :meth:`eyed3.id3.tag.Tag.save` in a pool of threads, most of the
+time spent is waiting on file I/O. Results are reported per file, errors do
+not stop the batch.
+"""
+import os
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from . import core
+from .utils.fileio import WRITE_IN_PLACE
+from .utils.log import getLogger
+
+log = getLogger(__name__)
+
+DEFAULT_JOBS = 8
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """The result of editing one file. ``strategy`` is the write strategy
+    returned by :meth:`eyed3.id3.tag.Tag.save` (see
+    :func:`eyed3.utils.fileio.replaceHead`), and ``error`` the exception raised
+    by loading, editing, or saving, if any."""
+    path: str
+    strategy: str = None
+    tag_size: int = 0
+    error: Exception = None
+    # True when the file was skipped, having been committed to the journal by a previous run.
+    skipped: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def in_place(self):
+        """True if the tag was saved without moving any audio data."""
+        return self.ok and self.strategy == WRITE_IN_PLACE
+
+    @property
+    def rewritten(self):
+        """True if saving the tag moved or copied the audio data."""
+        return self.ok and self.strategy not in (None, WRITE_IN_PLACE)
+
+
+def applyEdit(tag, edit):
+    """Apply ``edit`` to ``tag``. ``edit`` is a callable, called with the tag,
+    or a mapping of tag attribute names to values (e.g.
+    ``{"artist": "Slayer", "track_num": (1, 10)}``)."""
+    if callable(edit):
+        edit(tag)
+    else:
+        for name, value in edit.items():
+            if not hasattr(tag, name):
+                raise AttributeError(f"Invalid tag field: {name}")
+            setattr(tag, name, value)
+
+
+def editFile(path, edit, tag_version=None, **save_kwargs):
+    """Load ``path``, apply ``edit`` (see :func:`applyEdit`) to its tag, adding
+    one if necessary, and save it. ``save_kwargs`` are passed to
+    :meth:`eyed3.id3.tag.Tag.save`. A :class:`BatchResult` is returned, errors
+    are raised."""
+    audio_file = core.load(path, tag_version=tag_version)
+    if audio_file is None:
+        raise ValueError(f"Unsupported file type: {path}")
+    if audio_file.tag is None:
+        if tag_version:
+            audio_file.initTag(version=tag_version)
+        else:
+            audio_file.initTag()
+
+    applyEdit(audio_file.tag, edit)
+    strategy = audio_file.tag.save(**save_kwargs)
+    return BatchResult(str(path), strategy=strategy,
+                       tag_size=audio_file.tag.file_info.tag_size)
+
+
+def iterEdits(edits, jobs=DEFAULT_JOBS, tag_version=None, **save_kwargs):
+    """Edit the files of ``edits``, an iterable of (path, edit) pairs, using
+    ``jobs`` threads, and yield a :class:`BatchResult` for each in the order
+    given. No more than ``2 * jobs`` files are pending at any time, so
+    ``edits`` may be a generator over a very large number of files. Edits of
+    the same file (by real path) are made one after the other, in order. See
+    :func:`editFile` for the other arguments.
+
+    When a :class:`eyed3.utils.journal.Journal` is passed (as the ``journal``
+    keyword for :meth:`eyed3.id3.tag.Tag.save`) writes are journaled, the
+    pending writes of an interrupted run with the journal are finished first,
+    and files it committed are skipped."""
+    journal = save_kwargs.get("journal")
+    done = set()
+    if journal is not None:
+        journal.resume()
+        done = journal.committedPaths()
+
+    def _edit(path, edit, previous):
+        if previous is not None:
+            # Edits of the same file are made one at a time, in order.
+            wait([previous])
+        try:
+            return editFile(path, edit, tag_version=tag_version, **save_kwargs)
+        except Exception as ex:
+            log.warning(f"Unable to edit {path}: {ex}")
+            return BatchResult(str(path), error=ex)
+
+    jobs = max(1, jobs or 1)
+    # The real path of each pending file -> the future of its last edit.
+    last_edits = {}
+
+    def _result(key, pending):
+        if isinstance(pending, BatchResult):
+            return pending
+        if last_edits.get(key) is pending:
+            del last_edits[key]
+        return pending.result()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = []
+        for path, edit in edits:
+            if os.path.abspath(path) in done:
+                pending.append((None, BatchResult(str(path), skipped=True)))
+                continue
+            if len(pending) >= 2 * jobs:
+                # Results are yielded in order, so wait on the oldest.
+                yield _result(*pending.pop(0))
+            key = os.path.realpath(path)
+            future = executor.submit(_edit, path, edit, last_edits.get(key))
+            last_edits[key] = future
+            pending.append((key, future))
+
+        for key, future in pending:
+            yield _result(key, future)
+
+
+def editTags(edits, jobs=DEFAULT_JOBS, tag_version=None, **save_kwargs):
+    """Edit all files of ``edits`` and return the list of
+    :class:`BatchResult` objects, see :func:`iterEdits`."""
+    return list(iterEdits(edits, jobs=jobs, tag_version=tag_version, **save_kwargs))
@@ -1,5 +1,6 @@
 """Basic core types and utilities."""
 import os
+import stat
 import time
 import functools
 import pathlib
@@ -18,6 +19,10 @@ AUDIO_MP3 = 1
 
 AUDIO_TYPES = (AUDIO_NONE, AUDIO_MP3)
 
+# The read buffer size used by :func:`eyed3.core.load`, the leading read of each file is this
+# large and should cover the tag header, most tags, and the first audio frames.
+LOAD_PREFIX_SIZE = 64 * 1024
+
 LP_TYPE = "lp"
 EP_TYPE = "ep"
 EP_MAX_SIZE_HINT = 6
@@ -161,6 +166,8 @@ class Tag:
 class AudioFile:
     """Abstract base class for audio file types (AudioInfo + Tag)"""
     tag: Tag = None
+    # True when loaded from a file object rather than a file, see loadFileObj.
+    stream = False
 
     def _read(self):
         """Subclasses MUST override this method and set ``self._info``,
@@ -419,7 +426,8 @@ def parseError(ex) -> None:
     log.warning(ex)
 
 
-def load(path, tag_version=None) -> Optional[AudioFile]:
+def load(path, tag_version=None, lazy=False, use_mmap=False,
+         exact_duration=False, stat_result=None) -> Optional[AudioFile]:
     """Loads the file identified by ``path`` and returns a concrete type of
     :class:`eyed3.core.AudioFile`. If ``path`` is not a file an ``IOError`` is
     raised. ``None`` is returned when the file type (i.e. mime-type) is not
@@ -432,25 +440,209 @@ def load(path, tag_version=None) -> Optional[AudioFile]:
     If ``tag_version`` is not None (the default) only a specific version of
     metadata is loaded. This value must be a version constant specific to the
     eventual format of the metadata.
+
+    When ``lazy`` is ``True`` tag frames are only decoded when first accessed,
+    which is considerably cheaper when only a few fields are needed from tags
+    with large images or many frames.
+
+    When ``use_mmap`` is ``True`` the file is memory mapped and the tag and
+    audio headers are parsed from the mapped region rather than with file
+    reads, see :class:`eyed3.utils.fileio.MappedFile`.
+
+    When ``exact_duration`` is ``True`` the play time and bit rate of MPEG
+    audio are computed by walking every frame rather than estimated, see
+    :func:`eyed3.mp3.walk.walkFrames`.
+
+    When the ``os.stat_result`` of ``path`` is already known, e.g. from
+    ``os.DirEntry.stat``, passing it as ``stat_result`` saves a stat of the
+    file.
+
+    Unchanged files are returned from the scan cache, when it is enabled, see
+    :mod:`eyed3.utils.scancache`.
     """
-    from . import mimetype, mp3, id3
+    from .utils import scancache
 
     if not isinstance(path, pathlib.Path):
         path = pathlib.Path(path)
     log.debug(f"Loading file: {path}")
 
-    if path.exists():
-        if not path.is_file():
-            raise IOError(f"not a file: {path}")
-    else:
-        raise IOError(f"file not found: {path}")
+    # A single stat and open per file, the stat results and file object are shared by the
+    # mime-type detection, tag parsing, and audio header search. The buffer size is such that
+    # the first read covers the tag header, typical tags, and the start of the audio.
+    if stat_result is None:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            raise IOError(f"file not found: {path}")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise IOError(f"not a file: {path}")
+
+    cache = scancache.getCache()
+    cache_options = (tag_version, lazy, exact_duration)
+    if cache is not None:
+        found, audio_file = cache.get(path, stat_result, cache_options)
+        if found:
+            log.debug(f"Loaded from the scan cache: {path}")
+            return audio_file
+
+    with open(str(path), "rb", buffering=LOAD_PREFIX_SIZE) as fileobj:
+        audio_file = _loadFileObj(path, fileobj, stat_result, tag_version, lazy=lazy,
+                                  use_mmap=use_mmap, exact_duration=exact_duration)
+        if cache is not None:
+            cache.put(path, stat_result, cache_options, audio_file, fileobj=fileobj)
+
+    return audio_file
+
+
+def loadFileObj(fileobj, name, tag_version=None, lazy=False,
+                exact_duration=False) -> Optional[AudioFile]:
+    """Loads audio from ``fileobj``, a seekable binary file object such as an
+    ``io.BytesIO``, that is not a file on disk. ``name`` is used as the
+    path of the returned :class:`eyed3.core.AudioFile`, its suffix helps
+    determine the file type. The audio file's ``stream`` attribute is
+    ``True``; since there is no file its tag can only be saved to a given
+    file name, :meth:`eyed3.id3.tag.Tag.save` with no file name raises
+    :class:`eyed3.id3.tag.TagException`. The seek index of MPEG audio is
+    built from ``fileobj``, see :meth:`eyed3.mp3.Mp3AudioInfo.seekIndex`. The
+    remaining arguments are those of :func:`eyed3.core.load`.
+    """
+    from . import mp3
+
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(0)
+    # Tag and audio parsing use the file name and size from these.
+    stat_result = os.stat_result((stat.S_IFREG, 0, 0, 1, 0, 0, size, 0, 0, 0))
+
+    audio_file = _loadFileObj(pathlib.Path(name), _NamedFileObj(fileobj, str(name)),
+                              stat_result, tag_version, lazy=lazy,
+                              exact_duration=exact_duration)
+    if audio_file is not None:
+        audio_file.stream = True
+        if isinstance(audio_file.info, mp3.Mp3AudioInfo):
+            audio_file.info._stream = fileobj
+        if audio_file.tag is not None and audio_file.tag.file_info is not None:
+            audio_file.tag.file_info.stream = True
+    return audio_file
+
+
+class _NamedFileObj:
+    """A file object with the ``name`` given to :func:`loadFileObj`, the
+    caller's object is not modified."""
+    def __init__(self, fileobj, name):
+        self._fileobj = fileobj
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._fileobj, attr)
+
+
+def _loadFileObj(path, fileobj, stat_result, tag_version, lazy=False, use_mmap=False,
+                 exact_duration=False):
+    from . import mimetype, mp3, id3
 
-    mtype = mimetype.guessMimetype(path)
+    mtype = mimetype.guessMimetype(path, fileobj=fileobj)
     log.debug(f"File mime-type: {mtype}")
 
     if mtype in mp3.MIME_TYPES:
-        return mp3.Mp3AudioFile(path, tag_version)
+        return mp3.Mp3AudioFile(path, tag_version, lazy=lazy, fileobj=fileobj,
+                                stat_result=stat_result, use_mmap=use_mmap,
+                                exact_duration=exact_duration)
     elif mtype == id3.ID3_MIME_TYPE:
-        return id3.TagFile(path, tag_version)
+        return id3.TagFile(path, tag_version, lazy=lazy, fileobj=fileobj,
+                           stat_result=stat_result, use_mmap=use_mmap)
     else:
         return None
+
+
+@dataclasses.dataclass
+class ProbeInfo:
+    """The results of :func:`eyed3.core.probe`."""
+
+    # The file path.
+    path: str
+    # The file size, in bytes.
+    size_bytes: int
+    # The version of the ID3 tag (v2 is preferred over v1), or ``None``
+    tag_version: Optional[tuple] = None
+    # The size of the v2 tag including the tag header and padding.
+    tag_size: int = 0
+    # The amount of v2 tag padding.
+    padding_size: int = 0
+    # A list of (frame ID, frame data size) 2-tuples for each v2 frame.
+    frames: list = dataclasses.field(default_factory=list)
+    # True if the file ends with an ID3 v1 tag.
+    has_v1_tag: bool = False
+    # The first :class:`eyed3.mp3.headers.Mp3Header`, if any, and its offset.
+    mp3_header: object = None
+    mp3_header_pos: Optional[int] = None
+
+    @property
+    def frame_ids(self):
+        return [fid for fid, _ in self.frames]
+
+    @property
+    def has_images(self):
+        from .id3.frames import IMAGE_FID
+        return IMAGE_FID in self.frame_ids
+
+
+def probe(path) -> ProbeInfo:
+    """A quick inspection of the file identified by ``path``. Only the ID3 tag
+    header, frame headers, the ID3 v1 tag location, and the first MPEG audio
+    header are read; no frame data is decoded nor is the mime-type determined.
+    If ``path`` is not a file an ``IOError`` is raised.
+    """
+    from .id3 import ID3_V1_0, ID3_V1_1
+    from .id3.headers import TagHeader, ExtendedTagHeader
+    from .id3.frames import scanFrameHeaders
+    from .mp3.headers import findHeader, Mp3Header, Mp3Exception
+
+    if not isinstance(path, pathlib.Path):
+        path = pathlib.Path(path)
+    log.debug(f"Probing file: {path}")
+
+    if path.exists():
+        if not path.is_file():
+            raise IOError(f"not a file: {path}")
+    else:
+        raise IOError(f"file not found: {path}")
+
+    with open(path, "rb") as fp:
+        info = ProbeInfo(str(path), os.fstat(fp.fileno()).st_size)
+
+        audio_start = 0
+        tag_header = TagHeader()
+        if tag_header.parse(fp):
+            ext_header = ExtendedTagHeader()
+            if tag_header.extended:
+                ext_header.parse(fp, tag_header.version)
+
+            frame_headers, info.padding_size = scanFrameHeaders(fp, tag_header,
+                                                                ext_header)
+            info.frames = [(h.id, h.data_size) for h in frame_headers]
+            info.tag_version = tag_header.version
+            info.tag_size = audio_start = TagHeader.SIZE + tag_header.tag_size
+
+        if info.size_bytes >= 128:
+            fp.seek(-128, 2)
+            v1_data = fp.read(128)
+            if v1_data[:3] == b"TAG":
+                info.has_v1_tag = True
+                if info.tag_version is None:
+                    info.tag_version = (ID3_V1_1 if v1_data[125] == 0 and
+                                        v1_data[126] != 0 else ID3_V1_0)
+
+        search_pos = audio_start
+        while info.mp3_header is None:
+            header_pos, header_int, _ = findHeader(fp, search_pos)
+            if not header_int:
+                break
+            try:
+                info.mp3_header = Mp3Header(header_int)
+                info.mp3_header_pos = header_pos
+            except Mp3Exception as ex:
+                log.debug(f"Invalid mp3 header: {ex}")
+                search_pos = header_pos + 1
+
+    return info
@@ -3,6 +3,7 @@ import functools
 
 from .. import core
 from .. import Error
+from ..utils.fileio import openFile
 from ..utils.log import getLogger
 
 log = getLogger(__name__)
@@ -318,17 +319,27 @@ class GenreMap(dict):
 class TagFile(core.AudioFile):
     """
     A shim class for dealing with files that contain only ID3 data, no audio.
+    The optional ``fileobj``, ``stat_result``, and ``use_mmap`` are used as in
+    :class:`eyed3.mp3.Mp3AudioFile`.
     """
-    def __init__(self, path, version=ID3_ANY_VERSION):
+    def __init__(self, path, version=ID3_ANY_VERSION, lazy=False,
+                 fileobj=None, stat_result=None, use_mmap=False):
         self._tag_version = version
+        self._lazy = lazy
+        self._use_mmap = use_mmap
+        self._fileobj = fileobj
+        self._stat_result = stat_result
         core.AudioFile.__init__(self, path)
         assert(self.type == core.AUDIO_NONE)
 
     def _read(self):
+        fileobj, stat_result = self._fileobj, self._stat_result
+        self._fileobj, self._stat_result = None, None
 
-        with open(self.path, 'rb') as file_obj:
+        with openFile(self.path, fileobj, use_mmap=self._use_mmap) as file_obj:
             tag = Tag()
-            tag_found = tag.parse(file_obj, self._tag_version)
+            tag_found = tag.parse(file_obj, self._tag_version, lazy=self._lazy,
+                                  stat_result=stat_result)
             self._tag = tag if tag_found else None
 
         self.type = core.AUDIO_NONE
@@ -338,7 +349,7 @@ class TagFile(core.AudioFile):
         """
         self.tag = Tag()
         self.tag.version = version
-        self.tag.file_info = FileInfo(self.path)
+        self.tag.file_info = FileInfo(self.path, stream=self.stream)
 
 
 # ID3 genres, as defined in ID3 v1. The position in the list is the genre's numeric byte value.
@@ -542,4 +553,4 @@ ID3_GENRES = [
 genres = GenreMap()
 
 from . import frames                                                   # noqa
-from .tag import Tag, TagException, TagTemplate, FileInfo              # noqa
+from .tag import Tag, TagException, TagTemplate, FileInfo, WritePlan   # noqa
@@ -1,13 +1,15 @@
+import re
 import dataclasses
 from io import BytesIO
 from collections import namedtuple
 
 from .. import core
-from ..utils import requireUnicode, requireBytes
+from ..utils import requireUnicode, requireBytes, requireBytesLike
 from ..utils.binfuncs import (
-    bin2bytes, bin2dec, bytes2bin, dec2bin, bytes2dec, dec2bytes,
+    bin2bytes, bytes2bin, dec2bin, bytes2dec, dec2bytes,
     signedInt162bytes, bytes2signedInt16,
 )
+from ..utils.intcodec import bytes2int, int2bytes, int2synchsafe, synchsafe2int
 from .. import Error
 from . import ID3_V2, ID3_V2_2, ID3_V2_3, ID3_V2_4
 from . import (LATIN1_ENCODING, UTF_8_ENCODING, UTF_16BE_ENCODING,
@@ -98,11 +100,12 @@ class Frame(object):
     def header(self, h):
         self._header = h
 
-    @requireBytes(1)
+    @requireBytesLike(1)
     def parse(self, data, frame_header):
         self.id = frame_header.id
         self.header = frame_header
-        self.data = self._disassembleFrame(data)
+        # ``data`` may be a view of the tag buffer, this is the one copy made.
+        self.data = bytes(self._disassembleFrame(data))
 
     def render(self):
         return self._assembleFrame(self.data)
@@ -136,7 +139,7 @@ class Frame(object):
         log.warning("Frame encryption not yet supported, leaving data as is.")
         return data
 
-    @requireBytes(1)
+    @requireBytesLike(1)
     def _disassembleFrame(self, data):
         header = self.header
         # Format flags in the frame header may add extra data to the
@@ -144,29 +147,29 @@ class Frame(object):
         if header.minor_version <= 3:
             # 2.3:  compression(4), encryption(1), group(1)
             if header.compressed:
-                self.decompressed_size = bin2dec(bytes2bin(data[:4]))
+                self.decompressed_size = bytes2int(data[:4])
                 data = data[4:]
                 log.debug("Decompressed Size: %d" % self.decompressed_size)
             if header.encrypted:
-                self.encrypt_method = bin2dec(bytes2bin(data[0:1]))
+                self.encrypt_method = bytes2int(data[0:1])
                 data = data[1:]
                 log.debug("Encryption Method: %d" % self.encrypt_method)
             if header.grouped:
-                self.group_id = bin2dec(bytes2bin(data[0:1]))
+                self.group_id = bytes2int(data[0:1])
                 data = data[1:]
                 log.debug("Group ID: %d" % self.group_id)
         else:
             # 2.4:  group(1), encrypted(1), data_length_indicator (4,7)
             if header.grouped:
-                self.group_id = bin2dec(bytes2bin(data[0:1]))
+                self.group_id = bytes2int(data[0:1])
                 log.debug("Group ID: %d" % self.group_id)
                 data = data[1:]
             if header.encrypted:
-                self.encrypt_method = bin2dec(bytes2bin(data[0:1]))
+                self.encrypt_method = bytes2int(data[0:1])
                 data = data[1:]
                 log.debug("Encryption Method: %d" % self.encrypt_method)
             if header.data_length_indicator:
-                self.data_len = bin2dec(bytes2bin(data[:4], 7))
+                self.data_len = synchsafe2int(data[:4])
                 data = data[4:]
                 log.debug("Data Length: %d" % self.data_len)
                 if header.compressed:
@@ -186,25 +189,28 @@ class Frame(object):
     def _assembleFrame(self, data):
         header = self.header
 
-        # eyeD3 never writes unsync'd frames
-        header.unsync = False
+        # Only v2.4 has frame level unsync, v2.3 tags are unsync'd as a whole
+        # (see Tag.save)
+        if header.minor_version != 4:
+            header.unsync = False
 
-        format_data = b""
+        format_parts = []
         if header.minor_version == 3:
             if header.compressed:
-                format_data += bin2bytes(dec2bin(len(data), 32))
+                format_parts.append(int2bytes(len(data), 4))
             if header.encrypted:
-                format_data += bin2bytes(dec2bin(self.encrypt_method, 8))
+                format_parts.append(int2bytes(self.encrypt_method, 1))
             if header.grouped:
-                format_data += bin2bytes(dec2bin(self.group_id, 8))
+                format_parts.append(int2bytes(self.group_id, 1))
         else:
             if header.grouped:
-                format_data += bin2bytes(dec2bin(self.group_id, 8))
+                format_parts.append(int2bytes(self.group_id, 1))
             if header.encrypted:
-                format_data += bin2bytes(dec2bin(self.encrypt_method, 8))
+                format_parts.append(int2bytes(self.encrypt_method, 1))
             if header.compressed or header.data_length_indicator:
                 header.data_length_indicator = 1
-                format_data += bin2bytes(dec2bin(len(data), 32))
+                # The size of the data before compression, encryption, and unsync.
+                format_parts.append(int2synchsafe(len(data), 4))
 
         if header.compressed:
             data = self.compress(data)
@@ -212,8 +218,18 @@ class Frame(object):
         if header.encrypted:
             data = self.encrypt(data)
 
-        self.data = format_data + data
-        return header.render(len(self.data)) + self.data
+        # Frame data is copied once, with the frame header, unless there is
+        # format data or unsync.
+        self.data = b"".join(format_parts + [data]) if format_parts else data
+        if header.unsync:
+            # The format data is read before the data is deunsync'd, only the data is unsync'd.
+            unsync_data = unsyncData(data)
+            log.debug(f"Unsync'd {len(data)} bytes of frame data to "
+                      f"{len(unsync_data)} bytes")
+            raw_data = b"".join(format_parts + [unsync_data])
+        else:
+            raw_data = self.data
+        return b"".join((header.render(len(raw_data)), raw_data))
 
     @property
     def text_delim(self):
@@ -598,20 +614,19 @@ class ImageFrame(Frame):
     def parse(self, data, frame_header):
         super().parse(data, frame_header)
 
-        input = BytesIO(self.data)
-        log.debug("APIC frame data size: %d" % len(self.data))
-        self.encoding = encoding = input.read(1)
+        data = self.data
+        log.debug("APIC frame data size: %d" % len(data))
+        self.encoding = encoding = data[0:1]
 
         # Mime type
-        self._mime_type = b""
         if frame_header.minor_version != 2:
-            ch = input.read(1)
-            while ch and ch != b"\x00":
-                self._mime_type += ch
-                ch = input.read(1)
+            pos = _findNull(data, 1)
+            self._mime_type = data[1:pos]
+            pos += 1
         else:
             # v2.2 (OBSOLETE) special case
-            self._mime_type = input.read(3)
+            self._mime_type = data[1:4]
+            pos = 4
         log.debug("APIC mime type: %s" % self._mime_type)
         if not self._mime_type:
             core.parseError(FrameException("APIC frame does not contain a mime "
@@ -620,7 +635,8 @@ class ImageFrame(Frame):
                 self._mime_type.find(b"/") == -1):
             self._mime_type = b"image/" + self._mime_type
 
-        pt = ord(input.read(1))
+        pt = ord(data[pos:pos + 1])
+        pos += 1
         log.debug("Initial APIC picture type: %d" % pt)
         if pt < self.MIN_TYPE or pt > self.MAX_TYPE:
             core.parseError(FrameException("Invalid APIC picture type: %d" %
@@ -633,10 +649,8 @@ class ImageFrame(Frame):
         self.desciption = ""
 
         # Remaining data is a NULL separated description and image data
-        buffer = input.read()
-        input.close()
-
-        (desc, img) = splitUnicode(buffer, encoding)
+        desc_end, img_start = _splitUnicodeOffsets(data, encoding, pos)
+        desc, img = data[pos:desc_end], data[img_start:]
         log.debug("description len: %d" % len(desc))
         log.debug("image len: %d" % len(img))
         self.description = decodeUnicode(desc, encoding)
@@ -664,17 +678,11 @@ class ImageFrame(Frame):
         if not self.image_data and self.image_url:
             self._mime_type = self.URL_MIME_TYPE
 
-        data = (self.encoding + self._mime_type + b"\x00" +
-                bin2bytes(dec2bin(self.picture_type, 8)) +
-                self.description.encode(id3EncodingToString(self.encoding)) +
-                self.text_delim)
-
-        if self.image_data:
-            data += self.image_data
-        elif self.image_url:
-            data += self.image_url
-
-        self.data = data
+        self.data = b"".join((self.encoding, self._mime_type, b"\x00",
+                              int2bytes(self.picture_type, 1),
+                              self.description.encode(id3EncodingToString(self.encoding)),
+                              self.text_delim,
+                              self.image_data or self.image_url or b""))
         return super(ImageFrame, self).render()
 
     @staticmethod
@@ -831,20 +839,18 @@ class ObjectFrame(Frame):
         """
         super().parse(data, frame_header)
 
-        input = BytesIO(self.data)
-        log.debug("GEOB frame data size: " + str(len(self.data)))
-        self.encoding = encoding = input.read(1)
+        data = self.data
+        log.debug("GEOB frame data size: " + str(len(data)))
+        self.encoding = encoding = data[0:1]
 
         # Mime type
-        self._mime_type = b""
         if self.header.minor_version != 2:
-            ch = input.read(1)
-            while ch not in (b'', b'\0'):
-                self._mime_type += ch
-                ch = input.read(1)
+            pos = _findNull(data, 1) + 1
+            self._mime_type = data[1:pos - 1]
         else:
             # v2.2 (OBSOLETE) special case
-            self._mime_type = input.read(3)
+            self._mime_type = data[1:4]
+            pos = 4
         log.debug("GEOB mime type: %s" % self._mime_type)
         if not self._mime_type:
             core.parseError(FrameException("GEOB frame does not contain a "
@@ -858,11 +864,10 @@ class ObjectFrame(Frame):
 
         # Remaining data is a NULL separated filename, description and object
         # data
-        buffer = input.read()
-        input.close()
-
-        (filename, buffer) = splitUnicode(buffer, encoding)
-        (desc, obj) = splitUnicode(buffer, encoding)
+        filename_end, pos2 = _splitUnicodeOffsets(data, encoding, pos)
+        desc_end, obj_start = _splitUnicodeOffsets(data, encoding, pos2)
+        filename = data[pos:filename_end]
+        desc, obj = data[pos2:desc_end], data[obj_start:]
         self.filename = decodeUnicode(filename, encoding)
         log.debug("GEOB filename: " + self.filename)
         self.description = decodeUnicode(desc, encoding)
@@ -876,13 +881,12 @@ class ObjectFrame(Frame):
 
     def render(self):
         self._initEncoding()
-        data = (self.encoding + self._mime_type + b"\x00" +
-                self.filename.encode(id3EncodingToString(self.encoding)) +
-                self.text_delim +
-                self.description.encode(id3EncodingToString(self.encoding)) +
-                self.text_delim +
-                (self.object_data or b""))
-        self.data = data
+        self.data = b"".join((self.encoding, self._mime_type, b"\x00",
+                              self.filename.encode(id3EncodingToString(self.encoding)),
+                              self.text_delim,
+                              self.description.encode(id3EncodingToString(self.encoding)),
+                              self.text_delim,
+                              self.object_data or b""))
         return super(ObjectFrame, self).render()
 
 
@@ -1304,18 +1308,17 @@ class TocFrame(Frame):
         if self.ordered:
             flags[self.ORDERED_FLAG_BIT] = 1
 
-        data = (self.element_id + b'\x00' +
-                bin2bytes(flags) + dec2bytes(len(self.child_ids)))
+        parts = [self.element_id, b'\x00', bin2bytes(flags), dec2bytes(len(self.child_ids))]
 
         for cid in self.child_ids:
-            data += cid + b'\x00'
+            parts += [cid, b'\x00']
 
         if self.description is not None:
             desc_frame = TextFrame(TITLE_FID, self.description)
             desc_frame.header = FrameHeader(TITLE_FID, self.header.version)
-            data += desc_frame.render()
+            parts.append(desc_frame.render())
 
-        self.data = data
+        self.data = b"".join(parts)
         return super().render()
 
 
@@ -1704,19 +1707,19 @@ class ChapterFrame(Frame):
             self.sub_frames = FrameSet()
 
     def render(self):
-        data = self.element_id + b'\x00'
+        parts = [self.element_id, b'\x00']
 
         for n in self.times + self.offsets:
             if n is not None:
-                data += dec2bytes(n, 32)
+                parts.append(dec2bytes(n, 32))
             else:
-                data += b'\xff\xff\xff\xff'
+                parts.append(b'\xff\xff\xff\xff')
 
         for f in self.sub_frames.getAllFrames():
             f.header = FrameHeader(f.id, self.header.version)
-            data += f.render()
+            parts.append(f.render())
 
-        self.data = data
+        self.data = b"".join(parts)
         return super(ChapterFrame, self).render()
 
     @property
@@ -1770,11 +1773,18 @@ class FrameSet(dict):
     def __init__(self):
         dict.__init__(self)
         self._unknown_frame_ids = set()
+        # Frame ID -> [(tag_header, frame_header, data), ...] for frames not
+        # yet decoded, see ``parse(lazy=True)``.
+        self._lazy_frames = {}
 
-    def parse(self, f, tag_header, extended_header):
+    def parse(self, f, tag_header, extended_header, lazy=False):
         """Read frames starting from the current read position of the file
         object. Returns the amount of padding which occurs after the tag, but
-        before the audio content.  A return value of 0 does not mean error."""
+        before the audio content.  A return value of 0 does not mean error.
+
+        When ``lazy`` is ``True`` only the frame headers are parsed, the raw
+        frame data is kept and each frame ID is decoded into concrete
+        :class:`Frame` objects the first time it is accessed."""
         self.clear()
         self._unknown_frame_ids.clear()
 
@@ -1797,12 +1807,12 @@ class FrameSet(dict):
             log.debug("De-unsynch'd %d bytes at once (<= 2.3 tag) to %d bytes" %
                       (og_size, size_left))
 
-        # Adding bytes to simulate the tag header(s) in the buffer.  This keeps
-        # f.tell() values matching the file offsets for logging.
-        prepadding = b'\x00' * 10  # Tag header
-        prepadding += b'\x00' * extended_header.size
-        tag_buffer = BytesIO(prepadding + tag_data)
-        tag_buffer.seek(len(prepadding))
+        # All frames are parsed from views of this one buffer, frame data is
+        # only copied when a frame is decoded. The header offset keeps the
+        # logged positions matching the file offsets.
+        tag_buffer = memoryview(tag_data)
+        offset = 0
+        header_offset = 10 + extended_header.size
 
         frame_count = 0
         while size_left > 0:
@@ -1814,34 +1824,48 @@ class FrameSet(dict):
 
             log.debug("+++++++++++++++++++++++++++++++++++++++++++++++++")
             log.debug("FrameSet: Reading Frame #" + str(frame_count + 1))
-            frame_header = FrameHeader.parse(tag_buffer, tag_header.version)
+            log.debug("FrameHeader [start byte]: %d (0x%X)" %
+                      (header_offset + offset, header_offset + offset))
+            frame_header = FrameHeader.parseBuffer(tag_buffer, offset,
+                                                   tag_header.version)
             if not frame_header:
                 log.debug("No frame found, implied padding of %d bytes" %
                           size_left)
                 padding_size = size_left
                 break
 
+            offset += frame_header.size
+
             # Frame data.
             if frame_header.data_size:
                 log.debug("FrameSet: Reading %d (0x%X) bytes of data from byte "
                           "pos %d (0x%X)" % (frame_header.data_size,
                                              frame_header.data_size,
-                                             tag_buffer.tell(),
-                                             tag_buffer.tell()))
-                data = tag_buffer.read(frame_header.data_size)
+                                             header_offset + offset,
+                                             header_offset + offset))
+                data = tag_buffer[offset:offset + frame_header.data_size]
+                offset += frame_header.data_size
 
                 log.debug("FrameSet: %d bytes of data read" % len(data))
                 consumed_size += (frame_header.size +
                                   frame_header.data_size)
-                try:
-                    frame = createFrame(tag_header, frame_header, data)
-                except FrameException as frame_ex:
-                    log.warning(f"Frame error:  {frame_ex}")
-                else:
-                    self[frame.id] = frame
+                if lazy:
+                    fid = frame_header.id
+                    self._lazy_frames.setdefault(fid, []).append(
+                        (tag_header, frame_header, data))
                     frame_count += 1
-                    if frame.unknown:
-                        self._unknown_frame_ids.add(frame.id)
+                    if fid not in ID3_FRAMES and fid not in NONSTANDARD_ID3_FRAMES:
+                        self._unknown_frame_ids.add(fid)
+                else:
+                    try:
+                        frame = createFrame(tag_header, frame_header, data)
+                    except FrameException as frame_ex:
+                        log.warning(f"Frame error:  {frame_ex}")
+                    else:
+                        self[frame.id] = frame
+                        frame_count += 1
+                        if frame.unknown:
+                            self._unknown_frame_ids.add(frame.id)
 
             # Each frame contains data_size + headerSize bytes.
             size_left -= (frame_header.size +
@@ -1849,6 +1873,43 @@ class FrameSet(dict):
 
         return padding_size
 
+    def _decodeFrames(self, fid):
+        """Decode the lazily parsed frames for ``fid``, if any."""
+        lazy_frames = self._lazy_frames.pop(fid, None)
+        if not lazy_frames:
+            return
+
+        decoded = []
+        for tag_header, frame_header, data in lazy_frames:
+            try:
+                decoded.append(createFrame(tag_header, frame_header, data))
+            except FrameException as frame_ex:
+                log.warning(f"Frame error:  {frame_ex}")
+
+        if decoded:
+            # Any frames added before the decode follow those from the tag.
+            dict.__setitem__(self, fid, decoded + dict.get(self, fid, []))
+        else:
+            self._unknown_frame_ids.discard(fid)
+
+    def _decodeAllFrames(self):
+        for fid in list(self._lazy_frames):
+            self._decodeFrames(fid)
+
+    def __reduce__(self):
+        # The frame lists are restored by __setstate__, __setitem__ takes single frames. Lazy
+        # frame data are views of the tag data, those are copied.
+        state = dict(self.__dict__)
+        state["_lazy_frames"] = {fid: [(tag_header, frame_header, bytes(data))
+                                       for tag_header, frame_header, data in lazy_frames]
+                                 for fid, lazy_frames in self._lazy_frames.items()}
+        return FrameSet, (), (dict.copy(self), state)
+
+    def __setstate__(self, state):
+        frame_lists, attrs = state
+        dict.update(self, frame_lists)
+        self.__dict__.update(attrs)
+
     @requireBytes(1)
     def __getitem__(self, fid):
         if fid in self:
@@ -1900,21 +1961,132 @@ class FrameSet(dict):
 
     @requireBytes(1)
     def __contains__(self, fid):
+        self._decodeFrames(fid)
         return dict.__contains__(self, fid)
 
+    @requireBytes(1)
+    def __delitem__(self, fid):
+        self._decodeFrames(fid)
+        dict.__delitem__(self, fid)
+
+    def __iter__(self):
+        self._decodeAllFrames()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._decodeAllFrames()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._decodeAllFrames()
+        if isinstance(other, FrameSet):
+            other._decodeAllFrames()
+        return dict.__eq__(self, other)
+
+    def __repr__(self):
+        self._decodeAllFrames()
+        return dict.__repr__(self)
+
+    def keys(self):
+        self._decodeAllFrames()
+        return dict.keys(self)
+
+    def values(self):
+        self._decodeAllFrames()
+        return dict.values(self)
+
+    def items(self):
+        self._decodeAllFrames()
+        return dict.items(self)
+
+    def get(self, fid, default=None):
+        self._decodeFrames(fid)
+        return dict.get(self, fid, default)
+
+    def pop(self, fid, *args):
+        self._decodeFrames(fid)
+        return dict.pop(self, fid, *args)
+
+    def popitem(self):
+        self._decodeAllFrames()
+        return dict.popitem(self)
+
+    def setdefault(self, fid, default=None):
+        self._decodeFrames(fid)
+        return dict.setdefault(self, fid, default)
+
+    def copy(self):
+        self._decodeAllFrames()
+        return dict.copy(self)
+
+    def clear(self):
+        self._lazy_frames.clear()
+        dict.clear(self)
+
+
+def scanFrameHeaders(f, tag_header, extended_header):
+    """Read the frame headers of a tag starting at the current position of the
+    file object ``f`` (i.e. following the tag header and extended header),
+    seeking over all frame data. Returns a 2-tuple of the list of
+    :class:`eyed3.id3.headers.FrameHeader` objects and the padding size, as
+    computed by :meth:`FrameSet.parse`, without decoding any frames."""
+    size_left = tag_header.tag_size - extended_header.size
+
+    if tag_header.unsync and tag_header.version <= ID3_V2_3:
+        # The frame sizes refer to the de-unsync'd data, no choice but to read
+        # it all.
+        buf = memoryview(deunsyncData(f.read(size_left)))
+        size_left = len(buf)
+
+        def readHeader(sz):
+            nonlocal offset
+            offset += sz
+            return buf[offset - sz:offset]
+
+        def skip(sz):
+            nonlocal offset
+            offset += sz
+
+        offset = 0
+    else:
+        readHeader = f.read
+
+        def skip(sz):
+            f.seek(sz, 1)
+
+    header_size = 6 if tag_header.version[1] == 2 else 10
+    frame_headers = []
+    while size_left >= (10 + 1):  # The size of the smallest frame.
+        frame_header = FrameHeader.parseBuffer(readHeader(header_size), 0,
+                                               tag_header.version)
+        if not frame_header:
+            break
+
+        skip(frame_header.data_size)
+        frame_headers.append(frame_header)
+        size_left -= (frame_header.size + frame_header.data_size)
+
+    return frame_headers, max(size_left, 0)
+
 
 def deunsyncData(data):
-    output = []
-    safe = True
-    for val in [bytes([b]) for b in data]:
-        if safe:
-            output.append(val)
-            safe = (val != b'\xff')
-        else:
-            if val != b'\x00':
-                output.append(val)
-            safe = True
-    return b''.join(output)
+    """Reverse the ID3 unsynchronization scheme, every ``FF 00`` byte sequence
+    is replaced with ``FF``."""
+    return bytes(data).replace(b"\xff\x00", b"\xff")
+
+
+_UNSYNC_REGEX = re.compile(b"\xff(?=[\x00\xe0-\xff])")
+
+
+def unsyncData(data):
+    """Apply the ID3 unsynchronization scheme to ``data``. A ``00`` byte is
+    inserted after every ``FF`` that is followed by a byte that could be
+    mistaken for an MPEG sync (``111xxxxx``) or by ``00`` (so that ``FF 00``
+    survives a round trip), and after a trailing ``FF``."""
+    data = _UNSYNC_REGEX.sub(b"\xff\x00", bytes(data))
+    if data.endswith(b"\xff"):
+        data += b"\x00"
+    return data
 
 
 # Create and return the appropriate frame.
@@ -1961,23 +2133,41 @@ def decodeUnicode(bites, encoding):
 
 
 def splitUnicode(data, encoding):
-    try:
-        if encoding == LATIN1_ENCODING or encoding == UTF_8_ENCODING:
-            (d, t) = data.split(b"\x00", 1)
-        elif encoding == UTF_16_ENCODING or encoding == UTF_16BE_ENCODING:
-            # Two null bytes split, but since each utf16 char is also two
-            # bytes we need to ensure we found a proper boundary.
-            (d, t) = data.split(b"\x00\x00", 1)
-            if (len(d) % 2) != 0:
-                (d, t) = data.split(b"\x00\x00\x00", 1)
-                d += b"\x00"
-        else:
-            raise NotImplementedError(f"Unknown ID3 encoding: {encoding}")
-    except ValueError as ex:
-        log.warning(f"Invalid 2-tuple ID3 frame data: {ex}")
-        d, t = data, b""
+    d_end, t_start = _splitUnicodeOffsets(data, encoding)
+    return data[:d_end], data[t_start:]
+
+
+def _splitUnicodeOffsets(data, encoding, start=0):
+    """The offset based version of ``splitUnicode``, so that the NULL separated
+    fields of ``data`` (beginning at ``start``) can be sliced without copying
+    the remainder of the buffer. Returns the end offset of the text and the
+    start offset of the data following the delimiter."""
+    if encoding == LATIN1_ENCODING or encoding == UTF_8_ENCODING:
+        i = data.find(b"\x00", start)
+        if i != -1:
+            return i, i + 1
+    elif encoding == UTF_16_ENCODING or encoding == UTF_16BE_ENCODING:
+        # Two null bytes split, but since each utf16 char is also two
+        # bytes we need to ensure we found a proper boundary.
+        i = data.find(b"\x00\x00", start)
+        if i != -1 and (i - start) % 2 == 0:
+            return i, i + 2
+        elif i != -1:
+            i = data.find(b"\x00\x00\x00", start)
+            if i != -1:
+                return i + 1, i + 3
+    else:
+        raise NotImplementedError(f"Unknown ID3 encoding: {encoding}")
+
+    log.warning("Invalid 2-tuple ID3 frame data: delimiter not found")
+    return len(data), len(data)
+
 
-    return d, t
+def _findNull(data, start=0):
+    """Returns the offset of the first NULL byte in ``data`` at or after
+    ``start``, or ``len(data)`` when there is none."""
+    i = data.find(b"\x00", start)
+    return i if i != -1 else len(data)
 
 
 def id3EncodingToString(encoding):
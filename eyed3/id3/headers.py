@@ -2,8 +2,8 @@ import math
 import logging
 import binascii
 from ..utils import requireBytes
-from ..utils.binfuncs import (bin2dec, bytes2bin, bin2bytes,
-                              bin2synchsafe, dec2bin)
+from ..utils.intcodec import (bytes2int, int2bytes, synchsafe2int,
+                              int2synchsafe, bytes2bits, bits2bytes)
 from .. import core
 from . import ID3_DEFAULT_VERSION, isValidVersion, normalizeVersion
 
@@ -86,10 +86,11 @@ class TagHeader(object):
         data = f.read(1)
         if not data:
             return False
-        (self.unsync,
-         self.extended,
-         self.experimental,
-         self.footer) = (bool(b) for b in bytes2bin(data)[0:4])
+        flags = data[0]
+        self.unsync = bool(flags & 0x80)
+        self.extended = bool(flags & 0x40)
+        self.experimental = bool(flags & 0x20)
+        self.footer = bool(flags & 0x10)
         log.debug("TagHeader [flags]: unsync(%d) extended(%d) "
                   "experimental(%d) footer(%d)" % (self.unsync, self.extended,
                                                    self.experimental,
@@ -104,7 +105,7 @@ class TagHeader(object):
         log.debug("TagHeader [size string]: 0x%02x%02x%02x%02x" %
                   (tag_size_bytes[0], tag_size_bytes[1],
                    tag_size_bytes[2], tag_size_bytes[3]))
-        self.tag_size = bin2dec(bytes2bin(tag_size_bytes, 7))
+        self.tag_size = synchsafe2int(tag_size_bytes)
         log.debug("TagHeader [size]: %d (0x%x)" % (self.tag_size,
                                                    self.tag_size))
 
@@ -114,23 +115,30 @@ class TagHeader(object):
         if tag_len is not None:
             self.tag_size = tag_len
 
-        if self.unsync:
-            raise NotImplementedError("eyeD3 does not write (only reads) "
-                                      "unsync'd data")
-
         data = b"ID3"
         data += bytes([self.minor_version]) + bytes([self.rev_version])
-        data += bin2bytes([int(self.unsync),
-                           int(self.extended),
-                           int(self.experimental),
-                           int(self.footer),
-                           0, 0, 0, 0])
+        data += bytes([(0x80 if self.unsync else 0) |
+                       (0x40 if self.extended else 0) |
+                       (0x20 if self.experimental else 0) |
+                       (0x10 if self.footer else 0)])
         log.debug("Setting tag size to %d" % self.tag_size)
-        data += bin2bytes(bin2synchsafe(dec2bin(self.tag_size, 32)))
+        data += int2synchsafe(self.tag_size)
         log.debug("TagHeader rendered %d bytes" % len(data))
         return data
 
 
+def _crc32(data, padding):
+    """CRC-32 of ``data`` followed by ``padding`` zero bytes, computed without
+    allocating the padding."""
+    crc = binascii.crc32(data)
+    zeros = bytes(min(padding, 64 * 1024))
+    while padding > 0:
+        n = min(padding, len(zeros))
+        crc = binascii.crc32(zeros[:n] if n < len(zeros) else zeros, crc)
+        padding -= n
+    return crc
+
+
 class ExtendedTagHeader(object):
     RESTRICT_TAG_SZ_LARGE = 0x00
     RESTRICT_TAG_SZ_MED = 0x01
@@ -326,8 +334,7 @@ class ExtendedTagHeader(object):
                 data += b"\x05"
                 # XXX: Using the absolute value of the CRC. The spec is unclear
                 # about the type of this data.
-                self.crc = int(math.fabs(binascii.crc32(frame_data +
-                                                        (b"\x00" * padding))))
+                self.crc = int(math.fabs(_crc32(frame_data, padding)))
                 crc_data = self._syncsafeCRC()
                 if len(crc_data) < 5:
                     # pad if necessary
@@ -340,33 +347,29 @@ class ExtendedTagHeader(object):
             log.debug("Rendered extended header data (%d bytes)" % len(data))
 
             # Extended header size.
-            size = bin2bytes(bin2synchsafe(dec2bin(len(data) + 6, 32)))
+            size = int2synchsafe(len(data) + 6)
             assert(len(size) == 4)
 
-            data = size + b"\x01" + bin2bytes(dec2bin(self._flags)) + data
+            data = size + b"\x01" + bytes([self._flags]) + data
             log.debug("Rendered extended header of size %d" % len(data))
         else:
             # Version 2.3
             size = 6  # Note, the 4 size bytes are not included in the size
             # Extended flags.
-            f = [0] * 16
+            flags = 0
             crc = None
             if self.crc_bit:
-                f[0] = 1
+                flags |= 0x8000
                 # XXX: Using the absolute value of the CRC.  The spec is unclear
                 # about the type of this value.
-                self.crc = int(math.fabs(binascii.crc32(frame_data +
-                                                        (b"\x00" * padding))))
-                crc = bin2bytes(dec2bin(self.crc))
-                assert(len(crc) == 4)
+                self.crc = int(math.fabs(_crc32(frame_data, padding)))
+                crc = int2bytes(self.crc, 4)
                 size += 4
-            flags = bin2bytes(f)
-            assert(len(flags) == 2)
+            flags = int2bytes(flags, 2)
             # Extended header size.
-            size = bin2bytes(dec2bin(size, 32))
-            assert(len(size) == 4)
+            size = int2bytes(size, 4)
             # Padding size
-            padding_size = bin2bytes(dec2bin(padding, 32))
+            padding_size = int2bytes(padding, 4)
 
             data = size + flags + padding_size
             if crc:
@@ -391,7 +394,7 @@ class ExtendedTagHeader(object):
         data = fp.read(4)
         if version[1] == 4:
             # sync-safe
-            sz = bin2dec(bytes2bin(data, 7))
+            sz = synchsafe2int(data)
             self.size = sz
             log.debug("Extended header size (includes the 4 size bytes): %d" %
                       sz)
@@ -417,7 +420,7 @@ class ExtendedTagHeader(object):
                 offset += 1
                 crc_data = data[offset:offset + 5]
                 # This is sync-safe.
-                self.crc = bin2dec(bytes2bin(crc_data, 7))
+                self.crc = synchsafe2int(crc_data)
                 log.debug("Extended header CRC: %d" % self.crc)
                 offset += 5
             if self.restrictions_bit:
@@ -428,7 +431,7 @@ class ExtendedTagHeader(object):
                 offset += 1
         else:
             # v2.3 is totally different... *sigh*
-            sz = bin2dec(bytes2bin(data))
+            sz = bytes2int(data)
             self.size = sz
             log.debug("Extended header size (not including 4 size bytes): %d" %
                       sz)
@@ -436,13 +439,13 @@ class ExtendedTagHeader(object):
             # Read the padding size, but it'll be computed during the parse.
             ps = fp.read(4)
             log.debug("Extended header says there is %d bytes of padding" %
-                      bin2dec(bytes2bin(ps)))
+                      bytes2int(ps))
             # Make this look like a v2.4 mask.
             self._flags = tmpFlags[0] >> 2
             if self.crc_bit:
                 log.debug("Extended header has CRC bit set")
                 crc_data = fp.read(4)
-                self.crc = bin2dec(bytes2bin(crc_data))
+                self.crc = bytes2int(crc_data)
                 log.debug("Extended header CRC: %d" % self.crc)
 
 
@@ -604,22 +607,19 @@ class FrameHeader:
         self.data_size = data_size
 
         if self.minor_version == 3:
-            data += bin2bytes(dec2bin(data_size, 32))
+            data += int2bytes(data_size, 4)
         else:
-            data += bin2bytes(bin2synchsafe(dec2bin(data_size, 32)))
+            data += int2synchsafe(data_size)
 
-        if self.unsync:
-            raise NotImplementedError("eyeD3 does not write (only reads) "
-                                      "unsync'd data")
-        data += bin2bytes(self._flags)
+        data += bits2bytes(self._flags)
 
         return data
 
     @staticmethod
-    def _parse2_2(f, version):
+    def _parse2_2(buf, offset, version):
         from .frames import map2_2FrameId
         from .frames import FrameException
-        frame_id_22 = f.read(3)
+        frame_id_22 = bytes(buf[offset:offset + 3])
         frame_id = map2_2FrameId(frame_id_22)
         if FrameHeader._isValidFrameId(frame_id):
             log.debug("FrameHeader [id]: %s (0x%x%x%x)" %
@@ -627,13 +627,13 @@ class FrameHeader:
             frame_header = FrameHeader(frame_id, version)
             # data_size corresponds to the size of the data segment after
             # encryption, compression, and unsynchronization.
-            sz = f.read(3)
-            frame_header.data_size = bin2dec(bytes2bin(sz, 8))
+            sz = buf[offset + 3:offset + 6]
+            frame_header.data_size = bytes2int(sz)
             log.debug("FrameHeader [data size]: %d (0x%X)" %
                       (frame_header.data_size, frame_header.data_size))
             return frame_header
         elif frame_id == b'\x00\x00\x00':
-            log.debug("FrameHeader: Null frame id found at byte %d" % f.tell())
+            log.debug("FrameHeader: Null frame id found at byte %d" % offset)
         else:
             core.parseError(FrameException("FrameHeader: Illegal Frame ID: %s" %
                                            frame_id))
@@ -642,33 +642,41 @@ class FrameHeader:
 
     @staticmethod
     def parse(f, version):
-        from .frames import FrameException
         log.debug("FrameHeader [start byte]: %d (0x%X)" % (f.tell(),
                                                            f.tell()))
+        header_size = 6 if version[1] == 2 else 10
+        return FrameHeader.parseBuffer(f.read(header_size), 0, version)
+
+    @staticmethod
+    def parseBuffer(buf, offset, version):
+        """Parse a frame header from the bytes-like object ``buf`` (typically a
+        ``memoryview`` of the entire tag) starting at ``offset``. Returns
+        ``None`` if no valid frame header is found."""
+        from .frames import FrameException
         major_version, minor_version = version[:2]
         if minor_version == 2:
-            return FrameHeader._parse2_2(f, version)
+            return FrameHeader._parse2_2(buf, offset, version)
 
-        frame_id = f.read(4)
+        frame_id = bytes(buf[offset:offset + 4])
         if FrameHeader._isValidFrameId(frame_id):
             log.debug("FrameHeader [id]: %s (0x%x%x%x%x)" %
                       (frame_id, frame_id[0], frame_id[1], frame_id[2], frame_id[3]))
             frame_header = FrameHeader(frame_id, version)
             # data_size corresponds to the size of the data segment after
             # encryption, compression, and unsynchronization.
-            sz = f.read(4)
+            sz = buf[offset + 4:offset + 8]
             # In ID3 v2.4 this value became a synch-safe integer, meaning only
             # the low 7 bits are used per byte.
             if minor_version == 3:
-                frame_header.data_size = bin2dec(bytes2bin(sz, 8))
+                frame_header.data_size = bytes2int(sz)
             else:
-                frame_header.data_size = bin2dec(bytes2bin(sz, 7))
+                frame_header.data_size = synchsafe2int(sz)
             log.debug("FrameHeader [data size]: %d (0x%X)" %
                       (frame_header.data_size, frame_header.data_size))
 
             # Frame flags.
-            flags = f.read(2)
-            frame_header._flags = bytes2bin(flags)
+            flags = buf[offset + 8:offset + 10]
+            frame_header._flags = bytes2bits(flags)
             if log.getEffectiveLevel() <= logging.DEBUG:
                 log.debug("FrameHeader [flags]: ta(%d) fa(%d) ro(%d) co(%d) "
                           "en(%d) gr(%d) un(%d) dl(%d)" %
@@ -684,7 +692,7 @@ class FrameHeader:
 
             return frame_header
         elif frame_id == b'\x00' * 4:
-            log.debug("FrameHeader: Null frame id found at byte %d" % f.tell())
+            log.debug("FrameHeader: Null frame id found at byte %d" % offset)
         else:
             core.parseError(FrameException("FrameHeader: Illegal Frame ID: %s" %
                                            frame_id))
@@ -0,0 +1,145 @@
+"""Padding policies, choosing how much padding is written with an ID3 v2 tag.
+
+Padding is only chosen when the tag is written to a new file, or it no longer
+fits the current tag (or exceeds ``max_padding``) and the audio has to be
+moved anyway; otherwise the existing padding is used. More padding means more
+future edits can be written in place. Policies are selected by name with
+:func:`getPaddingPolicy`, e.g. ``"block"`` or ``"percent:25"``.
+"""
+import json
+import math
+import collections
+
+from .. import Error
+from ..utils.log import getLogger
+
+log = getLogger(__name__)
+
+# The padding used by the ``fixed`` policy, which is the default.
+DEFAULT_PADDING = 256
+
+
+class PaddingPolicy:
+    """Base class for padding policies."""
+    NAME = None
+
+    def padding(self, tag_size, curr_tag_size):
+        """Return the padding to use for a tag of ``tag_size`` bytes (without
+        padding) replacing a tag of ``curr_tag_size`` bytes (including padding,
+        0 if none)."""
+        raise NotImplementedError()
+
+    def record(self, tag_size, prev_tag_size):
+        """Called when a tag of ``tag_size`` bytes replaces a tag of
+        ``prev_tag_size`` bytes, neither including padding."""
+        pass
+
+
+class FixedPadding(PaddingPolicy):
+    """A fixed amount of padding."""
+    NAME = "fixed"
+
+    def __init__(self, size=DEFAULT_PADDING):
+        self.size = int(size)
+        if self.size < 0:
+            raise ValueError(f"Invalid padding size: {size}")
+
+    def padding(self, tag_size, curr_tag_size):
+        return self.size
+
+
+class BlockPadding(PaddingPolicy):
+    """Pads the tag to a multiple of ``block_size`` bytes, with at least
+    ``min_padding`` bytes of padding. The audio then begins on a file system
+    block boundary which, beyond leaving room for edits, allows copy-on-write
+    file systems to clone the audio blocks when a tag is rewritten."""
+    NAME = "block"
+
+    def __init__(self, block_size=4096, min_padding=DEFAULT_PADDING):
+        self.block_size = int(block_size)
+        self.min_padding = min_padding
+        if self.block_size <= 0:
+            raise ValueError(f"Invalid block size: {block_size}")
+
+    def padding(self, tag_size, curr_tag_size):
+        size = tag_size + self.min_padding
+        return (-size % self.block_size) + self.min_padding
+
+
+class PercentPadding(PaddingPolicy):
+    """Padding of ``percent`` of the tag size, with at least ``min_padding``
+    bytes."""
+    NAME = "percent"
+
+    def __init__(self, percent=10, min_padding=DEFAULT_PADDING):
+        self.percent = float(percent)
+        self.min_padding = min_padding
+        if not math.isfinite(self.percent) or self.percent < 0:
+            raise ValueError(f"Invalid percent: {percent}")
+
+    def padding(self, tag_size, curr_tag_size):
+        return max(int(tag_size * self.percent / 100), self.min_padding)
+
+
+class HistoryPadding(PaddingPolicy):
+    """Padding for the tag growth seen in previous saves: the ``percentile``
+    of the recorded growths (so, for example, 90% of past edits would have
+    fit), with at least ``min_padding`` and no more than ``max_padding``
+    bytes. When ``path`` is given the history is loaded from, and saved to
+    (see :meth:`save`), that JSON file."""
+    NAME = "history"
+    MAX_HISTORY = 10000
+
+    def __init__(self, path=None, percentile=90, min_padding=DEFAULT_PADDING,
+                 max_padding=1024 * 1024):
+        self.path = path
+        self.percentile = float(percentile)
+        self.min_padding = min_padding
+        self.max_padding = max_padding
+        self.growths = collections.deque(maxlen=self.MAX_HISTORY)
+
+        if path:
+            try:
+                with open(path) as fp:
+                    self.growths.extend(int(n) for n in json.load(fp))
+            except FileNotFoundError:
+                pass
+            except (ValueError, TypeError) as ex:
+                log.warning(f"Ignoring invalid padding history {path}: {ex}")
+
+    def padding(self, tag_size, curr_tag_size):
+        if not self.growths:
+            return self.min_padding
+
+        growths = sorted(self.growths)
+        i = min(int(len(growths) * self.percentile / 100), len(growths) - 1)
+        return min(max(growths[i], self.min_padding), self.max_padding)
+
+    def record(self, tag_size, prev_tag_size):
+        self.growths.append(max(tag_size - prev_tag_size, 0))
+
+    def save(self):
+        """Write the history to ``path``."""
+        if self.path:
+            with open(self.path, "w") as fp:
+                json.dump(list(self.growths), fp)
+
+
+PADDING_POLICIES = {p.NAME: p for p in (FixedPadding, BlockPadding, PercentPadding,
+                                        HistoryPadding)}
+
+
+def getPaddingPolicy(spec):
+    """Return a policy for ``spec``, a policy name optionally followed by a
+    colon and the policy's first argument; for example ``fixed:1024``,
+    ``block:8192``, ``percent:25``, or ``history:/path/to/history.json``. An
+    ``eyed3.Error`` is raised for invalid names and arguments."""
+    name, _, arg = spec.partition(":")
+    if name not in PADDING_POLICIES:
+        raise Error(f"Invalid padding policy: {name} (valid policies: "
+                    f"{', '.join(PADDING_POLICIES)})")
+
+    try:
+        return PADDING_POLICIES[name](arg) if arg else PADDING_POLICIES[name]()
+    except ValueError as ex:
+        raise Error(f"Invalid padding policy argument '{arg}': {ex}") from ex
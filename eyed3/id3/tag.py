@@ -1,11 +1,13 @@
+import io
 import os
+import contextlib
+import dataclasses
 import codecs
 import string
 import shutil
-import tempfile
 import textwrap
 
-from ..utils import requireUnicode, chunkCopy, datePicker, b
+from ..utils import requireUnicode, datePicker, b
 from .. import core
 from ..core import TXXX_ALBUM_TYPE, TXXX_ARTIST_ORIGIN, ALBUM_TYPE_IDS, ArtistOrigin
 from .. import Error
@@ -15,14 +17,20 @@ from . import DEFAULT_LANG
 from . import Genre
 from . import frames
 from .headers import TagHeader, ExtendedTagHeader
+from .padding import DEFAULT_PADDING, FixedPadding
+from ..utils.fileio import (replaceHead, writeHead, WriteBuffer, WRITE_IN_PLACE, WRITE_SHIFT,
+                            WRITE_REWRITE)
 
 from ..utils.log import getLogger
+from ..utils import scancache
 log = getLogger(__name__)
 
 ID3_V1_COMMENT_DESC = "ID3v1.x Comment"
 ID3_V1_MAX_TEXTLEN = 30
 ID3_V1_STRIP_CHARS = string.whitespace.encode("latin1") + b"\x00"
-DEFAULT_PADDING = 256
+
+
+_DEFAULT_PADDING_POLICY = FixedPadding(DEFAULT_PADDING)
 
 
 class TagException(Error):
@@ -61,6 +69,9 @@ class Tag(core.Tag):
         # Contains the tag's frames. ID3v1 fields are read and converted
         #  the the corresponding v2 frame.
         self.frame_set = frames.FrameSet()
+        self._initAccessors()
+
+    def _initAccessors(self):
         self._comments = CommentsAccessor(self.frame_set)
         self._images = ImagesAccessor(self.frame_set)
         self._lyrics = LyricsAccessor(self.frame_set)
@@ -73,7 +84,21 @@ class Tag(core.Tag):
         self._tocs = TocAccessor(self.frame_set)
         self._popularities = PopularitiesAccessor(self.frame_set)
 
-    def parse(self, fileobj, version=ID3_ANY_VERSION):
+    def __getstate__(self):
+        # The accessors hold functions that can not be pickled, they are recreated.
+        return {k: v for k, v in self.__dict__.items()
+                if not isinstance(v, AccessorBase)}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._initAccessors()
+
+    def parse(self, fileobj, version=ID3_ANY_VERSION, lazy=False,
+              stat_result=None):
+        """Parse a tag from ``fileobj``, a file object or path. When ``lazy`` is
+        ``True`` v2 frames are not decoded until they are accessed, see
+        :meth:`eyed3.id3.frames.FrameSet.parse`. An ``os.stat_result`` for the
+        file may be passed as ``stat_result`` to avoid stat'ing it again."""
         self.clear()
         version = version or ID3_ANY_VERSION
 
@@ -88,14 +113,14 @@ class Tag(core.Tag):
             else:
                 raise ValueError(f"Invalid type: {type(fileobj)}")
 
-        self.file_info = FileInfo(filename)
+        self.file_info = FileInfo(filename, stat_result=stat_result)
 
         try:
             tag_found = False
             padding = 0
             # The & is for supporting the "meta" versions, any, etc.
             if version[0] & 2:
-                tag_found, padding = self._loadV2Tag(fileobj)
+                tag_found, padding = self._loadV2Tag(fileobj, lazy=lazy)
 
             if not tag_found and version[0] & 1:
                 tag_found, padding = self._loadV1Tag(fileobj)
@@ -114,7 +139,7 @@ class Tag(core.Tag):
 
         return tag_found
 
-    def _loadV2Tag(self, fp):
+    def _loadV2Tag(self, fp, lazy=False):
         """Returns (tag_found, padding_len)"""
         fp.seek(0)
 
@@ -128,7 +153,7 @@ class Tag(core.Tag):
 
         # Header is definitely there so at least one frame *must* follow.
         padding = self.frame_set.parse(fp, self.header,
-                                       self.extended_header)
+                                       self.extended_header, lazy=lazy)
 
         log.debug("Tag contains %d bytes of padding." % padding)
         return True, padding
@@ -882,25 +907,64 @@ class Tag(core.Tag):
             raise RuntimeError("Tag is set read only.")
 
     def save(self, filename=None, version=None, encoding=None, backup=False,
-             preserve_file_time=False, max_padding=None):
+             preserve_file_time=False, max_padding=None, unsync=False,
+             write_strategy=None, journal=None, dry_run=False, padding_policy=None):
         """Save the tag. If ``filename`` is not give the value from the
         ``file_info`` member is used, or a ``TagException`` is raised. The
         ``version`` argument can be used to select an ID3 version other than
         the version read. ``Select text encoding with ``encoding`` or use
         the existing (or default) encoding. If ``backup`` is True the original
         file is preserved; likewise if ``preserve_file_time`` is True the
-        file´s modification/access times are not updated.
+        file´s modification/access times are not updated. When ``unsync`` is
+        True ID3 v2 tags are written using the unsynchronization scheme, for
+        v2.3 the tag as a whole and per frame for v2.4. ``write_strategy`` selects
+        how a v2 tag is written to an existing file (see
+        :func:`eyed3.utils.fileio.replaceHead`), by default the tag is written in
+        place when it fits the current tag and the audio is shifted in place when
+        it does not; use ``eyed3.utils.fileio.WRITE_REWRITE`` for an atomic
+        replace of the file (``ValueError`` is raised for files with multiple
+        hard links). The strategy used is returned when a v2 tag is
+        written to an existing file, otherwise ``None``. When a
+        :class:`eyed3.utils.journal.Journal` is given as ``journal`` the write
+        is journaled, and the tag is written in place or the file atomically
+        replaced, regardless of ``write_strategy`` (see
+        :meth:`eyed3.utils.journal.Journal.write` for files with multiple hard
+        links).
+
+        If ``dry_run`` is True the tag is rendered but nothing is written, and
+        a :class:`WritePlan` describing the write is returned.
+
+        The padding written when a v2 tag does not fit the current tag (or the
+        padding exceeds ``max_padding``) is chosen by ``padding_policy``, a
+        :class:`eyed3.id3.padding.PaddingPolicy`; ``DEFAULT_PADDING`` bytes by
+        default.
         """
         self._raiseIfReadonly()
 
         if not (filename or self.file_info):
             raise TagException("No file")
-        elif filename:
-            self.file_info = FileInfo(filename)
+        elif not filename and self.file_info.stream:
+            raise TagException(f"The tag was not loaded from a file, a file name is required "
+                               f"to save it: {self.file_info.name}")
 
         version = version if version else self.version
         if version == ID3_V2_2:
             raise NotImplementedError("Unable to write ID3 v2.2")
+
+        if dry_run:
+            file_info = FileInfo(filename) if filename else self.file_info
+            if version[0] == 1:
+                return self._planV1Tag(file_info, version)
+            # Rendered as a save would, version conversion included, then restored.
+            with self._preservedState():
+                self.version = version
+                plan, _ = self._planV2Tag(file_info, version, encoding, max_padding,
+                                          unsync=unsync, write_strategy=write_strategy,
+                                          journal=journal, padding_policy=padding_policy)
+            return plan
+
+        if filename:
+            self.file_info = FileInfo(filename)
         self.version = version
 
         if backup and os.path.isfile(self.file_info.name):
@@ -911,10 +975,13 @@ class Tag(core.Tag):
                 i += 1
             shutil.copyfile(self.file_info.name, backup_name)
 
+        strategy = None
         if version[0] == 1:
             self._saveV1Tag(version)
         elif version[0] == 2:
-            self._saveV2Tag(version, encoding, max_padding)
+            strategy = self._saveV2Tag(version, encoding, max_padding, unsync=unsync,
+                                       write_strategy=write_strategy, journal=journal,
+                                       padding_policy=padding_policy)
         else:
             assert not "Version bug: %s" % str(version)
 
@@ -923,6 +990,26 @@ class Tag(core.Tag):
             self.file_info.touch((self.file_info.atime, self.file_info.mtime))
         else:
             self.file_info.initStatTimes()
+        # With preserved file times the cached file would otherwise look unchanged.
+        scancache.invalidate(self.file_info.name)
+
+        return strategy
+
+    @contextlib.contextmanager
+    def _preservedState(self):
+        """Restore the tag headers and frames, which rendering modifies, on
+        exit."""
+        frame_lists = {fid: list(flist) for fid, flist in self.frame_set.copy().items()}
+        frame_states = [(f, dict(vars(f))) for flist in frame_lists.values() for f in flist]
+        header_states = [(h, dict(vars(h))) for h in (self.header, self.extended_header)]
+        try:
+            yield
+        finally:
+            for obj, state in frame_states + header_states:
+                vars(obj).clear()
+                vars(obj).update(state)
+            self.frame_set.clear()
+            dict.update(self.frame_set, frame_lists)
 
     def _saveV1Tag(self, version):
         self._raiseIfReadonly()
@@ -1022,7 +1109,8 @@ class Tag(core.Tag):
 
         return std_frames, non_std_frames
 
-    def _render(self, version, curr_tag_size, max_padding_size):
+    def _render(self, version, curr_tag_size, max_padding_size, unsync=False,
+                padding_policy=None):
         converted_frames = []
         std_frames, non_std_frames = self._checkForConversions(version)
         if non_std_frames:
@@ -1030,11 +1118,12 @@ class Tag(core.Tag):
                                                    version)
 
         # Render all frames first so the data size is known for the tag header.
-        frame_data = b""
+        frame_parts = []
         for f in std_frames + converted_frames:
             frame_header = frames.FrameHeader(f.id, version)
             if f.header:
                 frame_header.copyFlags(f.header)
+            frame_header.unsync = unsync and version[:2] == ID3_V2_4[:2]
             f.header = frame_header
 
             log.debug(f"Rendering frame: {frame_header.id}")
@@ -1047,12 +1136,20 @@ class Tag(core.Tag):
                 else:
                     raise
             log.debug(f"Rendered {len(raw_frame)} bytes")
-            frame_data += raw_frame
+            frame_parts.append(raw_frame)
+        frame_data = b"".join(frame_parts)
+        del frame_parts
 
         log.debug("Rendered %d total frame bytes" % len(frame_data))
 
-        # eyeD3 never writes unsync'd data
-        self.header.unsync = False
+        self.header.unsync = bool(unsync)
+        # The extended header CRC is computed on the frame data prior to
+        # unsynchronization.
+        crc_frame_data = frame_data
+        if unsync and version[:2] != ID3_V2_4[:2]:
+            # v2.3 unsync's all frame data at once, v2.4 frames were done above.
+            frame_data = frames.unsyncData(frame_data)
+            log.debug("Unsync'd frame data to %d bytes" % len(frame_data))
 
         pending_size = TagHeader.SIZE + len(frame_data)
         if self.header.extended:
@@ -1062,14 +1159,16 @@ class Tag(core.Tag):
                                                               b"\x00", 0)
             pending_size += len(tmp_ext_header_data)
 
+        padding_policy = padding_policy or _DEFAULT_PADDING_POLICY
         if pending_size > curr_tag_size:
             # current tag (minus padding) larger than the current (plus padding)
-            padding_size = DEFAULT_PADDING
+            padding_size = padding_policy.padding(pending_size, curr_tag_size)
             rewrite_required = True
         else:
             padding_size = curr_tag_size - pending_size
             if max_padding_size is not None and padding_size > max_padding_size:
-                padding_size = min(DEFAULT_PADDING, max_padding_size)
+                padding_size = min(padding_policy.padding(pending_size, curr_tag_size),
+                                   max_padding_size)
                 rewrite_required = True
             else:
                 rewrite_required = False
@@ -1082,7 +1181,7 @@ class Tag(core.Tag):
         if self.header.extended:
             log.debug("Rendering extended header")
             ext_header_data += self.extended_header.render(self.header.version,
-                                                           frame_data,
+                                                           crc_frame_data,
                                                            padding_size)
 
         # Render the tag header.
@@ -1093,79 +1192,131 @@ class Tag(core.Tag):
         )
         header_data = self.header.render(data_size)
 
-        # Assemble the entire tag.
-        tag_data = (header_data +
-                    ext_header_data +
-                    frame_data)
+        # Assemble the entire tag, the padding is left for the writer.
+        tag_data = WriteBuffer([header_data, ext_header_data, frame_data])
         assert len(tag_data) == (total_size - padding_size)
-        return rewrite_required, tag_data, b"\x00" * padding_size
-
-    def _saveV2Tag(self, version, encoding, max_padding):
-        self._raiseIfReadonly()
+        return rewrite_required, tag_data, padding_size
 
+    def _planV2Tag(self, file_info, version, encoding, max_padding, unsync=False,
+                   write_strategy=None, journal=None, padding_policy=None):
+        """Render the tag for saving to ``file_info.name`` and return a
+        :class:`WritePlan` and the rendered tag data (without padding)."""
         assert(version[0] == 2 and version[1] != 2)
 
         log.debug("Rendering tag version: %s" % versionToString(version))
 
-        file_exists = os.path.exists(self.file_info.name)
-
         if encoding:
             # Any invalid encoding is going to get coerced to a valid value
             # when the frame is rendered.
             for f in self.frame_set.getAllFrames():
                 f.encoding = frames.stringToEncoding(encoding)
 
-        curr_tag_size = 0
-
-        if file_exists:
-            # We may be converting from 1.x to 2.x so we need to find any
-            # current v2.x tag otherwise we're gonna hork the file.
-            # This also resets all offsets, state, etc. and makes me feel safe.
-            tmp_tag = Tag()
-            if tmp_tag.parse(self.file_info.name, ID3_V2):
-                log.debug("Found current v2.x tag:")
-                curr_tag_size = tmp_tag.file_info.tag_size
-                log.debug("Current tag size: %d" % curr_tag_size)
-
-            rewrite_required, tag_data, padding = self._render(version,
-                                                               curr_tag_size,
-                                                               max_padding)
-            log.debug("Writing %d bytes of tag data and %d bytes of "
-                      "padding" % (len(tag_data), len(padding)))
-            if rewrite_required:
-                # Open tmp file
-                with tempfile.NamedTemporaryFile("wb", delete=False) \
-                        as tmp_file:
-                    tmp_file.write(tag_data + padding)
-
-                    # Copy audio data in chunks
-                    with open(self.file_info.name, "rb") as tag_file:
-                        if curr_tag_size != 0:
-                            seek_point = curr_tag_size
-                        else:
-                            seek_point = 0
-                        log.debug("Seeking to beginning of audio data, "
-                                  "byte %d (%x)" % (seek_point, seek_point))
-                        tag_file.seek(seek_point)
-                        chunkCopy(tag_file, tmp_file)
-
-                    tmp_file.flush()
-
-                # Move tmp to orig.
-                shutil.copyfile(tmp_file.name, self.file_info.name)
-                os.unlink(tmp_file.name)
+        if not os.path.exists(file_info.name):
+            _, tag_data, padding_size = self._render(version, 0, None,
+                                                     unsync=unsync,
+                                                     padding_policy=padding_policy)
+            return WritePlan(file_info.name, version, None, 0, len(tag_data) + padding_size,
+                             padding_size, 0, False), tag_data
+
+        # We may be converting from 1.x to 2.x so we need to find any
+        # current v2.x tag otherwise we're gonna hork the file.
+        curr_tag_size = self._currentV2TagSize(file_info)
+        log.debug("Current tag size: %d" % curr_tag_size)
+
+        rewrite_required, tag_data, padding_size = self._render(version,
+                                                                curr_tag_size,
+                                                                max_padding,
+                                                                unsync=unsync,
+                                                                padding_policy=padding_policy)
+        tag_size = len(tag_data) + padding_size
+        if journal is not None:
+            strategy = WRITE_IN_PLACE if tag_size == curr_tag_size else WRITE_REWRITE
+        elif write_strategy is None:
+            strategy = WRITE_IN_PLACE if tag_size == curr_tag_size else WRITE_SHIFT
+        elif write_strategy == WRITE_IN_PLACE and tag_size != curr_tag_size:
+            raise ValueError(f"Unable to write {tag_size} bytes in place of {curr_tag_size}")
+        else:
+            strategy = write_strategy
+
+        plan = WritePlan(file_info.name, version, strategy, curr_tag_size, tag_size,
+                         padding_size, os.path.getsize(file_info.name), rewrite_required)
+        return plan, tag_data
 
-            else:
-                with open(self.file_info.name, "r+b") as tag_file:
-                    tag_file.write(tag_data + padding)
+    def _saveV2Tag(self, version, encoding, max_padding, unsync=False, write_strategy=None,
+                   journal=None, padding_policy=None):
+        self._raiseIfReadonly()
 
-        else:
-            _, tag_data, padding = self._render(version, 0, None)
+        plan, tag_data = self._planV2Tag(self.file_info, version, encoding, max_padding,
+                                         unsync=unsync, write_strategy=write_strategy,
+                                         journal=journal, padding_policy=padding_policy)
+        log.debug("Writing %d bytes of tag data and %d bytes of "
+                  "padding" % (len(tag_data), plan.padding_size))
+
+        if plan.strategy is None:
             with open(self.file_info.name, "wb") as tag_file:
-                tag_file.write(tag_data + padding)
+                tag_file_data = WriteBuffer(tag_data)
+                tag_file_data.appendZeros(plan.padding_size)
+                tag_file_data.writeTo(tag_file)
+        else:
+            if plan.rewrite_required:
+                log.debug("The current tag size can not be reused, moving audio data")
+            if journal is not None:
+                journal.write(self.file_info.name, tag_data, plan.curr_tag_size,
+                              padding_size=plan.padding_size)
+            else:
+                replaceHead(self.file_info.name, tag_data, plan.curr_tag_size,
+                            padding_size=plan.padding_size, strategy=plan.strategy)
+            log.debug(f"Tag written using the {plan.strategy} strategy")
+
+        if (padding_policy and plan.curr_tag_size and
+                self.file_info.tag_size == plan.curr_tag_size):
+            padding_policy.record(plan.tag_size - plan.padding_size,
+                                  plan.curr_tag_size - self.file_info.tag_padding_size)
 
         log.debug("Tag write complete. Updating FileInfo state.")
-        self.file_info.tag_size = len(tag_data) + len(padding)
+        self.file_info.tag_size = plan.tag_size
+        self.file_info.tag_padding_size = plan.padding_size
+        return plan.strategy
+
+    def _planV1Tag(self, file_info, version):
+        file_size, curr_tag_size = 0, 0
+        if os.path.exists(file_info.name):
+            file_size = os.path.getsize(file_info.name)
+            if file_size >= 128:
+                with open(file_info.name, "rb") as tag_file:
+                    tag_file.seek(-128, 2)
+                    if tag_file.read(3) == b"TAG":
+                        curr_tag_size = 128
+        return WritePlan(file_info.name, version, WRITE_IN_PLACE, curr_tag_size, 128, 0,
+                         file_size, False)
+
+    def _currentV2TagSize(self, file_info):
+        """Return the size of the v2 tag in ``file_info.name``, 0 if there is
+        none. When the file is unchanged since it was parsed (see
+        :meth:`FileInfo.isCurrent`) only the tag header is read to confirm
+        ``file_info.tag_size``, otherwise the tag is parsed again."""
+        if file_info.isCurrent():
+            with open(file_info.name, "rb") as tag_file:
+                header_data = tag_file.read(TagHeader.SIZE)
+            header = TagHeader()
+            try:
+                found = header.parse(io.BytesIO(header_data))
+            except TagException as ex:
+                log.debug(f"Invalid tag header: {ex}")
+            else:
+                tag_size = (TagHeader.SIZE + header.tag_size) if found else 0
+                if tag_size == file_info.tag_size:
+                    return tag_size
+                log.debug(f"Tag size changed from {file_info.tag_size} to {tag_size}")
+        else:
+            log.debug(f"File changed since parsed: {file_info.name}")
+
+        # This also resets all offsets, state, etc. and makes me feel safe.
+        tmp_tag = Tag()
+        if tmp_tag.parse(file_info.name, ID3_V2):
+            log.debug("Found current v2.x tag")
+            return tmp_tag.file_info.tag_size
+        return 0
 
     def _convertFrames_v1(self, std_frames, convert_list, version) -> list:
         assert version[0] == 1
@@ -1355,44 +1506,72 @@ class Tag(core.Tag):
         return converted_frames
 
     @staticmethod
-    def remove(filename, version=ID3_ANY_VERSION, preserve_file_time=False):
-        tag = None
-        retval = False
+    def remove(filename, version=ID3_ANY_VERSION, preserve_file_time=False,
+               strategy=None):
+        """Remove the ID3 tags of ``version`` from ``filename``, returning True
+        if a tag was removed. Both tags are removed with one open of the file.
+        The v2 tag is removed per ``strategy``:
+
+        * ``None`` or ``eyed3.utils.fileio.WRITE_SHIFT``: the audio is moved
+          down in place and the file truncated.
+        * ``eyed3.utils.fileio.WRITE_REWRITE``: the file is atomically replaced
+          by a copy without the tag. ``ValueError`` is raised for files with
+          multiple hard links.
+        * ``eyed3.utils.fileio.WRITE_IN_PLACE``: the tag is overwritten by an
+          empty tag of the same size, all padding, so no audio is moved. The
+          file still has a v2 tag, without frames, afterwards.
+        """
+        if strategy not in (None, WRITE_SHIFT, WRITE_REWRITE, WRITE_IN_PLACE):
+            raise ValueError(f"Invalid write strategy: {strategy}")
+        if strategy == WRITE_REWRITE and os.stat(filename).st_nlink > 1:
+            # Checked before any tag is removed, replaceHead would raise after v1 was.
+            raise ValueError(f"Unable to rewrite {filename}, it has multiple hard links")
 
-        if version[0] & ID3_V1[0]:
-            # ID3 v1.x
-            tag = Tag()
-            with open(filename, "r+b") as tag_file:
-                found = tag.parse(tag_file, ID3_V1)
-                if found:
+        retval = False
+        file_info = None
+        rewrite_size = 0
+        with open(filename, "r+b") as tag_file:
+            if version[0] & ID3_V1[0]:
+                # ID3 v1.x
+                tag = Tag()
+                if tag.parse(tag_file, ID3_V1):
                     tag_file.seek(-128, 2)
                     log.debug("Removing ID3 v1.x Tag")
                     tag_file.truncate()
                     retval |= True
+                file_info = tag.file_info
 
-        if version[0] & ID3_V2[0]:
-            tag = Tag()
-            with open(filename, "rb") as tag_file:
-                found = tag.parse(tag_file, ID3_V2)
-                if found:
+            if version[0] & ID3_V2[0]:
+                tag = Tag()
+                if tag.parse(tag_file, ID3_V2, lazy=True):
                     log.debug("Removing ID3 %s tag" %
                               versionToString(tag.version))
-                    tag_file.seek(tag.file_info.tag_size)
-
-                    # Open tmp file
-                    with tempfile.NamedTemporaryFile("wb", delete=False) \
-                            as tmp_file:
-                        chunkCopy(tag_file, tmp_file)
-
-                    # Move tmp to orig
-                    shutil.copyfile(tmp_file.name, filename)
-                    os.unlink(tmp_file.name)
-
+                    tag_size = tag.file_info.tag_size
+                    if tag.header.footer:
+                        tag_size += TagHeader.SIZE
+
+                    if strategy == WRITE_REWRITE:
+                        rewrite_size = tag_size
+                    elif strategy == WRITE_IN_PLACE:
+                        tag_file.seek(0)
+                        tag_file.write(TagHeader(tag.header.version)
+                                       .render(tag_size - TagHeader.SIZE))
+                        blank = WriteBuffer()
+                        blank.appendZeros(tag_size - TagHeader.SIZE)
+                        blank.writeTo(tag_file)
+                    else:
+                        writeHead(tag_file, b"", tag_size)
                     retval |= True
+                file_info = file_info or tag.file_info
 
-        if preserve_file_time and retval and None not in (tag.file_info.atime,
-                                                          tag.file_info.mtime):
-            tag.file_info.touch((tag.file_info.atime, tag.file_info.mtime))
+        if rewrite_size:
+            replaceHead(filename, b"", rewrite_size, strategy=WRITE_REWRITE)
+
+        if preserve_file_time and retval and None not in (file_info.atime,
+                                                          file_info.mtime):
+            file_info.touch((file_info.atime, file_info.mtime))
+        if retval:
+            scancache.invalidate(filename)
 
         return retval
 
@@ -1465,13 +1644,45 @@ class Tag(core.Tag):
         self._setOrigArtist(name)
 
 
+@dataclasses.dataclass
+class WritePlan:
+    """How saving a tag would write ``path``, see :meth:`Tag.save`.
+    ``strategy`` is the :func:`eyed3.utils.fileio.replaceHead` strategy, or
+    ``None`` when the file does not exist and would be created. Sizes are in
+    bytes, ``tag_size`` includes the ``padding_size``."""
+    path: str
+    version: tuple
+    strategy: str
+    curr_tag_size: int
+    tag_size: int
+    padding_size: int
+    file_size: int
+    rewrite_required: bool
+
+    @property
+    def in_place(self):
+        return self.strategy == WRITE_IN_PLACE
+
+    @property
+    def bytes_moved(self):
+        """The number of audio bytes that would be moved or copied."""
+        if self.strategy in (None, WRITE_IN_PLACE):
+            return 0
+        return self.file_size - self.curr_tag_size
+
+    @property
+    def bytes_written(self):
+        """The total number of bytes that would be written."""
+        return self.tag_size + self.bytes_moved
+
+
 class FileInfo:
     """
     This class is for storing information about a parsed file. It contains info
     such as the filename, original tag size, and amount of padding; all of which
     can make rewriting faster.
     """
-    def __init__(self, file_name, tagsz=0, tpadd=0):
+    def __init__(self, file_name, tagsz=0, tpadd=0, stat_result=None, stream=False):
         from .. import LOCAL_FS_ENCODING
 
         if type(file_name) is str:
@@ -1488,17 +1699,47 @@ class FileInfo:
 
         self.tag_size = tagsz or 0  # This includes the padding byte count.
         self.tag_padding_size = tpadd or 0
+        # True for tags not read from the file ``name``, see eyed3.core.loadFileObj. These are
+        # only saved to a given file name.
+        self.stream = stream
 
         self.atime, self.mtime = None, None
-        self.initStatTimes()
-
-    def initStatTimes(self):
-        try:
-            s = os.stat(self.name)
-        except OSError:
+        # The file's identity, size, and modification time; see isCurrent.
+        self.dev, self.ino, self.size, self.mtime_ns = None, None, None, None
+        self.initStatTimes(stat_result=stat_result)
+
+    def initStatTimes(self, stat_result=None):
+        """Set the file times, identity and size from ``stat_result`` (an
+        ``os.stat_result``) or by stat'ing the file when it is not provided."""
+        if stat_result is None and not self.stream:
+            try:
+                stat_result = os.stat(self.name)
+            except OSError:
+                pass
+        if stat_result is None:
+            # Streams are not files, a file of the same name is unrelated.
             self.atime, self.mtime = None, None
-        else:
-            self.atime, self.mtime = s.st_atime, s.st_mtime
+            self.dev, self.ino, self.size, self.mtime_ns = None, None, None, None
+            return
+
+        self.atime, self.mtime = stat_result.st_atime, stat_result.st_mtime
+        self.dev, self.ino = stat_result.st_dev, stat_result.st_ino
+        self.size, self.mtime_ns = stat_result.st_size, stat_result.st_mtime_ns
+
+    def isCurrent(self, stat_result=None):
+        """Return True if the file is the same file, with the same size and
+        modification time, as when this object was last updated. The file is
+        stat'ed when ``stat_result`` is not provided."""
+        if self.ino is None:
+            return False
+        if stat_result is None:
+            try:
+                stat_result = os.stat(self.name)
+            except OSError:
+                return False
+        return ((stat_result.st_dev, stat_result.st_ino, stat_result.st_size,
+                 stat_result.st_mtime_ns) ==
+                (self.dev, self.ino, self.size, self.mtime_ns))
 
     def touch(self, times):
         """times is a 2-tuple of (atime, mtime)."""
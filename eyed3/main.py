@@ -1,16 +1,21 @@
 import os
 import sys
+import argparse
 import textwrap
 import warnings
+import itertools
+import collections
 import deprecation
 
 from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
 from configparser import Error as ConfigParserError
 
 import eyed3
 import eyed3.utils
 import eyed3.utils.console
+import eyed3.utils.scancache
 import eyed3.plugins
 import eyed3.__about__
 
@@ -28,6 +33,17 @@ def main(args, config):
         _listPlugins(config)
         return 0
 
+    if "scan_cache" not in args or not args.scan_cache:
+        return _run(args, config)
+
+    eyed3.utils.scancache.enable(args.scan_cache)
+    try:
+        return _run(args, config)
+    finally:
+        eyed3.utils.scancache.disable()
+
+
+def _run(args, config):
     args.plugin.start(args, config)
 
     recursive = False
@@ -36,16 +52,109 @@ def main(args, config):
     elif "recursive" in args:
         recursive = args.recursive
 
+    jobs = args.jobs if "jobs" in args else 1
+    if jobs != 1 and not args.plugin.PARALLEL:
+        eyed3.utils.console.printWarning(f"The {args.plugin.NAMES[0]} plugin does not support "
+                                         "--jobs, files will be handled serially")
+        jobs = 1
+
     # Process paths (files/directories)
-    for p in args.paths:
-        eyed3.utils.walk(args.plugin, p, excludes=args.excludes, fs_encoding=args.fs_encoding,
-                         recursive=recursive)
+    if jobs == 1:
+        isExcluded = eyed3.utils.excludesMatcher(args.excludes)
+        for i, p in enumerate(args.paths):
+            if os.path.isfile(p) and (i == 0 or not os.path.isfile(args.paths[i - 1])):
+                # Files given on the command line, the walk passes those of directories.
+                args.plugin.prefetchFiles([os.path.abspath(f) for f in
+                                           itertools.takewhile(os.path.isfile, args.paths[i:])
+                                           if not isExcluded(f)])
+            eyed3.utils.walk(args.plugin, p, excludes=args.excludes,
+                             fs_encoding=args.fs_encoding, recursive=recursive)
+    else:
+        _parallelMain(args, config, jobs or os.cpu_count(), recursive)
 
     retval = args.plugin.handleDone()
 
     return retval or 0
 
 
+def _parallelMain(args, config, jobs, recursive):
+    # The plugin is recreated, from the command line and config, in each worker process.
+    worker_args = argparse.Namespace(**{k: v for k, v in vars(args).items() if k != "plugin"})
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_initWorker,
+                             initargs=(args.plugin.NAMES[0], worker_args)) as executor:
+        handler = _ParallelHandler(args.plugin, executor, jobs)
+        for p in args.paths:
+            eyed3.utils.walk(handler, p, excludes=args.excludes, fs_encoding=args.fs_encoding,
+                             recursive=recursive)
+            handler.flush()
+
+
+class _ParallelHandler(eyed3.utils.FileHandler):
+    """Hands each walked file to ``plugin.processFile`` in a worker process,
+    passing the results to ``plugin.mergeResult`` and the directories to
+    ``plugin.handleDirectory`` in walk order."""
+    def __init__(self, plugin, executor, jobs):
+        self.plugin = plugin
+        self.executor = executor
+        self.max_pending = 2 * jobs
+        self._pending = collections.deque()
+
+    def handleFile(self, f):
+        if len(self._pending) >= self.max_pending:
+            self._mergeNext()
+        self._pending.append((f, self.executor.submit(_processFile, f)))
+
+    def handleDirectory(self, d, files):
+        self._pending.append((d, files))
+
+    def flush(self):
+        """Merge all pending results, stopping at a StopIteration as a serial
+        walk does."""
+        try:
+            while self._pending:
+                self._mergeNext()
+        except StopIteration:
+            pass
+
+    def _mergeNext(self):
+        path, pending = self._pending.popleft()
+        try:
+            if isinstance(pending, list):
+                self.plugin.handleDirectory(path, pending)
+            else:
+                result = pending.result()
+                self.plugin.mergeResult(result)
+                if result.stop:
+                    raise StopIteration()
+        except StopIteration:
+            # The rest of this walk is abandoned.
+            for _, pending in self._pending:
+                if not isinstance(pending, list):
+                    pending.cancel()
+            self._pending.clear()
+            raise
+
+
+_worker_plugin = None
+
+
+def _initWorker(plugin_name, args):
+    global _worker_plugin
+
+    if args.scan_cache:
+        eyed3.utils.scancache.enable(args.scan_cache)
+    config = _loadConfig(args)
+    PluginClass = eyed3.plugins.load(plugin_name, paths=_getPluginPath(config))
+    args.plugin = PluginClass(makeCmdLineParser())
+    eyed3.utils.console.AnsiCodes.init(not args.no_color)
+    args.plugin.start(args, config)
+    _worker_plugin = args.plugin
+
+
+def _processFile(f):
+    return _worker_plugin.processFile(f)
+
+
 def _listPlugins(config):
     from eyed3.utils.console import Fore, Style
 
@@ -167,6 +276,13 @@ def setFileScannerOpts(arg_parser, default_recursive=False, paths_metavar="PATH"
     arg_parser.add_argument("paths", metavar=paths_metavar, nargs="*", help=paths_help)
 
 
+def _nonNegativeIntArg(value):
+    i = int(value)
+    if i < 0:
+        raise argparse.ArgumentTypeError("non-negative number required")
+    return i
+
+
 def makeCmdLineParser(subparser=None):
     from eyed3.utils import ArgumentParser
 
@@ -189,6 +305,19 @@ def makeCmdLineParser(subparser=None):
                         "a backup is made of any file modified. The backup "
                         "is made in same directory with a '.orig' "
                         "extension added.")
+    p.add_argument("-j", "--jobs", action="store", type=_nonNegativeIntArg, dest="jobs",
+                   default=1, metavar="N",
+                   help="Handle files in N worker processes, for plugins that support it "
+                        "(e.g. stats, json, lameinfo). 0 uses one per CPU. The default is 1.")
+    p.add_argument("--prefetch", action="store", type=_nonNegativeIntArg, dest="prefetch",
+                   default=None, metavar="N",
+                   help="Load up to N audio files ahead of the one being handled, in threads, "
+                        "for plugins that load audio files. Useful when file access is slow, "
+                        "such as on network file systems.")
+    p.add_argument("--scan-cache", action="store", nargs="?", dest="scan_cache", default=None,
+                   const=eyed3.utils.scancache.DEFAULT_CACHE_PATH, metavar="FILE",
+                   help="Cache loaded files, and load unchanged files from the cache. The "
+                        f"default cache is '{eyed3.utils.scancache.DEFAULT_CACHE_PATH}'.")
     p.add_argument("-Q", "--quiet", action="store_true", dest="quiet",
                    default=False, help="A hint to plugins to output less.")
     p.add_argument("--no-color", action="store_true", dest="no_color",
@@ -9,36 +9,50 @@ from filetype.utils import _NUM_SIGNATURE_BYTES
 log = getLogger(__name__)
 
 
-def guessMimetype(filename):
-    """Return the mime-type for `filename`."""
+def guessMimetype(filename, fileobj=None):
+    """Return the mime-type for `filename`. If `fileobj` is given the data is read from it (from
+    the beginning) instead of opening `filename`, and the file position is reset to 0 on return.
+    """
 
     path = pathlib.Path(filename) if not isinstance(filename, pathlib.Path) else filename
 
-    with path.open("rb") as signature:
-        # Since filetype only reads 262 of file many mp3s starting with null bytes will not find
-        # a header, so ignoring null bytes and using the bytes interface...
-        buf = b""
-        while not buf:
-            data = signature.read(_NUM_SIGNATURE_BYTES)
-            if not data:
-                break
-
-            data = data.lstrip(b"\x00")
-            if data:
-                data_len = len(data)
-                if data_len >= _NUM_SIGNATURE_BYTES:
-                    buf = data[:_NUM_SIGNATURE_BYTES]
-                else:
-                    buf = data + signature.read(_NUM_SIGNATURE_BYTES - data_len)
-
-        # Special casing .id3/.tag because extended filetype with add_type() prepends, meaning
-        # all mp3 would be labeled mimetype id3, while appending would mean each .id3 would be
-        # mime mpeg.
-        if path.suffix in ID3_MIME_TYPE_EXTENSIONS:
-            if Id3Tag().match(buf) or Id3TagExt().match(buf):
-                return Id3TagExt.MIME
-
-        return filetype.guess_mime(buf)
+    if fileobj is not None:
+        fileobj.seek(0)
+        try:
+            buf = _readSignature(fileobj)
+        finally:
+            fileobj.seek(0)
+    else:
+        with path.open("rb") as signature:
+            buf = _readSignature(signature)
+
+    # Special casing .id3/.tag because extended filetype with add_type() prepends, meaning
+    # all mp3 would be labeled mimetype id3, while appending would mean each .id3 would be
+    # mime mpeg.
+    if path.suffix in ID3_MIME_TYPE_EXTENSIONS:
+        if Id3Tag().match(buf) or Id3TagExt().match(buf):
+            return Id3TagExt.MIME
+
+    return filetype.guess_mime(buf)
+
+
+def _readSignature(signature):
+    # Since filetype only reads 262 of file many mp3s starting with null bytes will not find
+    # a header, so ignoring null bytes and using the bytes interface...
+    buf = b""
+    while not buf:
+        data = signature.read(_NUM_SIGNATURE_BYTES)
+        if not data:
+            break
+
+        data = data.lstrip(b"\x00")
+        if data:
+            data_len = len(data)
+            if data_len >= _NUM_SIGNATURE_BYTES:
+                buf = data[:_NUM_SIGNATURE_BYTES]
+            else:
+                buf = data + signature.read(_NUM_SIGNATURE_BYTES - data_len)
+    return buf
 
 
 class Mp2x(filetype.Type):
@@ -1,11 +1,13 @@
 import os
 import re
 import stat
+import dataclasses
 
 from .. import Error
 from .. import id3
 from .. import core
 
+from ..utils.fileio import openFile
 from ..utils.log import getLogger
 log = getLogger(__name__)
 
@@ -33,7 +35,8 @@ EXTENSIONS = [".mp3"]
 
 
 class Mp3AudioInfo(core.AudioInfo):
-    def __init__(self, file_obj, start_offset, tag):
+    def __init__(self, file_obj, start_offset, tag, size_bytes=None,
+                 exact_duration=False):
         from . import headers
         from .headers import timePerFrame
 
@@ -47,6 +50,13 @@ class Mp3AudioInfo(core.AudioInfo):
         self.lame_tag = None
         # 2-tuple, (vrb?:boolean, bitrate:int)
         self.bit_rate = (None, None)
+        # If not ``None``, the :class:`eyed3.mp3.walk.FrameWalk` of every frame
+        # in the file. Only computed when ``exact_duration`` is ``True``.
+        self.frame_walk = None
+        self._path = getattr(file_obj, "name", None)
+        # The file object of audio loaded by eyed3.core.loadFileObj, there is no file at _path.
+        self._stream = None
+        self._seek_index = None
 
         header_pos = 0
         while self.mp3_header is None:
@@ -69,28 +79,15 @@ class Mp3AudioInfo(core.AudioInfo):
             except headers.Mp3Exception as ex:
                 log.debug("Invalid mp3 header: %s" % str(ex))
                 # keep looking...
-                start_offset += 4
+                start_offset = header_pos + 1
 
+        self._header_pos = header_pos
         file_obj.seek(header_pos)
-        mp3_frame = file_obj.read(self.mp3_header.frame_length)
-        if re.compile(b'Xing|Info').search(mp3_frame):
-            # Check for Xing/Info header information.
-            self.xing_header = headers.XingHeader()
-            if not self.xing_header.decode(mp3_frame):
-                log.debug("Ignoring corrupt Xing header")
-                self.xing_header = None
-        elif mp3_frame.find(b'VBRI') >= 0:
-            # Check for VBRI header information.
-            self.vbri_header = headers.VbriHeader()
-            if not self.vbri_header.decode(mp3_frame):
-                log.debug("Ignoring corrupt VBRI header")
-                self.vbri_header = None
-
-        # Check for LAME Tag
-        self.lame_tag = headers.LameHeader(mp3_frame)
+        self._decodeFrame(file_obj.read(self.mp3_header.frame_length))
 
         # Set file size
-        size_bytes = os.stat(file_obj.name)[stat.ST_SIZE]
+        if size_bytes is None:
+            size_bytes = os.stat(file_obj.name)[stat.ST_SIZE]
 
         # Compute track play time.
         if self.xing_header and self.xing_header.vbr:
@@ -123,11 +120,143 @@ class Mp3AudioInfo(core.AudioInfo):
             vbr = False
         self.bit_rate = (vbr, br)
 
+        if exact_duration:
+            from .walk import walkFrames
+
+            # Frames are walked up to a v1 tag, other trailing data is skipped by the walk.
+            self.frame_walk = walkFrames(file_obj, header_pos,
+                                         _audioEnd(file_obj, size_bytes))
+            if self.frame_walk and self.frame_walk.frame_count:
+                time_secs = self.frame_walk.time_secs
+                self.bit_rate = (self.frame_walk.vbr, self.frame_walk.bit_rate)
+
         self.sample_freq = self.mp3_header.sample_freq
         self.mode = self.mp3_header.mode
 
         super().__init__(time_secs, size_bytes)
 
+    def _decodeFrame(self, mp3_frame):
+        """Decode the Xing/Info, VBRI, and LAME headers of the first frame."""
+        from . import headers
+
+        if re.compile(b'Xing|Info').search(mp3_frame):
+            # Check for Xing/Info header information.
+            self.xing_header = headers.XingHeader()
+            if not self.xing_header.decode(mp3_frame):
+                log.debug("Ignoring corrupt Xing header")
+                self.xing_header = None
+        elif mp3_frame.find(b'VBRI') >= 0:
+            # Check for VBRI header information.
+            self.vbri_header = headers.VbriHeader()
+            if not self.vbri_header.decode(mp3_frame):
+                log.debug("Ignoring corrupt VBRI header")
+                self.vbri_header = None
+
+        # Check for LAME Tag
+        self.lame_tag = headers.LameHeader(mp3_frame)
+
+    def _cacheState(self, file_obj):
+        """Return the first frame, read from ``file_obj``, and a dict of plain
+        values from which :meth:`_fromCacheState` restores the info, see
+        :mod:`eyed3.utils.scancache`."""
+        file_obj.seek(self._header_pos)
+        mp3_frame = file_obj.read(self.mp3_header.frame_length)
+
+        frame_walk = None
+        if self.frame_walk is not None:
+            frame_walk = dataclasses.asdict(self.frame_walk)
+            # Integer keys, as a list of pairs.
+            frame_walk["bit_rates"] = list(frame_walk["bit_rates"].items())
+        return mp3_frame, {"header_pos": self._header_pos,
+                           "time_secs": self.time_secs,
+                           "size_bytes": self.size_bytes,
+                           "bit_rate": list(self.bit_rate),
+                           "frame_walk": frame_walk}
+
+    @classmethod
+    def _fromCacheState(cls, path, mp3_frame, state):
+        """Return the info of ``path`` from the values returned by
+        :meth:`_cacheState`, without reading the file."""
+        from .headers import Mp3Header
+        from .walk import FrameWalk
+
+        info = cls.__new__(cls)
+        info.mp3_header = Mp3Header(int.from_bytes(mp3_frame[:4], "big"))
+        info.xing_header, info.vbri_header = None, None
+        info._decodeFrame(mp3_frame)
+        info.bit_rate = tuple(state["bit_rate"])
+        info.frame_walk = None
+        if state["frame_walk"] is not None:
+            info.frame_walk = FrameWalk(**dict(state["frame_walk"],
+                                               bit_rates=dict(state["frame_walk"]["bit_rates"])))
+        info._path = path
+        info._stream = None
+        info._seek_index = None
+        info._header_pos = state["header_pos"]
+        info.sample_freq = info.mp3_header.sample_freq
+        info.mode = info.mp3_header.mode
+        # Already truncated, see AudioInfo.
+        info.time_secs, info.size_bytes = state["time_secs"], state["size_bytes"]
+        return info
+
+    def seekIndex(self, cache_path=None, interval=1.0):
+        """Return a :class:`eyed3.mp3.seek.SeekIndex` for the file, mapping
+        play times to byte offsets. It is built from the Xing TOC or the VBRI
+        seek table if the file has one, otherwise from a frame walk with a
+        point every ``interval`` seconds.
+
+        When ``cache_path`` is given the index is loaded from that file if it
+        was saved for the current version (size and modification time) of the
+        audio file, otherwise the new index is saved there. Audio loaded from
+        a file object (see :func:`eyed3.core.loadFileObj`) is indexed from
+        that object, which must still be open, and ``cache_path`` is not used.
+        """
+        from .seek import SeekIndex
+
+        if self._seek_index is not None:
+            return self._seek_index
+
+        if self._stream is not None:
+            self._stream.seek(0, os.SEEK_END)
+            stat_result = os.stat_result((stat.S_IFREG, 0, 0, 1, 0, 0, self._stream.tell(),
+                                          0, 0, 0))
+            cache_path = None
+        else:
+            stat_result = os.stat(self._path)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                index = SeekIndex.load(cache_path)
+            except Mp3Exception as ex:
+                log.warning(ex)
+            else:
+                if index.isCurrent(stat_result):
+                    self._seek_index = index
+                    return index
+                log.debug(f"Seek index {cache_path} is out of date")
+
+        with openFile(self._path, self._stream) as file_obj:
+            audio_end = _audioEnd(file_obj, stat_result.st_size)
+
+            index = None
+            if self.xing_header:
+                index = SeekIndex.fromXing(self.xing_header, self._header_pos,
+                                           self.time_secs, audio_end)
+            if index is None and self.vbri_header:
+                index = SeekIndex.fromVbri(self.vbri_header, self.mp3_header,
+                                           self._header_pos, self.time_secs, audio_end)
+            if index is None:
+                index = SeekIndex.fromWalk(file_obj, self._header_pos, audio_end,
+                                           interval=interval)
+        if index is None:
+            raise Mp3Exception(f"No MPEG frames found in '{self._path}'")
+
+        index.file_size, index.file_mtime_ns = stat_result.st_size, stat_result.st_mtime_ns
+        if cache_path:
+            index.save(cache_path)
+
+        self._seek_index = index
+        return index
+
     ##
     # Helper to get the bitrate as a string. The prefix '~' is used to denote
     # variable bit rates.
@@ -137,19 +266,51 @@ class Mp3AudioInfo(core.AudioInfo):
         return f"{'~' if vbr else ''}{bit_rate} kb/s"
 
 
+def _audioEnd(file_obj, size_bytes):
+    """Return the offset of the v1 tag in ``file_obj``, or its size."""
+    if size_bytes >= 128:
+        file_obj.seek(-128, 2)
+        if file_obj.read(3) == b"TAG":
+            return size_bytes - 128
+    return size_bytes
+
+
 class Mp3AudioFile(core.AudioFile):
-    """Audio file container for mp3 files."""
+    """Audio file container for mp3 files.
 
-    def __init__(self, path, version=id3.ID3_ANY_VERSION):
+    An already open (binary) ``fileobj`` and an ``os.stat_result`` for
+    ``path`` may be passed to avoid reopening and stat'ing the file, see
+    :func:`eyed3.core.load`. The file object is not closed. When ``use_mmap``
+    is ``True`` the file is read through a memory mapping.
+
+    The play time and bit rate are estimated from the Xing/VBRI headers or the
+    file size, when ``exact_duration`` is ``True`` every frame is walked
+    instead, see :func:`eyed3.mp3.walk.walkFrames`.
+    """
+
+    def __init__(self, path, version=id3.ID3_ANY_VERSION, lazy=False,
+                 fileobj=None, stat_result=None, use_mmap=False,
+                 exact_duration=False):
         self._tag_version = version
+        self._lazy = lazy
+        self._use_mmap = use_mmap
+        self._exact_duration = exact_duration
+        self._fileobj = fileobj
+        self._stat_result = stat_result
 
         super().__init__(path)
         assert self.type == core.AUDIO_MP3
 
     def _read(self):
-        with open(self.path, "rb") as file_obj:
+        fileobj, stat_result = self._fileobj, self._stat_result
+        # Not holding references to the file or its (stale) stat values.
+        self._fileobj, self._stat_result = None, None
+
+        with openFile(self.path, fileobj, use_mmap=self._use_mmap) as file_obj:
             self._tag = id3.Tag()
-            tag_found = self._tag.parse(file_obj, self._tag_version)
+            tag_found = self._tag.parse(file_obj, self._tag_version,
+                                        lazy=self._lazy,
+                                        stat_result=stat_result)
 
             # Compute offset for starting mp3 data search
             if tag_found and self._tag.isV1():
@@ -161,7 +322,10 @@ class Mp3AudioFile(core.AudioFile):
                 self._tag = None
 
             try:
-                self._info = Mp3AudioInfo(file_obj, mp3_offset, self._tag)
+                self._info = Mp3AudioInfo(
+                    file_obj, mp3_offset, self._tag,
+                    size_bytes=stat_result.st_size if stat_result else None,
+                    exact_duration=self._exact_duration)
             except Mp3Exception as ex:
                 # Only logging a warning here since we can still operate on
                 # the tag.
@@ -174,13 +338,13 @@ class Mp3AudioFile(core.AudioFile):
         """Add a id3.Tag to the file (removing any existing tag if one exists)."""
         self.tag = id3.Tag()
         self.tag.version = version
-        self.tag.file_info = id3.FileInfo(self.path)
+        self.tag.file_info = id3.FileInfo(self.path, stream=self.stream)
         return self.tag
 
     @core.AudioFile.tag.setter
     def tag(self, t):
         if t:
-            t.file_info = id3.FileInfo(self.path)
+            t.file_info = id3.FileInfo(self.path, stream=self.stream)
             if self._tag and self._tag.file_info:
                 t.file_info.tag_size = self._tag.file_info.tag_size
                 t.file_info.tag_padding_size = \
@@ -1,8 +1,10 @@
+import re
 import deprecation
 from math import log10
 
 from . import Mp3Exception
-from ..utils.binfuncs import bytes2bin, bytes2dec, bin2dec
+from ..utils.fileio import MappedFile
+from ..utils.intcodec import bytes2int, bitField
 from ..utils.log import getLogger
 from ..__about__ import __version__
 
@@ -49,56 +51,109 @@ def isValidHeader(header):
     return True
 
 
+def _headerRegex():
+    """Compile a regex matching the 4 bytes of MPEG frame headers that pass
+    :func:`isValidHeader`, the checks depend only on the 2nd and 3rd bytes."""
+    def byteClass(values):
+        return b"[" + b"".join(re.escape(bytes([v])) for v in values) + b"]"
+
+    # Sync bits, version and layer. 0xfe is excluded since 0xfffe is a BOM.
+    second = [b for b in range(0xe0, 0x100)
+              if (b >> 3) & 0x3 != 1 and (b >> 1) & 0x3 != 0 and b != 0xfe]
+    # Bit rate and sample rate.
+    third = [b for b in range(0x100)
+             if (b >> 4) not in (0, 0xf) and (b >> 2) & 0x3 != 0x3]
+    return re.compile(b"\xff" + byteClass(second) + byteClass(third) + b".",
+                      re.DOTALL)
+
+
+_HEADER_REGEX = _headerRegex()
+# The version, layer, and sample rate bits; these are the same in each frame.
+_HEADER_CONSTANT_MASK = 0x001e0c00
+_SYNC_CHUNK_SIZE = 64 * 1024
+
+
+def _frameLength(header):
+    """Return the frame length in bytes of the valid frame ``header``."""
+    version_bits = (header >> 19) & 0x3
+    layer = 4 - ((header >> 17) & 0x3)
+    mpeg1 = version_bits == 3
+
+    bit_rate_col = (layer - 1) if mpeg1 else (3 if layer == 1 else 4)
+    bit_rate = BIT_RATE_TABLE[(header >> 12) & 0xf][bit_rate_col] * 1000
+    sample_freq = SAMPLE_FREQ_TABLE[(header >> 10) & 0x3][(2, None, 1, 0)[version_bits]]
+    padding = (header >> 9) & 0x1
+
+    if layer == 1:
+        return (12 * bit_rate // sample_freq + padding) * 4
+    elif layer == 3 and not mpeg1:
+        return 72 * bit_rate // sample_freq + padding
+    return 144 * bit_rate // sample_freq + padding
+
+
 def findHeader(fp, start_pos=0):
     """Locate the first mp3 header in file stream ``fp`` starting a offset
     ``start_pos`` (defaults to 0). Returned is a 3-tuple containing the offset
     where the header was found, the header as an integer, and the header as 4
     bytes. If no header is found header_int will equal 0.
-    """
 
-    def isBOM(buffer, pos):
-        """Check for unicode BOM"""
-        try:
-            if pos - 1 >= 0:
-                if buffer[pos - 1] == 254:
-                    return True
-            return buffer[pos + 1] == 254
-        except IndexError:
-            return False
-
-    def find_sync(_fp, _pos=0):
-        chunk_sz = 8192  # Measured as optimal
-
-        _fp.seek(_pos)
-        data = _fp.read(chunk_sz)
-
-        while data:
-            pos = 0
-            while 0 <= pos < chunk_sz:
-                pos = data.find(b"\xff", pos)
-                if pos == -1:
-                    break
-
-                if not isBOM(data, pos):
-                    h = data[pos:pos + 4]
-                    if len(h) == 4:
-                        return tuple([_pos + pos, h])
+    A header is confirmed by a header (of the same MPEG version, layer, and
+    sample rate) where the next frame should begin, or by the data ending
+    there. The first confirmed header is returned; if there are none the first
+    valid header is returned, confirmed or not.
+    """
+    if isinstance(fp, MappedFile):
+        # The whole file is searchable without chunked reads.
+        buf, buf_offset, pos, eof = fp.buffer, 0, start_pos, True
+    else:
+        fp.seek(start_pos)
+        buf, buf_offset, pos = fp.read(_SYNC_CHUNK_SIZE), start_pos, 0
+        eof = len(buf) < _SYNC_CHUNK_SIZE
+
+    unconfirmed = None
+    while True:
+        match = _HEADER_REGEX.search(buf, pos)
+        if match is None:
+            if eof:
+                break
+            # Keep the tail, a header may span the chunks. The first byte kept
+            # has been searched, but is needed for the BOM check.
+            keep = buf[-4:]
+            buf_offset += len(buf) - len(keep)
+            data = fp.read(_SYNC_CHUNK_SIZE)
+            eof = len(data) < _SYNC_CHUNK_SIZE
+            buf, pos = keep + data, 1
+            continue
+
+        pos = match.start()
+        if pos and buf[pos - 1] == 0xfe:
+            # Unicode BOM
+            pos += 1
+            continue
 
-                pos += 1
+        header_bytes = bytes(buf[pos:pos + 4])
+        header = bytes2int(header_bytes)
 
-            _pos += len(data)
-            data = _fp.read(chunk_sz)
+        next_pos = pos + _frameLength(header)
+        while not eof and next_pos + 4 > len(buf):
+            data = fp.read(_SYNC_CHUNK_SIZE)
+            eof = len(data) < _SYNC_CHUNK_SIZE
+            buf += data
 
-        return None, None
+        if next_pos + 4 > len(buf) or buf[next_pos:next_pos + 3] == b"TAG":
+            confirmed = True
+        else:
+            next_header = bytes2int(buf[next_pos:next_pos + 4])
+            confirmed = (_HEADER_REGEX.match(buf, next_pos) is not None and
+                         not (next_header ^ header) & _HEADER_CONSTANT_MASK)
 
-    sync_pos, header_bytes = find_sync(fp, start_pos)
-    while sync_pos is not None:
-        header = bytes2dec(header_bytes)
-        if isValidHeader(header):
-            return tuple([sync_pos, header, header_bytes])
-        sync_pos, header_bytes = find_sync(fp, start_pos + sync_pos + 2)
+        if confirmed:
+            return tuple([buf_offset + pos, header, header_bytes])
+        elif unconfirmed is None:
+            unconfirmed = tuple([buf_offset + pos, header, header_bytes])
+        pos += 1
 
-    return None, None, None
+    return unconfirmed or (None, None, None)
 
 
 def timePerFrame(mp3_header, vbr):
@@ -266,6 +321,10 @@ class VbriHeader(object):
     def __init__(self):
         self.vbr = True
         self.version = None
+        # The seek table, each entry is the number of bytes (already scaled)
+        # spanned by ``toc_frames`` frames.
+        self.toc = []
+        self.toc_frames = 0
 
     ##
     # \brief Decode the VBRI info from \a frame.
@@ -276,26 +335,41 @@ class VbriHeader(object):
         # therefore 4 + 32 = 36
         offset = 36
         head = frame[offset:offset + 4]
-        if head != 'VBRI':
+        if head != b'VBRI':
             return False
         log.debug("VBRI header detected @ %x" % (offset))
         offset += 4
 
-        self.version = bin2dec(bytes2bin(frame[offset:offset + 2]))
+        self.version = bytes2int(frame[offset:offset + 2])
         offset += 2
 
-        self.delay = bin2dec(bytes2bin(frame[offset:offset + 2]))
+        self.delay = bytes2int(frame[offset:offset + 2])
         offset += 2
 
-        self.quality = bin2dec(bytes2bin(frame[offset:offset + 2]))
+        self.quality = bytes2int(frame[offset:offset + 2])
         offset += 2
 
-        self.num_bytes = bin2dec(bytes2bin(frame[offset:offset + 4]))
+        self.num_bytes = bytes2int(frame[offset:offset + 4])
         offset += 4
 
-        self.num_frames = bin2dec(bytes2bin(frame[offset:offset + 4]))
+        self.num_frames = bytes2int(frame[offset:offset + 4])
         offset += 4
 
+        # Seek table
+        toc_entries = bytes2int(frame[offset:offset + 2])
+        toc_scale = bytes2int(frame[offset + 2:offset + 4])
+        entry_size = bytes2int(frame[offset + 4:offset + 6])
+        self.toc_frames = bytes2int(frame[offset + 6:offset + 8])
+        offset += 8
+
+        if 1 <= entry_size <= 4 and offset + toc_entries * entry_size <= len(frame):
+            self.toc = [bytes2int(frame[pos:pos + entry_size]) * toc_scale
+                        for pos in range(offset, offset + toc_entries * entry_size,
+                                         entry_size)]
+        else:
+            log.debug("Ignoring invalid VBRI seek table")
+            self.toc = []
+
         return True
 
 
@@ -338,19 +412,19 @@ class XingHeader:
         pos += 4
 
         # Read Xing flags.
-        headFlags = bin2dec(bytes2bin(frame[pos:pos + 4]))
+        headFlags = bytes2int(frame[pos:pos + 4])
         pos += 4
         log.debug("%s header flags: 0x%x" % (head, headFlags))
 
         # Read frames header flag and value if present
         if headFlags & FRAMES_FLAG:
-            self.numFrames = bin2dec(bytes2bin(frame[pos:pos + 4]))
+            self.numFrames = bytes2int(frame[pos:pos + 4])
             pos += 4
             log.debug("%s numFrames: %d" % (head, self.numFrames))
 
         # Read bytes header flag and value if present
         if headFlags & BYTES_FLAG:
-            self.numBytes = bin2dec(bytes2bin(frame[pos:pos + 4]))
+            self.numBytes = bytes2int(frame[pos:pos + 4])
             pos += 4
             log.debug("%s numBytes: %d" % (head, self.numBytes))
 
@@ -364,7 +438,7 @@ class XingHeader:
 
         # Read vbr scale header flag and value if present
         if headFlags & VBR_SCALE_FLAG and head == b'Xing':
-            self.vbrScale = bin2dec(bytes2bin(frame[pos:pos + 4]))
+            self.vbrScale = bytes2int(frame[pos:pos + 4])
             pos += 4
             log.debug("%s vbrScale: %d" % (head, self.vbrScale))
 
@@ -559,8 +633,9 @@ class LameHeader(dict):
 
     def _crc16(self, data, val=0):
         """Compute a CRC-16 checksum on a data stream."""
-        for c in [bytes([b]) for b in data]:
-            val = self._crc16_table[ord(c) ^ (val & 0xff)] ^ (val >> 8)
+        table = self._crc16_table
+        for b in data:
+            val = table[b ^ (val & 0xff)] ^ (val >> 8)
         return val
 
     def decode(self, frame):
@@ -573,7 +648,7 @@ class LameHeader(dict):
         log.debug(f"Lame info tag found at position {pos}")
 
         # check the info tag crc. If it's not valid, no point parsing much more.
-        lamecrc = bin2dec(bytes2bin(frame[190:192]))
+        lamecrc = bytes2int(frame[190:192])
         if self._crc16(frame[:190]) != lamecrc:
             log.warning("Lame tag CRC check failed")
         else:
@@ -586,16 +661,15 @@ class LameHeader(dict):
             pos += 9
 
             # Info Tag revision + VBR method, 1 byte
-            self['tag_revision'] = bin2dec(bytes2bin(frame[pos:pos + 1])[:5])
-            vbr_method = bin2dec(bytes2bin(frame[pos:pos + 1])[5:])
+            self['tag_revision'] = bitField(frame[pos:pos + 1], 0, 5)
+            vbr_method = bitField(frame[pos:pos + 1], 5, 3)
             self['vbr_method'] = self.VBR_METHODS.get(vbr_method, 'Unknown')
             log.debug('Lame info tag version: %s' % self['tag_revision'])
             log.debug('Lame VBR method: %s' % self['vbr_method'])
             pos += 1
 
             # Lowpass filter value, 1 byte
-            self['lowpass_filter'] = bin2dec(
-                                       bytes2bin(frame[pos:pos + 1])) * 100
+            self['lowpass_filter'] = bytes2int(frame[pos:pos + 1]) * 100
             log.debug('Lame Lowpass filter value: %s Hz' %
                       self['lowpass_filter'])
             pos += 1
@@ -604,7 +678,7 @@ class LameHeader(dict):
             replaygain = {}
 
             # Peak signal amplitude, 4 bytes
-            peak = bin2dec(bytes2bin(frame[pos:pos + 4])) << 5
+            peak = bytes2int(frame[pos:pos + 4]) << 5
             if peak > 0:
                 peak /= float(1 << 28)
                 db = 20 * log10(peak)
@@ -615,10 +689,11 @@ class LameHeader(dict):
 
             # Radio and Audiofile Gain, AKA track and album, 2 bytes each
             for gaintype in ['radio', 'audiofile']:
-                name = bin2dec(bytes2bin(frame[pos:pos + 2])[:3])
-                orig = bin2dec(bytes2bin(frame[pos:pos + 2])[3:6])
-                sign = bin2dec(bytes2bin(frame[pos:pos + 2])[6:7])
-                adj = bin2dec(bytes2bin(frame[pos:pos + 2])[7:]) / 10.0
+                gain_field = frame[pos:pos + 2]
+                name = bitField(gain_field, 0, 3)
+                orig = bitField(gain_field, 3, 3)
+                sign = bitField(gain_field, 6)
+                adj = bitField(gain_field, 7, 9) / 10.0
                 if sign:
                     adj *= -1
 
@@ -640,10 +715,10 @@ class LameHeader(dict):
                 self['replaygain'] = replaygain
 
             # Encoding flags + ATH Type, 1 byte
-            encflags = bin2dec(bytes2bin(frame[pos:pos + 1])[:4])
+            encflags = bitField(frame[pos:pos + 1], 0, 4)
             (self['encoding_flags'],
              self['nogap']) = self._parse_encflags(encflags)
-            self['ath_type'] = bin2dec(bytes2bin(frame[pos:pos + 1])[4:])
+            self['ath_type'] = bitField(frame[pos:pos + 1], 4, 4)
             log.debug('Lame Encoding flags: %s' %
                       ' '.join(self['encoding_flags']))
             if self['nogap']:
@@ -658,24 +733,24 @@ class LameHeader(dict):
             elif 'Variable' in self['vbr_method']:
                 btype = 'Minimum'
             # bitrate may be modified below after preset is read
-            self['bitrate'] = (bin2dec(bytes2bin(frame[pos:pos + 1])), btype)
+            self['bitrate'] = (bytes2int(frame[pos:pos + 1]), btype)
             log.debug('Lame Bitrate (%s): %s' % (btype, self['bitrate'][0]))
             pos += 1
 
             # Encoder delays, 3 bytes
-            self['encoder_delay'] = bin2dec(bytes2bin(frame[pos:pos + 3])[:12])
-            self['encoder_padding'] = bin2dec(
-                                        bytes2bin(frame[pos:pos + 3])[12:])
+            self['encoder_delay'] = bitField(frame[pos:pos + 3], 0, 12)
+            self['encoder_padding'] = bitField(frame[pos:pos + 3], 12, 12)
             log.debug('Lame Encoder delay: %s samples' % self['encoder_delay'])
             log.debug('Lame Encoder padding: %s samples' %
                       self['encoder_padding'])
             pos += 3
 
             # Misc, 1 byte
-            sample_freq = bin2dec(bytes2bin(frame[pos:pos + 1])[:2])
-            unwise_settings = bin2dec(bytes2bin(frame[pos:pos + 1])[2:3])
-            stereo_mode = bin2dec(bytes2bin(frame[pos:pos + 1])[3:6])
-            self['noise_shaping'] = bin2dec(bytes2bin(frame[pos:pos + 1])[6:])
+            misc = frame[pos:pos + 1]
+            sample_freq = bitField(misc, 0, 2)
+            unwise_settings = bitField(misc, 2)
+            stereo_mode = bitField(misc, 3, 3)
+            self['noise_shaping'] = bitField(misc, 6, 2)
             self['sample_freq'] = self.SAMPLE_FREQUENCIES.get(sample_freq,
                                                               'Unknown')
             self['unwise_settings'] = bool(unwise_settings)
@@ -687,8 +762,8 @@ class LameHeader(dict):
             pos += 1
 
             # MP3 Gain, 1 byte
-            sign = bytes2bin(frame[pos:pos + 1])[0]
-            gain = bin2dec(bytes2bin(frame[pos:pos + 1])[1:])
+            sign = bitField(frame[pos:pos + 1], 0)
+            gain = bitField(frame[pos:pos + 1], 1, 7)
             if sign:
                 gain *= -1
             self['mp3_gain'] = gain
@@ -697,8 +772,8 @@ class LameHeader(dict):
             pos += 1
 
             # Preset and surround info, 2 bytes
-            surround = bin2dec(bytes2bin(frame[pos:pos + 2])[2:5])
-            preset = bin2dec(bytes2bin(frame[pos:pos + 2])[5:])
+            surround = bitField(frame[pos:pos + 2], 2, 3)
+            preset = bitField(frame[pos:pos + 2], 5, 11)
             if preset in range(8, 321):
                 if self['bitrate'][0] >= 255:
                     # the value from preset is better in this case
@@ -718,12 +793,12 @@ class LameHeader(dict):
             pos += 2
 
             # MusicLength, 4 bytes
-            self['music_length'] = bin2dec(bytes2bin(frame[pos:pos + 4]))
+            self['music_length'] = bytes2int(frame[pos:pos + 4])
             log.debug('Lame Music Length: %s bytes' % self['music_length'])
             pos += 4
 
             # MusicCRC, 2 bytes
-            self['music_crc'] = bin2dec(bytes2bin(frame[pos:pos + 2]))
+            self['music_crc'] = bytes2int(frame[pos:pos + 2])
             log.debug('Lame Music CRC: %04X' % self['music_crc'])
             pos += 2
 
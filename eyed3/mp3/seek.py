@@ -0,0 +1,179 @@
+"""Seek indexes, mapping play times to byte offsets in MPEG audio files.
+
+An index is built from the Xing TOC or VBRI seek table when the file has one,
+otherwise from a frame walk sampling one frame offset per interval. Indexes
+can be saved to, and loaded from, a small binary sidecar file.
+"""
+import bisect
+import struct
+
+from . import Mp3Exception
+from .headers import timePerFrame
+from ..utils.log import getLogger
+
+log = getLogger(__name__)
+
+SOURCE_XING = "xing"
+SOURCE_VBRI = "vbri"
+SOURCE_WALK = "walk"
+_SOURCES = (SOURCE_XING, SOURCE_VBRI, SOURCE_WALK)
+
+# The file name suffix for seek index sidecar files.
+SIDECAR_SUFFIX = ".seekidx"
+
+_MAGIC = b"eyeD3SIX"
+_FORMAT_VERSION = 1
+# magic, format version, source, file size, file mtime (ns), play time, audio start and end,
+# point count
+_HEADER = struct.Struct(">8sBBxxQqdQQI")
+# time, offset
+_POINT = struct.Struct(">dQ")
+
+
+class SeekIndex:
+    """A sorted list of (time_secs, byte offset) points.
+
+    Points from Xing and VBRI tables are approximate, offsets between points
+    are interpolated. Points from frame walks are exact frame offsets, and
+    :meth:`offset` returns the offset of the frame at or before the time.
+    """
+    def __init__(self, points, time_secs, audio_start, audio_end, source,
+                 file_size=0, file_mtime_ns=0):
+        if source not in _SOURCES:
+            raise ValueError(f"Invalid seek index source: {source}")
+
+        self.points = sorted(points)
+        self.time_secs = time_secs
+        self.audio_start = audio_start
+        self.audio_end = audio_end
+        self.source = source
+        # The size and modification time of the file when the index was made, see
+        # :meth:`isCurrent`.
+        self.file_size = file_size
+        self.file_mtime_ns = file_mtime_ns
+
+        self._times = [t for t, _ in self.points]
+
+    def __len__(self):
+        return len(self.points)
+
+    def __eq__(self, other):
+        return (isinstance(other, SeekIndex) and
+                (self.points, self.time_secs, self.audio_start, self.audio_end, self.source,
+                 self.file_size, self.file_mtime_ns) ==
+                (other.points, other.time_secs, other.audio_start, other.audio_end,
+                 other.source, other.file_size, other.file_mtime_ns))
+
+    @property
+    def interpolated(self):
+        return self.source != SOURCE_WALK
+
+    def offset(self, time_secs):
+        """Return the byte offset for playback from ``time_secs``."""
+        if not self.points or time_secs <= self._times[0]:
+            return self.audio_start
+        elif time_secs >= self.time_secs:
+            return self.audio_end
+
+        i = bisect.bisect_right(self._times, time_secs) - 1
+        t1, offset1 = self.points[i]
+        if not self.interpolated:
+            return offset1
+
+        if i + 1 < len(self.points):
+            t2, offset2 = self.points[i + 1]
+        else:
+            t2, offset2 = self.time_secs, self.audio_end
+        if t2 <= t1:
+            return offset1
+        return min(int(offset1 + (offset2 - offset1) * (time_secs - t1) / (t2 - t1)),
+                   self.audio_end)
+
+    def isCurrent(self, stat_result):
+        """Return True if ``stat_result`` (an ``os.stat_result``) has the same
+        size and modification time as when the index was made."""
+        return (stat_result.st_size == self.file_size and
+                stat_result.st_mtime_ns == self.file_mtime_ns)
+
+    @staticmethod
+    def fromXing(xing_header, header_pos, time_secs, audio_end):
+        """Build an index from the Xing TOC, or return None if there is no
+        TOC. ``header_pos`` is the offset of the Xing frame."""
+        toc = bytes(xing_header.toc)
+        if len(toc) != 100 or not any(toc[1:]):
+            return None
+
+        num_bytes = xing_header.numBytes or (audio_end - header_pos)
+        points = [(time_secs * i / 100, header_pos + int(toc[i] / 256 * num_bytes))
+                  for i in range(100)]
+        return SeekIndex(points, time_secs, header_pos, audio_end, SOURCE_XING)
+
+    @staticmethod
+    def fromVbri(vbri_header, mp3_header, header_pos, time_secs, audio_end):
+        """Build an index from the VBRI seek table, or return None if there is
+        no table. ``header_pos`` is the offset of the VBRI frame."""
+        if not vbri_header.toc or not vbri_header.toc_frames:
+            return None
+
+        secs_per_entry = timePerFrame(mp3_header, True) * vbri_header.toc_frames
+        points = [(0.0, header_pos)]
+        offset = header_pos
+        for i, size in enumerate(vbri_header.toc[:-1], start=1):
+            offset += size
+            points.append((i * secs_per_entry, offset))
+        return SeekIndex(points, time_secs, header_pos, audio_end, SOURCE_VBRI)
+
+    @staticmethod
+    def fromWalk(fp, start_pos=0, end_pos=None, interval=1.0):
+        """Build an index from a frame walk (see
+        :func:`eyed3.mp3.walk.walkFrames`) of ``fp`` with a point every
+        ``interval`` seconds (rounded to whole frames). None is returned if
+        there are no frames."""
+        from .walk import walkFrames
+        from .headers import findHeader, SAMPLE_FREQ_TABLE, SAMPLES_PER_FRAME_TABLE
+
+        # The frame sample interval depends on the stream's sample rate.
+        header_pos, header, _ = findHeader(fp, start_pos)
+        if not header:
+            return None
+        version_key = (2, None, 1, 0)[(header >> 19) & 0x3]
+        sample_freq = SAMPLE_FREQ_TABLE[(header >> 10) & 0x3][version_key]
+        samples_per_frame = SAMPLES_PER_FRAME_TABLE[version_key][4 - ((header >> 17) & 0x3)]
+        sample_every = max(1, round(interval * sample_freq / samples_per_frame))
+
+        walk = walkFrames(fp, header_pos, end_pos, sample_every=sample_every)
+        if walk is None or not walk.frame_count:
+            return None
+
+        secs_per_point = sample_every * walk.samples_per_frame / walk.sample_freq
+        points = [(i * secs_per_point, offset) for i, offset in enumerate(walk.frame_offsets)]
+        return SeekIndex(points, walk.time_secs, points[0][1], walk.audio_end, SOURCE_WALK)
+
+    def save(self, path):
+        """Write the index to the file ``path``."""
+        with open(path, "wb") as fp:
+            fp.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _SOURCES.index(self.source),
+                                  self.file_size, self.file_mtime_ns, self.time_secs,
+                                  self.audio_start, self.audio_end, len(self.points)))
+            fp.write(b"".join(_POINT.pack(t, offset) for t, offset in self.points))
+
+    @staticmethod
+    def load(path):
+        """Read an index written by :meth:`save`. An
+        :class:`eyed3.mp3.Mp3Exception` is raised if ``path`` is not a valid
+        index file."""
+        with open(path, "rb") as fp:
+            data = fp.read()
+
+        try:
+            (magic, version, source, file_size, file_mtime_ns, time_secs, audio_start,
+             audio_end, count) = _HEADER.unpack_from(data)
+        except struct.error:
+            raise Mp3Exception(f"Invalid seek index file: {path}") from None
+        if (magic != _MAGIC or version != _FORMAT_VERSION or source >= len(_SOURCES) or
+                len(data) != _HEADER.size + count * _POINT.size):
+            raise Mp3Exception(f"Invalid seek index file: {path}")
+
+        points = list(_POINT.iter_unpack(data[_HEADER.size:]))
+        return SeekIndex(points, time_secs, audio_start, audio_end, _SOURCES[source],
+                         file_size=file_size, file_mtime_ns=file_mtime_ns)
@@ -0,0 +1,340 @@
+"""Exact MPEG audio measurements by walking every frame header.
+
+Estimates based on Xing/VBRI frame counts or the first frame's length are off
+for VBR files without a Xing header and for files with trailing data (APE
+tags, Lyrics3, junk). :func:`walkFrames` steps from frame header to frame
+header using the frame length arithmetic, no audio is decoded.
+
+When NumPy is installed :func:`frameTable` locates and decodes the headers
+of all frames with array operations, and :func:`walkFrames` uses it.
+"""
+import struct
+import functools
+import dataclasses
+from typing import Optional
+
+from .headers import (findHeader, _frameLength, _HEADER_REGEX, _HEADER_CONSTANT_MASK,
+                      BIT_RATE_TABLE, SAMPLE_FREQ_TABLE, SAMPLES_PER_FRAME_TABLE)
+from ..utils.fileio import MappedFile
+from ..utils.log import getLogger
+
+log = getLogger(__name__)
+
+try:
+    import numpy
+    _HAVE_NUMPY = True
+except ImportError:
+    _HAVE_NUMPY = False
+
+_UINT32 = struct.Struct(">I")
+_MISSING = object()
+
+
+@dataclasses.dataclass
+class FrameWalk:
+    """The results of :func:`walkFrames`."""
+
+    # The offset of the first frame.
+    audio_start: int
+    # The offset just past the last complete frame.
+    audio_end: int
+    sample_freq: int
+    # The number of samples (per channel) in each frame.
+    samples_per_frame: int
+    # True when the first frame is a Xing/Info/VBRI header frame, it is not
+    # included in the frame, sample, and byte counts.
+    info_frame: bool = False
+    frame_count: int = 0
+    # The number of bytes in the audio frames.
+    audio_bytes: int = 0
+    # Bytes found between frames, and skipped, while walking.
+    junk_bytes: int = 0
+    # Bit rate (kb/s) -> the number of frames with that bit rate.
+    bit_rates: dict = dataclasses.field(default_factory=dict)
+    # The offsets of every ``sample_every`` audio frame (0, n, 2n, ...), when
+    # requested from :func:`walkFrames`.
+    frame_offsets: list = dataclasses.field(default_factory=list)
+
+    @property
+    def sample_count(self):
+        return self.frame_count * self.samples_per_frame
+
+    @property
+    def time_secs(self):
+        return self.sample_count / self.sample_freq
+
+    @property
+    def bit_rate(self):
+        """The average bit rate (kb/s) of the audio frames."""
+        if not self.frame_count:
+            return 0
+        return int(round(self.audio_bytes * 8 / self.time_secs / 1000))
+
+    @property
+    def vbr(self):
+        return len(self.bit_rates) > 1
+
+
+@dataclasses.dataclass
+class FrameTable:
+    """The results of :func:`frameTable`, the offset, length, and bit rate of
+    each audio frame as NumPy arrays."""
+
+    # Offsets of the audio frames in the file.
+    offsets: object
+    # Frame lengths, in bytes.
+    lengths: object
+    # Frame bit rates, kb/s.
+    bit_rates: object
+    # The walk details, the frame totals are computed by :meth:`summary`.
+    walk: FrameWalk
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def summary(self) -> FrameWalk:
+        """Return the :class:`FrameWalk` totals for the table."""
+        walk = dataclasses.replace(self.walk, bit_rates={}, frame_offsets=[])
+        walk.frame_count = len(self.offsets)
+        walk.audio_bytes = int(self.lengths.sum())
+        for bit_rate, count in zip(*numpy.unique(self.bit_rates, return_counts=True)):
+            walk.bit_rates[int(bit_rate)] = int(count)
+        return walk
+
+
+def _frameInfo(header, constant):
+    """Return (frame length, bit rate) for ``header`` if it is a valid header
+    with the ``constant`` version, layer, and sample rate bits, else None."""
+    if (_HEADER_REGEX.fullmatch(_UINT32.pack(header)) is None or
+            (header & _HEADER_CONSTANT_MASK) != constant):
+        return None
+
+    mpeg1 = (header >> 19) & 0x3 == 3
+    layer = 4 - ((header >> 17) & 0x3)
+    bit_rate_col = (layer - 1) if mpeg1 else (3 if layer == 1 else 4)
+    return _frameLength(header), BIT_RATE_TABLE[(header >> 12) & 0xf][bit_rate_col]
+
+
+def _resync(buf, pos, end, constant):
+    """Find the next frame header at or after ``pos`` that is followed by
+    another; junk between frames may contain false syncs."""
+    while True:
+        match = _HEADER_REGEX.search(buf, pos, end)
+        if match is None:
+            return None
+
+        pos = match.start()
+        info = _frameInfo(_UINT32.unpack_from(buf, pos)[0], constant)
+        if info:
+            next_pos = pos + info[0]
+            if (next_pos + 4 <= end and
+                    _frameInfo(_UINT32.unpack_from(buf, next_pos)[0], constant)):
+                return pos
+        pos += 1
+
+
+def _isInfoFrame(frame):
+    return b"Xing" in frame or b"Info" in frame or b"VBRI" in frame
+
+
+def _walkSetup(fp, start_pos, end_pos):
+    """Locate the first frame and return (buffer, buffer offset, walk end
+    within the buffer, header, FrameWalk), or None when there is no frame."""
+    header_pos, header, _ = findHeader(fp, start_pos)
+    if not header:
+        return None
+
+    if isinstance(fp, MappedFile):
+        buf, base = fp.buffer, 0
+    else:
+        fp.seek(header_pos)
+        buf, base = fp.read(), header_pos
+    end = len(buf) if end_pos is None else max(0, min(end_pos - base, len(buf)))
+
+    version_key = (2, None, 1, 0)[(header >> 19) & 0x3]
+    layer = 4 - ((header >> 17) & 0x3)
+    walk = FrameWalk(audio_start=header_pos, audio_end=header_pos,
+                     sample_freq=SAMPLE_FREQ_TABLE[(header >> 10) & 0x3][version_key],
+                     samples_per_frame=SAMPLES_PER_FRAME_TABLE[version_key][layer])
+    return buf, base, end, header, walk
+
+
+def walkFrames(fp, start_pos=0, end_pos=None, use_numpy=None,
+               sample_every=None) -> Optional[FrameWalk]:
+    """Walk the MPEG frames in file ``fp`` starting with the first frame
+    header found at or after ``start_pos``. The walk ends at ``end_pos``
+    (e.g. the offset of a v1 tag), the end of the file, or when no further
+    frames are found. ``None`` is returned if there are no frames.
+
+    If ``sample_every`` is set the offset of every ``sample_every`` audio frame
+    is recorded in :attr:`FrameWalk.frame_offsets`.
+
+    The NumPy engine, :func:`frameTable`, is used when NumPy is installed
+    unless ``use_numpy`` is ``False``.
+    """
+    if use_numpy or (use_numpy is None and _HAVE_NUMPY):
+        table = frameTable(fp, start_pos, end_pos)
+        if table is None:
+            return None
+        walk = table.summary()
+        if sample_every:
+            walk.frame_offsets = table.offsets[::sample_every].tolist()
+        return walk
+
+    setup = _walkSetup(fp, start_pos, end_pos)
+    if setup is None:
+        return None
+    buf, base, end, header, walk = setup
+    constant = header & _HEADER_CONSTANT_MASK
+
+    first_pos = walk.audio_start - base
+    first_len = _frameLength(header)
+    walk.info_frame = (first_pos + first_len <= end and
+                       _isInfoFrame(buf[first_pos:first_pos + first_len]))
+    # The audio frame number, the info frame is -1.
+    frame_num = -1 if walk.info_frame else 0
+
+    # The header's first 3 bytes (those that determine the frame length) ->
+    # (frame length, bit rate), or None for non-headers.
+    frame_infos = {}
+    # Same keys -> frame count
+    counts = {}
+    unpack_from = _UINT32.unpack_from
+
+    pos = audio_end = walk.audio_start - base
+    while pos + 4 <= end:
+        key = unpack_from(buf, pos)[0] >> 8
+        info = frame_infos.get(key, _MISSING)
+        if info is _MISSING:
+            info = frame_infos[key] = _frameInfo(key << 8, constant)
+
+        if info is not None and pos + info[0] <= end:
+            counts[key] = counts.get(key, 0) + 1
+            if sample_every:
+                if frame_num >= 0 and frame_num % sample_every == 0:
+                    walk.frame_offsets.append(base + pos)
+                frame_num += 1
+            pos = audio_end = pos + info[0]
+            continue
+
+        # Lost sync, or a truncated frame
+        next_pos = _resync(buf, pos + 1, end, constant)
+        if next_pos is None:
+            break
+        log.debug(f"MPEG frame sync lost at {base + pos}, resumed at {base + next_pos}")
+        walk.junk_bytes += next_pos - pos
+        pos = next_pos
+    walk.audio_end = base + audio_end
+
+    if walk.info_frame:
+        counts[header >> 8] -= 1
+
+    for key, count in counts.items():
+        if count:
+            frame_len, bit_rate = frame_infos[key]
+            walk.frame_count += count
+            walk.audio_bytes += frame_len * count
+            walk.bit_rates[bit_rate] = walk.bit_rates.get(bit_rate, 0) + count
+
+    return walk
+
+
+@functools.lru_cache(maxsize=None)
+def _frameInfoTables(constant):
+    """Return NumPy (frame length, bit rate) lookup tables indexed by the 2nd
+    and 3rd header bytes; the length is 0 for invalid headers and headers
+    without the ``constant`` version, layer, and sample rate bits."""
+    keys = numpy.arange(0x10000, dtype=numpy.int64)
+    candidates = numpy.flatnonzero(((keys << 8) & _HEADER_CONSTANT_MASK) == constant)
+
+    lengths = numpy.zeros(0x10000, dtype=numpy.int64)
+    bit_rates = numpy.zeros(0x10000, dtype=numpy.int64)
+    for key in candidates.tolist():
+        info = _frameInfo(0xff000000 | (key << 8), constant)
+        if info:
+            lengths[key], bit_rates[key] = info
+    return lengths, bit_rates
+
+
+def frameTable(fp, start_pos=0, end_pos=None) -> Optional[FrameTable]:
+    """Like :func:`walkFrames` but returns a :class:`FrameTable` of every
+    audio frame. All sync candidates are located and decoded using NumPy array
+    operations, only following the chain of frames is done per frame.
+    A ``RuntimeError`` is raised if NumPy is not installed.
+    """
+    if not _HAVE_NUMPY:
+        raise RuntimeError("frameTable requires NumPy, install with `pip install numpy`")
+
+    setup = _walkSetup(fp, start_pos, end_pos)
+    if setup is None:
+        return None
+    buf, base, end, header, walk = setup
+
+    first_pos = walk.audio_start - base
+    if end <= first_pos:
+        # The first header is at or past ``end_pos``; a negative count would read to the end.
+        empty = numpy.zeros(0, dtype=numpy.intp)
+        return FrameTable(offsets=empty, lengths=empty, bit_rates=empty, walk=walk)
+    data = numpy.frombuffer(buf, dtype=numpy.uint8, count=end - first_pos, offset=first_pos)
+    size = len(data)
+
+    # Sync candidates, and their frame lengths, end offsets, and bit rates.
+    sync = numpy.flatnonzero(data[:max(size - 3, 0)] == 0xff)
+    keys = (data[sync + 1].astype(numpy.int64) << 8) | data[sync + 2]
+    length_table, bit_rate_table = _frameInfoTables(header & _HEADER_CONSTANT_MASK)
+    lengths = length_table[keys]
+    ends = sync + lengths
+    # Not holding a reference to the buffer, a mapping can not be closed while it is exported.
+    del data
+    if not len(sync):
+        return FrameTable(offsets=sync, lengths=lengths, bit_rates=lengths, walk=walk)
+
+    count = len(sync)
+    valid = lengths > 0
+    # A valid frame that fits in the data
+    fits = valid & (ends <= size)
+    # The candidate index of the frame header following each candidate
+    nexts = numpy.minimum(numpy.searchsorted(sync, ends), count - 1)
+    has_next = valid & (sync[nexts] == ends) & valid[nexts]
+
+    # When a frame is not followed by a header, or is truncated, the walk resyncs on the next
+    # candidate that is followed by a header.
+    lost = numpy.where(fits, ends, sync)
+    confirmed = numpy.flatnonzero(has_next)
+    resync = numpy.searchsorted(sync[confirmed], lost, side="right")
+    resync = numpy.append(confirmed, count)[resync]
+    # The last index is a sentinel for the end of the walk.
+    successors = numpy.where(has_next, nexts, resync)
+    successors[fits & ~has_next & (ends + 4 > size)] = count
+    successors = numpy.append(successors, count)
+
+    # Each candidate has at most one successor, so successor tables for jumps of 1, 2, 4, ...
+    # candidates let the chain from the first candidate be gathered in O(log n) array
+    # operations. The first candidate is the header found by findHeader.
+    jumps = [successors]
+    while not (jumps[-1][:count] == count).all():
+        jumps.append(jumps[-1][jumps[-1]])
+
+    chain = numpy.zeros(1, dtype=numpy.int64)
+    for jump in jumps:
+        more = jump[chain]
+        more = more[more != count]
+        if not len(more):
+            break
+        chain = numpy.concatenate((chain, more))
+
+    # Resyncs, and the junk skipped
+    resyncs = chain[:-1][~has_next[chain[:-1]]]
+    walk.junk_bytes = int((sync[successors[resyncs]] - lost[resyncs]).sum())
+    if len(resyncs):
+        log.debug(f"MPEG frame sync lost {len(resyncs)} times, {walk.junk_bytes} bytes skipped")
+
+    frames = chain[fits[chain]]
+    if len(frames):
+        walk.audio_end = base + first_pos + int(ends[frames[-1]])
+        if frames[0] == 0 and _isInfoFrame(buf[first_pos:first_pos + _frameLength(header)]):
+            walk.info_frame = True
+            frames = frames[1:]
+
+    return FrameTable(offsets=sync[frames] + (base + first_pos), lengths=lengths[frames],
+                      bit_rates=bit_rate_table[keys[frames]], walk=walk)
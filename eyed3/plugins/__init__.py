@@ -1,6 +1,11 @@
+import io
 import os
 import sys
 import pathlib
+import contextlib
+import dataclasses
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 from eyed3 import core, utils
 from eyed3.utils.log import getLogger
@@ -92,6 +97,22 @@ def load(name=None, reload=False, paths=None):
     return _PLUGINS
 
 
+@dataclasses.dataclass
+class FileResult:
+    """The result of :meth:`Plugin.processFile` for the file ``path``, passed
+    from a worker process to :meth:`Plugin.mergeResult`. Plugins may store any
+    picklable per file data in ``value``."""
+    path: str
+    # The standard output and error written while the file was handled.
+    output: str = ""
+    errors: str = ""
+    # True when the file was loaded, see LoaderPlugin.
+    loaded: bool = False
+    # True when the file handler raised StopIteration.
+    stop: bool = False
+    value: object = None
+
+
 class Plugin(utils.FileHandler):
     """Base class for all eyeD3 plugins"""
 
@@ -104,6 +125,10 @@ class Plugin(utils.FileHandler):
     # A list of **at least** one name for invoking the plugin, values [1:] are treated as alias
     NAMES = []
 
+    # Plugins that can handle files in parallel, in worker processes (see the --jobs option),
+    # set this to True. See processFile and mergeResult.
+    PARALLEL = False
+
     def __init__(self, arg_parser):
         self.arg_parser = arg_parser
         self.arg_group = arg_parser.add_argument_group("Plugin options",
@@ -119,6 +144,34 @@ class Plugin(utils.FileHandler):
     def handleFile(self, f):
         pass
 
+    def processFile(self, f):
+        """Called, in a worker process, in place of ``handleFile`` when files
+        are handled in parallel (see ``PARALLEL``). A picklable
+        :class:`FileResult` is returned, and passed to :meth:`mergeResult` in
+        the main process. By default ``handleFile`` is called with its output
+        captured."""
+        result = FileResult(f)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                self.handleFile(f)
+            except StopIteration:
+                result.stop = True
+        result.output, result.errors = stdout.getvalue(), stderr.getvalue()
+        return result
+
+    def mergeResult(self, result):
+        """Called in the main process with each :meth:`processFile` result, in
+        the order the files were walked. By default the output captured for
+        the file is written. ``handleDirectory`` is called for each directory
+        after the results of its files are merged."""
+        if result.output:
+            sys.stdout.write(result.output)
+            sys.stdout.flush()
+        if result.errors:
+            sys.stderr.write(result.errors)
+            sys.stderr.flush()
+
     def handleDone(self):
         """Called after all file/directory processing; before program exit.
         The return value is passed to sys.exit (None results in 0)."""
@@ -150,16 +203,103 @@ class Plugin(utils.FileHandler):
 class LoaderPlugin(Plugin):
     """A base class that provides auto loading of audio files"""
 
-    def __init__(self, arg_parser, cache_files=False, track_images=False):
+    def __init__(self, arg_parser, cache_files=False, track_images=False, prefetch=0):
         """Constructor. If ``cache_files`` is True (off by default) then each
         AudioFile is appended to ``_file_cache`` during ``handleFile`` and
-        the list is cleared by ``handleDirectory``."""
+        the list is cleared by ``handleDirectory``. When ``prefetch`` is
+        greater than 0 up to that many of the files passed to
+        :meth:`prefetchFiles` are loaded ahead of ``handleFile``, in threads;
+        the --prefetch command line option overrides it."""
         super().__init__(arg_parser)
         self._num_loaded = 0
         self._file_cache = [] if cache_files else None
         self._dir_images = [] if track_images else None
         self.audio_file = None
 
+        self.prefetch = prefetch
+        self._prefetcher = None
+        self._upcoming = collections.deque()
+        # path -> (load arguments, Future)
+        self._prefetched = {}
+        # The core.load arguments of the last handleFile call, used for prefetching.
+        self._load_args = None
+        # path -> os.DirEntry, for the files of the current directory.
+        self._entries = {}
+
+    def start(self, args, config):
+        super().start(args, config)
+        if getattr(args, "prefetch", None) is not None:
+            self.prefetch = args.prefetch
+
+    def fileEntries(self, entries):
+        """Keeps the ``entries`` so their stat results are used when loading."""
+        self._entries = entries
+
+    def prefetchFiles(self, files):
+        """Begins loading the first ``self.prefetch`` ``files``, if prefetching.
+        Each time a file is handled the next one is started, so loading
+        overlaps with the handling of earlier files; files are still handled
+        in order."""
+        if self.prefetch <= 0:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = ThreadPoolExecutor(max_workers=self.prefetch,
+                                                  thread_name_prefix="eyed3-prefetch")
+
+        for _, future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
+        self._upcoming = collections.deque(files)
+        self._fillPrefetch()
+
+    def _fillPrefetch(self):
+        # The arguments are not known until the first file is handled.
+        if self._load_args is None:
+            return
+
+        args, kwargs = self._load_args
+        while self._upcoming and len(self._prefetched) < self.prefetch:
+            f = self._upcoming.popleft()
+            self._prefetched[f] = (self._load_args,
+                                   self._prefetcher.submit(self._coreLoad, f, args, kwargs))
+
+    def _load(self, f, args, kwargs):
+        # Files before ``f`` were not handled (e.g. excluded), they would hold prefetch slots.
+        if f in self._prefetched:
+            while next(iter(self._prefetched)) != f:
+                self._prefetched.pop(next(iter(self._prefetched)))[1].cancel()
+        elif f in self._upcoming:
+            for _, future in self._prefetched.values():
+                future.cancel()
+            self._prefetched = {}
+            while self._upcoming[0] != f:
+                self._upcoming.popleft()
+
+        pending = self._prefetched.pop(f, None)
+        if self._upcoming and self._upcoming[0] == f:
+            self._upcoming.popleft()
+
+        self._load_args = (args, kwargs)
+        if self._prefetcher is not None:
+            self._fillPrefetch()
+
+        if pending is not None:
+            load_args, future = pending
+            if load_args == self._load_args:
+                return future.result()
+            future.cancel()
+        return self._coreLoad(f, args, kwargs)
+
+    def _coreLoad(self, f, args, kwargs):
+        entry = self._entries.get(f)
+        if entry is not None:
+            try:
+                kwargs = dict(kwargs, stat_result=entry.stat())
+            except OSError:
+                # Left for core.load to report.
+                pass
+        return core.load(f, *args, **kwargs)
+
     def handleFile(self, f, *args, **kwargs):
         """Loads ``f`` and sets ``self.audio_file`` to an instance of
         :class:`eyed3.core.AudioFile` or ``None`` if an error occurred or the
@@ -169,7 +309,7 @@ class LoaderPlugin(Plugin):
         """
 
         try:
-            self.audio_file = core.load(f, *args, **kwargs)
+            self.audio_file = self._load(f, args, kwargs)
         except NotImplementedError as ex:
             # Frame decryption, for instance...
             printError(str(ex))
@@ -184,6 +324,23 @@ class LoaderPlugin(Plugin):
             if mt and mt.startswith("image/"):
                 self._dir_images.append(f)
 
+    def processFile(self, f):
+        result = super().processFile(f)
+        result.loaded = self.audio_file is not None
+
+        # Directories are handled by the main process, don't accumulate files here.
+        self.audio_file = None
+        if self._file_cache is not None:
+            self._file_cache = []
+        if self._dir_images is not None:
+            self._dir_images = []
+        return result
+
+    def mergeResult(self, result):
+        super().mergeResult(result)
+        if result.loaded:
+            self._num_loaded += 1
+
     def handleDirectory(self, d, _):
         """Override to make use of ``self._file_cache``. By default the list
         is cleared, subclasses should consider doing the same otherwise every
@@ -196,5 +353,12 @@ class LoaderPlugin(Plugin):
 
     def handleDone(self):
         """If no audio files were loaded this simply prints 'Nothing to do'."""
+        if self._prefetcher is not None:
+            for _, future in self._prefetched.values():
+                future.cancel()
+            self._prefetched = {}
+            self._prefetcher.shutdown(wait=False)
+            self._prefetcher = None
+
         if self._num_loaded == 0:
             printMsg("No audio files found.")
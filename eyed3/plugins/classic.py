@@ -5,12 +5,15 @@ from functools import partial
 from argparse import ArgumentTypeError
 
 from eyed3.plugins import LoaderPlugin
-from eyed3 import core, id3, mp3
+from eyed3 import core, id3, mp3, Error
 from eyed3.utils import makeUniqueFileName, b, formatTime
+from eyed3.utils.journal import Journal
 from eyed3.utils.console import (
     printMsg, printError, printWarning, boldText, getTtySize,
 )
 from eyed3.id3.frames import ImageFrame
+from eyed3.id3.padding import (getPaddingPolicy, HistoryPadding, PADDING_POLICIES,
+                               DEFAULT_PADDING)
 from eyed3.mimetype import guessMimetype
 
 from eyed3.utils.log import getLogger
@@ -275,6 +278,12 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
                 raise ArgumentTypeError("Play count out-of-range")
             return (email, rating, play_count)
 
+        def PaddingPolicyArg(spec):
+            try:
+                return getPaddingPolicy(spec)
+            except Error as ex:
+                raise ArgumentTypeError(str(ex))
+
         # Tag versions
         gid3.add_argument("-1", "--v1", action="store_const", const=id3.ID3_V1,
                           dest="tag_version", default=id3.ID3_ANY_VERSION,
@@ -416,6 +425,9 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
         gid3.add_argument("--no-max-padding", dest="max_padding",
                           action="store_const", const=None,
                           help=ARGS_HELP["--no-max-padding"])
+        gid3.add_argument("--padding-policy", dest="padding_policy", type=PaddingPolicyArg,
+                          metavar="POLICY[:ARG]", default=None,
+                          help=ARGS_HELP["--padding-policy"])
 
         _encodings = ["latin1", "utf8", "utf16", "utf16-be"]
         gid3.add_argument("--encoding", dest="text_encoding", default=None,
@@ -431,6 +443,40 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
         gid4.add_argument("--preserve-file-times", action="store_true",
                           dest="preserve_file_time",
                           help=ARGS_HELP["--preserve-file-times"])
+        gid4.add_argument("--journal", dest="journal", metavar="FILE",
+                          help=ARGS_HELP["--journal"])
+        gid4.add_argument("--dry-run", action="store_true", dest="dry_run",
+                          help=ARGS_HELP["--dry-run"])
+
+        self._journal = None
+        self._write_plans = []
+
+    def start(self, args, config):
+        super().start(args, config)
+
+        if self.args.journal and self.args.dry_run:
+            printWarning(f"Dry run, not using journal '{self.args.journal}'")
+        elif self.args.journal:
+            self._journal = Journal(self.args.journal)
+            for entry in self._journal.resume():
+                printWarning(f"Completed interrupted write of '{entry.path}'")
+
+    def handleDone(self):
+        if isinstance(self.args.padding_policy, HistoryPadding) and not self.args.dry_run:
+            self.args.padding_policy.save()
+
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+        if self.args.dry_run and self._write_plans:
+            plans = self._write_plans
+            num_in_place = len([p for p in plans if p.in_place])
+            printMsg(f"Dry run: {len(plans)} tags would be written, {num_in_place} in place "
+                     f"and {len(plans) - num_in_place} moving audio data; "
+                     f"{sum(p.bytes_written for p in plans)} bytes written and "
+                     f"{sum(p.bytes_moved for p in plans)} bytes of audio moved.")
+        return super().handleDone()
 
     def handleFile(self, f):
         parse_version = self.args.tag_version
@@ -474,7 +520,7 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
 
         self.printTag(self.audio_file.tag)
 
-        if self.args.write_images_dir:
+        if self.args.write_images_dir and not self.args.dry_run:
             for img in self.audio_file.tag.images:
                 if img.mime_type not in ImageFrame.URL_MIME_TYPE_VALUES:
                     img_path = "%s%s" % (self.args.write_images_dir,
@@ -491,8 +537,8 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
             # Use current tag version unless a convert was supplied
             version = (self.args.convert_version or
                        self.audio_file.tag.version)
-            printWarning("Writing ID3 version %s" %
-                         id3.versionToString(version))
+            printWarning("%s ID3 version %s" % ("Rendering" if self.args.dry_run else "Writing",
+                                                id3.versionToString(version)))
 
             # DEFAULT_MAX_PADDING is not set up as argument default,
             # because we don't want to rewrite the file if the user
@@ -501,13 +547,19 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
             if max_padding is True:
                 max_padding = DEFAULT_MAX_PADDING
 
-            self.audio_file.tag.save(
+            plan = self.audio_file.tag.save(
                     version=version, encoding=self.args.text_encoding,
                     backup=self.args.backup,
                     preserve_file_time=self.args.preserve_file_time,
-                    max_padding=max_padding)
-
-        if self.args.rename_pattern:
+                    max_padding=max_padding, journal=self._journal,
+                    dry_run=self.args.dry_run, padding_policy=self.args.padding_policy)
+            if self.args.dry_run:
+                self._write_plans.append(plan)
+                printWarning(self._getWritePlanSummary(plan))
+
+        if self.args.rename_pattern and self.args.dry_run:
+            printWarning("Dry run, not renaming file")
+        elif self.args.rename_pattern:
             # Handle file renaming.
             from eyed3.id3.tag import TagTemplate
             template = TagTemplate(self.args.rename_pattern)
@@ -521,6 +573,17 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
 
         printMsg(self._getHardRule(self.terminal_width))
 
+    @staticmethod
+    def _getWritePlanSummary(plan):
+        if plan.strategy is None:
+            how = "creating the file"
+        elif plan.in_place:
+            how = "in place"
+        else:
+            how = f"using {plan.strategy}, moving {plan.bytes_moved} bytes of audio"
+        return (f"Dry run, tag of {plan.tag_size} bytes ({plan.padding_size} bytes padding) "
+                f"replacing {plan.curr_tag_size} bytes would be written {how}")
+
     def printHeader(self, file_path):
         printMsg(self._getFileHeader(file_path, self.terminal_width))
         printMsg(self._getHardRule(self.terminal_width))
@@ -684,7 +747,7 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
                 printMsg("Description: %s" % obj.description)
                 printMsg("Filename: %s" % obj.filename)
                 printMsg("\n")
-                if self.args.write_objects_dir:
+                if self.args.write_objects_dir and not self.args.dry_run:
                     obj_path = "%s%s" % (self.args.write_objects_dir, os.sep)
                     if not os.path.isdir(obj_path):
                         raise IOError("Directory does not exist: %s" % obj_path)
@@ -751,7 +814,9 @@ optional. For example, 2012-03 is valid, 2012--12 is not.
             remove_version = id3.ID3_V2
             rm_str = "v2.x"
 
-        if remove_version:
+        if remove_version and self.args.dry_run:
+            printWarning(f"Dry run, not removing ID3 {rm_str} tag")
+        elif remove_version:
             status = id3.Tag.remove(tag.file_info.name, remove_version,
                                     preserve_file_time=self.args.preserve_file_time)
             printWarning(f"Removing ID3 {rm_str} tag: {'SUCCESS' if status else 'FAIL'}")
@@ -1149,6 +1214,14 @@ ARGS_HELP = {
                          "default padding (1 KiB) or max padding, whichever "
                          "is smaller.",
         "--no-max-padding": "Disable --max-padding altogether.",
+        "--padding-policy": "How much padding to write when a tag no longer fits "
+                            "its current size, or its padding exceeds --max-padding: "
+                            f"{', '.join(PADDING_POLICIES)}. "
+                            "An argument may follow the name, e.g. fixed:1024 (bytes), "
+                            "block:4096 (pad to a multiple of the block size), "
+                            "percent:25 (of the tag size), or history:FILE (the growth "
+                            "seen in past edits, stored in FILE). The default is "
+                            f"fixed:{DEFAULT_PADDING}.",
 
         "--force-update": "Rewrite the tag despite there being no edit "
                           "options.",
@@ -1165,6 +1238,17 @@ ARGS_HELP = {
                     "variables: " + _getTemplateKeys(),
         "--preserve-file-times": "When writing, do not update file "
                                  "modification times.",
+        "--journal": "Journal tag writes to FILE so that an interrupted run can "
+                     "be resumed, interrupted writes are completed when the "
+                     "same journal is used again. Files are never left "
+                     "partially written; files with multiple hard links are "
+                     "only written when their tag size does not change.",
+        "--dry-run": "Apply edits and render tags but do not write anything (tags, "
+                     "renames, removals, images, objects, the journal, or the "
+                     "padding history). The size of each tag, its "
+                     "padding, and whether it would be written in place or require "
+                     "moving the audio data is reported, with a summary of the bytes "
+                     "that would be written.",
         "--track-offset": "Increment/decrement the track number by [-]N. "
                           "This option is applied after --track=N is set.",
         "--composer": "Set the composer's name.",
@@ -12,6 +12,7 @@ log = getLogger(__name__)
 class ExtractPlugin(eyed3.plugins.LoaderPlugin):
     NAMES = ["extract"]
     SUMMARY = "Extract tags from audio files."
+    PARALLEL = True
 
     def __init__(self, arg_parser):
         super().__init__(arg_parser, cache_files=True, track_images=False)
@@ -22,6 +23,12 @@ class ExtractPlugin(eyed3.plugins.LoaderPlugin):
         self.arg_group.add_argument("--strip-padding", action="store_true",
                                     help="Exclude tag padding, if any.")
 
+    def start(self, args, config):
+        super().start(args, config)
+        if args.output_file:
+            # Each file's tag overwrites the output file, the last one walked must win.
+            self.PARALLEL = False
+
     def handleFile(self, f, *args, **kwargs):
         super().handleFile(f)
         if self.audio_file is None or self.audio_file.tag is None:
@@ -16,6 +16,7 @@ log = getLogger(__name__)
 class JsonTagPlugin(eyed3.plugins.LoaderPlugin):
     NAMES = ["json"]
     SUMMARY = "Outputs all tags as JSON."
+    PARALLEL = True
 
     def __init__(self, arg_parser):
         super().__init__(arg_parser, cache_files=True, track_images=False)
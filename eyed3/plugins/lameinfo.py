@@ -7,6 +7,7 @@ from eyed3.plugins import LoaderPlugin
 class LameInfoPlugin(LoaderPlugin):
     NAMES = ["lameinfo", "xing"]
     SUMMARY = "Outputs lame header (if one exists) for file."
+    PARALLEL = True
     DESCRIPTION = (
         "The 'lame' (or xing) header provides extra information about the mp3 "
         "that is useful to players and encoders but not officially part of "
@@ -353,6 +353,25 @@ class BitrateCounter(AudioStat):
         return keys
 
 
+class FrameBitrateCounter(AudioStat):
+    """Counts the bit rate of every MPEG frame, requires exact durations (i.e. frame walks)."""
+    def compute(self, audio_file):
+        if audio_file.type != AUDIO_MP3 or audio_file.info is None:
+            return
+
+        frame_walk = audio_file.info.frame_walk
+        if frame_walk:
+            for bit_rate, count in frame_walk.bit_rates.items():
+                if bit_rate not in self._key_names:
+                    self._key_names[bit_rate] = "%d kb/s" % bit_rate
+                self[bit_rate] += count
+                self["total"] += count
+
+    def _report(self):
+        print(Style.BRIGHT + Fore.YELLOW + "MP3 frame bitrates:" + Style.RESET_ALL)
+        super(FrameBitrateCounter, self)._report(most_common=True)
+
+
 class RuleViolationStat(Stat):
     def _report(self):
         print(Style.BRIGHT + Fore.YELLOW + "Rule Violations:" + Style.RESET_ALL)
@@ -385,6 +404,7 @@ class Id3ImageTypeCounter(AudioStat):
 class StatisticsPlugin(LoaderPlugin):
     NAMES = ['stats']
     SUMMARY = "Computes statistics for all audio files scanned."
+    PARALLEL = True
 
     def __init__(self, arg_parser):
         super(StatisticsPlugin, self).__init__(arg_parser)
@@ -392,7 +412,24 @@ class StatisticsPlugin(LoaderPlugin):
         self.arg_group.add_argument(
                 "--verbose", action="store_true", default=False,
                 help="Show details for each file with rule violations.")
+        self.arg_group.add_argument(
+                "--exact", action="store_true", dest="exact_duration", default=False,
+                help="Walk every MPEG frame for exact play times and bit rates, and count "
+                     "the bit rate of each frame. This is considerably faster with NumPy "
+                     "installed.")
+
+        self._rules = [Id3TagRules(),
+                       FileRule(),
+                       ArtworkRule(),
+                       BitrateRule(),
+                       Id3FrameRules(),
+                      ]
+
+    def start(self, args, config):
+        super(StatisticsPlugin, self).start(args, config)
+        self._initStats()
 
+    def _initStats(self):
         self._stats = []
         self._rules_stat = RuleViolationStat()
 
@@ -402,19 +439,15 @@ class StatisticsPlugin(LoaderPlugin):
         self._stats.append(Id3FrameCounter())
         self._stats.append(Id3ImageTypeCounter())
         self._stats.append(BitrateCounter())
+        if self.args.exact_duration:
+            self._stats.append(FrameBitrateCounter())
 
         self._score_sum = 0
         self._score_count = 0
         self._rules_log = {}
-        self._rules = [Id3TagRules(),
-                       FileRule(),
-                       ArtworkRule(),
-                       BitrateRule(),
-                       Id3FrameRules(),
-                      ]
 
     def handleFile(self, path):
-        super(StatisticsPlugin, self).handleFile(path)
+        super(StatisticsPlugin, self).handleFile(path, exact_duration=self.args.exact_duration)
         if not self.args.quiet:
             sys.stdout.write('.')
             sys.stdout.flush()
@@ -445,6 +478,28 @@ class StatisticsPlugin(LoaderPlugin):
 
         self._score_sum += total_score
 
+    def processFile(self, path):
+        # Each file's statistics are computed from zero, and added to the totals by mergeResult.
+        self._initStats()
+        result = super(StatisticsPlugin, self).processFile(path)
+        # Stat objects are Counters, which do not pickle their display names.
+        result.value = ([(dict(stat), stat._key_names) for stat in self._stats],
+                        dict(self._rules_stat), self._rules_log, self._score_sum,
+                        self._score_count)
+        return result
+
+    def mergeResult(self, result):
+        super(StatisticsPlugin, self).mergeResult(result)
+
+        stats, rules_stat, rules_log, score_sum, score_count = result.value
+        for stat, (counts, key_names) in zip(self._stats, stats):
+            stat.update(counts)
+            stat._key_names.update(key_names)
+        self._rules_stat.update(rules_stat)
+        self._rules_log.update(rules_log)
+        self._score_sum += score_sum
+        self._score_count += score_count
+
     def handleDone(self):
         if self._num_loaded == 0:
             super(StatisticsPlugin, self).handleDone()
@@ -19,6 +19,7 @@ if _have_yaml:
     class YamlTagPlugin(eyed3.plugins.LoaderPlugin):
         NAMES = ["yaml"]
         SUMMARY = "Outputs all tags as YAML."
+        PARALLEL = True
 
         def __init__(self, arg_parser):
             super().__init__(arg_parser, cache_files=True, track_images=False)
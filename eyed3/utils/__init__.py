@@ -5,7 +5,6 @@ import pathlib
 import logging
 import argparse
 import warnings
-import functools
 
 import deprecation
 
@@ -13,18 +12,6 @@ from ..utils.log import getLogger
 from .. import LOCAL_FS_ENCODING
 from ..__about__ import __version__, __release_name__, __version_txt__
 
-if hasattr(os, "fwalk"):
-    os_walk = functools.partial(os.fwalk, follow_symlinks=True)
-
-    def os_walk_unpack(w):
-        return w[0:3]
-
-else:
-    os_walk = functools.partial(os.walk, followlinks=True)
-
-    def os_walk_unpack(w):
-        return w
-
 log = getLogger(__name__)
 
 
@@ -43,62 +30,116 @@ def guessMimetype(filename, with_encoding=False):
         return retval, None
 
 
-def walk(handler, path, excludes=None, fs_encoding=LOCAL_FS_ENCODING, recursive=False):
-    """A wrapper around os.walk which handles exclusion patterns and multiple
-    path types (str, pathlib.Path, bytes).
-    """
+def excludesMatcher(excludes):
+    """Return a function matching a path against all the ``excludes`` regular
+    expressions (as ``re.match`` does), compiled as one alternation when
+    possible."""
+    if not excludes:
+        return lambda _p: False
+
+    excludes_re = [re.compile(e) for e in excludes]
+    # Joined expressions renumber groups, breaking backreferences, and global flags must lead.
+    if len(excludes_re) > 1 and not any(ex.groups or ex.flags & ~re.UNICODE
+                                        for ex in excludes_re):
+        return re.compile("|".join(f"(?:{e})" for e in excludes)).match
+    return lambda _p: any(ex.match(_p) for ex in excludes_re)
+
+
+def walkEntries(path, excludes=None, fs_encoding=LOCAL_FS_ENCODING, recursive=True):
+    """Walk the directory ``path``, with ``os.scandir``, yielding a
+    ``(directory, entries)`` pair for each directory, in the same (sorted, top
+    down) order as :func:`walk`. ``entries`` is the sorted list of
+    ``os.DirEntry`` objects for the files (following symbolic links) of the
+    directory not matching any of the ``excludes`` regular expressions. The
+    cached file type of each entry is used, so files are not stat'ed; their
+    ``stat()`` results are also cached. Directories that can not be read are
+    logged and skipped."""
     if isinstance(path, pathlib.Path):
         path = str(path)
     else:
         path = str(path, fs_encoding) if type(path) is not str else path
+    isExcluded = excludesMatcher(excludes)
 
-    excludes = excludes if excludes else []
-    excludes_re = []
-    for e in excludes:
-        excludes_re.append(re.compile(e))
+    pending = [path]
+    while pending:
+        root = pending.pop()
+        abs_root = os.path.abspath(root)
+        files, dirs = [], []
+        try:
+            with os.scandir(root) as scanner:
+                for entry in scanner:
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif (entry.is_file() and
+                                not isExcluded(os.path.join(abs_root, entry.name))):
+                            files.append(entry)
+                    except OSError as ex:
+                        log.debug(f"Skipping {entry.path}: {ex}")
+        except OSError as ex:
+            log.warning(f"Unable to read directory {root}: {ex}")
+            continue
+
+        files.sort(key=lambda e: e.name)
+        yield root, files
+
+        if recursive:
+            pending.extend(os.path.join(root, d) for d in sorted(dirs, reverse=True))
 
-    def _isExcluded(_p):
-        for ex in excludes_re:
-            match = ex.match(_p)
-            if match:
-                return True
-        return False
+
+def walk(handler, path, excludes=None, fs_encoding=LOCAL_FS_ENCODING, recursive=False):
+    """Walk ``path``, calling ``handler.handleFile`` for each file and
+    ``handler.handleDirectory`` for each directory with files, with the files
+    of each directory first passed to ``handler.fileEntries`` and
+    ``handler.prefetchFiles`` (see :class:`FileHandler`). Exclusion patterns
+    are handled, as are multiple path types (str, pathlib.Path, bytes).
+    Directories are read with :func:`walkEntries`.
+    """
+    if isinstance(path, pathlib.Path):
+        path = str(path)
+    else:
+        path = str(path, fs_encoding) if type(path) is not str else path
 
     if not os.path.exists(path):
         raise IOError(f"file not found: {path}")
-    elif os.path.isfile(path) and not _isExcluded(path):
-        # If not given a directory, invoke the handler and return
-        handler.handleFile(os.path.abspath(path))
+    elif not os.path.isdir(path):
+        if os.path.isfile(path) and not excludesMatcher(excludes)(path):
+            # If not given a directory, invoke the handler and return
+            handler.handleFile(os.path.abspath(path))
         return
 
-    for root, dirs, files in [os_walk_unpack(w) for w in os_walk(path)]:
-        root = root if type(root) is str else str(root, fs_encoding)
-        dirs.sort()
-        files.sort()
-        for f in list(files):
-            f_key = f
-            f = f if type(f) is str else str(f, fs_encoding)
-            f = os.path.abspath(os.path.join(root, f))
-
-            if not os.path.isfile(f) or _isExcluded(f):
-                files.remove(f_key)
-                continue
-
-            try:
+    for root, entries in walkEntries(path, excludes=excludes, recursive=recursive):
+        abs_root = os.path.abspath(root)
+        try:
+            files = [os.path.join(abs_root, entry.name) for entry in entries]
+            if files:
+                handler.fileEntries(dict(zip(files, entries)))
+                handler.prefetchFiles(files)
+            for f in files:
                 handler.handleFile(f)
-            except StopIteration:
-                return
-
-        if files:
-            handler.handleDirectory(root, files)
-
-        if not recursive:
-            break
+            if entries:
+                handler.handleDirectory(root, [e.name for e in entries])
+        except StopIteration:
+            return
 
 
 class FileHandler(object):
     """A handler interface for :func:`eyed3.utils.walk` callbacks."""
 
+    def fileEntries(self, entries):
+        """Called with a dict of the full paths of the files of a directory to
+        their ``os.DirEntry``, before ``prefetchFiles``. Handlers may use the
+        entries' cached ``stat()`` results rather than stat'ing the files
+        again, the default does nothing."""
+        pass
+
+    def prefetchFiles(self, files):
+        """Called with the full paths of the files of a directory before
+        ``handleFile`` is called for each, in the same order. Handlers may use
+        this to begin work on the files ahead of time, the default does
+        nothing."""
+        pass
+
     def handleFile(self, f):
         """Called for each file walked. The file ``f`` is the full path and
         the return value is ignored. If the walk should abort the method should
@@ -162,6 +203,13 @@ def requireBytes(*args):
     return _requireArgType(bytes, *args)
 
 
+def requireBytesLike(*args):
+    """Function decorator to enforce bytes-like (bytes, bytearray, or
+    memoryview) argument types.
+    """
+    return _requireArgType((bytes, bytearray, memoryview), *args)
+
+
 def formatTime(seconds, total=None, short=False):
     """
     Format ``seconds`` (number of seconds) as a string representation.
@@ -18,6 +18,11 @@
 ################################################################################
 import struct
 
+from .intcodec import _BYTE_BITS, bytes2int, bits2bytes
+
+# This module is retained for compatibility, the header parsing code uses the
+# faster :mod:`eyed3.utils.intcodec` functions.
+
 MAX_INT16 = (2 ** 16) // 2
 MIN_INT16 = -(MAX_INT16 - 1)
 
@@ -31,69 +36,27 @@ def bytes2bin(bites, sz=8):
         raise ValueError(f"Invalid sz value: {sz}")
 
     retval = []
-    for b in [bytes([b]) for b in bites]:
-        bits = []
-        b = ord(b)
-        while b > 0:
-            bits.append(b & 1)
-            b >>= 1
-
-        if len(bits) < sz:
-            bits.extend([0] * (sz - len(bits)))
-        elif len(bits) > sz:
-            bits = bits[:sz]
-
-        # Big endian byte order.
-        bits.reverse()
-        retval.extend(bits)
-
+    for b in bites:
+        retval.extend(_BYTE_BITS[b][8 - sz:])
     return retval
 
 
 def bin2bytes(x):
     """Convert an array of bits (MSB first) into a string of characters."""
-    bits = []
-    bits.extend(x)
-    bits.reverse()
-
-    i = 0
-    out = b''
-    multi = 1
-    ttl = 0
-    for b in bits:
-        i += 1
-        ttl += b * multi
-        multi *= 2
-        if i == 8:
-            i = 0
-            out += bytes([ttl])
-            multi = 1
-            ttl = 0
-
-    if multi > 1:
-        out += bytes([ttl])
-
-    out = bytearray(out)
-    out.reverse()
-    out = bytes(out)
-    return out
+    return bits2bytes(x)
 
 
 def bin2dec(x):
     """Convert ``x``, an array of "bits" (MSB first), to it's decimal value."""
-    bits = []
-    bits.extend(x)
-    bits.reverse()  # MSB
-
-    multi = 1
     value = 0
-    for b in bits:
-        value += b * multi
-        multi *= 2
+    for b in x:
+        value = (value << 1) + b
     return value
 
 
 def bytes2dec(bites, sz=8):
+    if sz == 8:
+        return bytes2int(bites)
     return bin2dec(bytes2bin(bites, sz))
 
 
@@ -116,7 +79,9 @@ def dec2bin(n, p=1):
 
 
 def dec2bytes(n, p=1):
-    return bin2bytes(dec2bin(n, p))
+    assert n >= 0
+    n = int(n)
+    return n.to_bytes(max((p + 7) // 8, (n.bit_length() + 7) // 8), "big")
 
 
 def bin2synchsafe(x):
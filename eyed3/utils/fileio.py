@@ -0,0 +1,480 @@
+"""File access helpers for reading and writing audio files."""
+import io
+import os
+import sys
+import mmap
+import errno
+import shutil
+import struct
+import tempfile
+import contextlib
+
+from ..utils.log import getLogger
+
+log = getLogger(__name__)
+
+_ZERO_BLOCK = memoryview(bytes(64 * 1024))
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):                 # pragma: nocover
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:                                             # pragma: nocover
+    _IOV_MAX = 1024
+
+
+class MappedFile:
+    """A read-only, file-like object for a memory mapped file.
+
+    The ``read``, ``seek``, and ``tell`` methods behave like those of a binary
+    file object but are served from the mapping, without system calls, and
+    ``find`` searches the whole file at once. The mapped region itself is
+    available as the ``buffer`` attribute. A ``ValueError`` is raised for
+    empty files, which cannot be mapped.
+    """
+    def __init__(self, fileobj):
+        self.name = fileobj.name
+        self.buffer = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, size=-1):
+        return self.buffer.read(size if size is not None else -1)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        self.buffer.seek(offset, whence)
+        return self.buffer.tell()
+
+    def tell(self):
+        return self.buffer.tell()
+
+    def find(self, sub, start=0, end=None):
+        """Return the lowest offset where ``sub`` is found, or -1."""
+        if end is None:
+            return self.buffer.find(sub, start)
+        return self.buffer.find(sub, start, end)
+
+    def __len__(self):
+        return len(self.buffer)
+
+    @property
+    def closed(self):
+        return self.buffer.closed
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class WriteBuffer:
+    """A list of bytes-like parts to be written to a file as one, with a single
+    ``os.writev`` call where supported (see :meth:`writeTo`). Parts are not
+    copied, and runs of zero bytes (e.g. tag padding) are added as views of a
+    shared block of zeros rather than allocated."""
+    def __init__(self, parts=None):
+        self.parts = []
+        self._size = 0
+        for part in parts or []:
+            self.append(part)
+
+    def append(self, data):
+        if len(data):
+            self.parts.append(data)
+            self._size += len(data)
+
+    def appendZeros(self, count):
+        while count > 0:
+            n = min(count, len(_ZERO_BLOCK))
+            self.append(_ZERO_BLOCK[:n])
+            count -= n
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.parts)
+
+    def getvalue(self):
+        """Return all the parts joined as ``bytes``."""
+        return b"".join(self.parts)
+
+    def writeTo(self, fp):
+        """Write all the parts to the binary file object ``fp`` at its current
+        position, returning the number of bytes written."""
+        try:
+            fd = fp.fileno()
+        except (io.UnsupportedOperation, AttributeError, ValueError):
+            fd = None
+        if fd is None or not hasattr(os, "writev"):
+            for part in self.parts:
+                fp.write(part)
+            return self._size
+
+        # Write to the descriptor at the file object's logical position, then
+        # reposition the (possibly buffered) file object after the data.
+        pos = fp.tell()
+        fp.flush()
+        os.lseek(fd, pos, os.SEEK_SET)
+        parts = [memoryview(part).cast("B") for part in self.parts]
+        while parts:
+            written = os.writev(fd, parts[:_IOV_MAX])
+            while parts and written >= len(parts[0]):
+                written -= len(parts.pop(0))
+            if written:
+                parts[0] = parts[0][written:]
+        fp.seek(pos + self._size)
+        return self._size
+
+
+@contextlib.contextmanager
+def openFile(path, fileobj=None, use_mmap=False):
+    """Context manager yielding a binary file object for reading ``path``.
+
+    When ``fileobj`` is not ``None`` it is rewound and used, and left open on
+    exit; otherwise ``path`` is opened and closed on exit. If ``use_mmap`` is
+    ``True`` a :class:`MappedFile` of the file is yielded instead, falling back
+    to the plain file object when the file can not be mapped (e.g. it is
+    empty).
+    """
+    with contextlib.ExitStack() as stack:
+        if fileobj is None:
+            fileobj = stack.enter_context(open(path, "rb"))
+        else:
+            fileobj.seek(0)
+
+        if use_mmap:
+            try:
+                fileobj = stack.enter_context(MappedFile(fileobj))
+            except (ValueError, OSError) as ex:
+                log.debug(f"Unable to mmap {path}, using file reads: {ex}")
+
+        yield fileobj
+
+
+# Strategies for :func:`replaceHead`.
+WRITE_IN_PLACE = "in-place"
+WRITE_SHIFT = "shift"
+WRITE_REWRITE = "rewrite"
+WRITE_STRATEGIES = (WRITE_IN_PLACE, WRITE_SHIFT, WRITE_REWRITE)
+
+# The block size used when moving file data.
+MOVE_BLOCK_SIZE = 8 * 1024 * 1024
+_TEMP_SUFFIX = ".tmp"
+
+
+def replaceHead(path, data, old_size, padding_size=0, strategy=None, sync=False,
+                allow_shift=False):
+    """Replace the first ``old_size`` bytes of the file ``path`` with ``data``
+    (bytes-like or a :class:`WriteBuffer`) followed by ``padding_size`` zero
+    bytes, leaving the remainder of the file (i.e. the audio) as is. The
+    strategy used is returned.
+
+    ``strategy`` is one of:
+
+    * ``WRITE_IN_PLACE``: overwrite the head; only possible when the new head
+      is exactly ``old_size`` bytes, otherwise ``ValueError`` is raised.
+    * ``WRITE_SHIFT``: move the rest of the file in place, in
+      ``MOVE_BLOCK_SIZE`` blocks, to make room for (or close the gap left by)
+      the new head and then overwrite it. Only the data after the head is
+      touched, once, but the file is left corrupt if interrupted.
+    * ``WRITE_REWRITE``: write the new file to a temporary file in the same
+      directory and atomically ``os.replace`` the original with it. The
+      original's permission bits, owner (when permitted), and extended
+      attributes are kept. Symbolic links are followed, the file linked to is
+      replaced. Files with more than one hard link can not be replaced without
+      splitting them from their other links, ``ValueError`` is raised unless
+      ``allow_shift`` is True, then they are shifted and ``WRITE_SHIFT`` is
+      returned.
+
+    When ``strategy`` is ``None``, ``WRITE_IN_PLACE`` is used if the sizes
+    match and ``WRITE_SHIFT`` otherwise. If ``sync`` is True the data (and the
+    directory entry, for ``WRITE_REWRITE``) is flushed to disk before
+    returning.
+    """
+    new_size = len(data) + padding_size
+    if strategy is None:
+        strategy = WRITE_IN_PLACE if new_size == old_size else WRITE_SHIFT
+    elif strategy not in WRITE_STRATEGIES:
+        raise ValueError(f"Invalid write strategy: {strategy}")
+    elif strategy == WRITE_IN_PLACE and new_size != old_size:
+        raise ValueError(f"Unable to write {new_size} bytes in place of {old_size}")
+
+    head = WriteBuffer(data if isinstance(data, WriteBuffer) else [data])
+    head.appendZeros(padding_size)
+
+    if strategy == WRITE_REWRITE and os.stat(path).st_nlink > 1:
+        if not allow_shift:
+            raise ValueError(f"Unable to rewrite {path}, it has multiple hard links")
+        log.debug(f"Not rewriting {path}, it has multiple hard links")
+        strategy = WRITE_SHIFT
+
+    log.debug(f"Replacing {old_size} byte head of {path} with {new_size} bytes ({strategy})")
+    if strategy == WRITE_REWRITE:
+        _rewrite(path, head, old_size, sync=sync)
+    else:
+        with open(path, "r+b") as fp:
+            writeHead(fp, head, old_size, sync=sync)
+
+    return strategy
+
+
+def writeHead(fp, data, old_size, padding_size=0, sync=False):
+    """Replace the first ``old_size`` bytes of ``fp``, a file object opened for
+    reading and writing, with ``data`` and ``padding_size`` zero bytes. The rest
+    of the file is moved when the size changes, i.e. the ``WRITE_IN_PLACE``
+    and ``WRITE_SHIFT`` strategies of :func:`replaceHead`."""
+    head = WriteBuffer(data if isinstance(data, WriteBuffer) else [data])
+    head.appendZeros(padding_size)
+
+    if len(head) != old_size:
+        _moveData(fp, old_size, len(head))
+    fp.seek(0)
+    head.writeTo(fp)
+    if sync:
+        fp.flush()
+        os.fsync(fp.fileno())
+
+
+def _moveData(fp, src, dest):
+    """Move the data of ``fp`` from offset ``src`` to the end of the file to
+    offset ``dest``, growing or truncating the file as needed."""
+    end = fp.seek(0, os.SEEK_END)
+    block = memoryview(bytearray(min(MOVE_BLOCK_SIZE, max(end - src, 1))))
+    delta = dest - src
+
+    if delta > 0:
+        # Growing, move blocks from the end backwards so none are overwritten before read.
+        pos = end
+        while pos > src:
+            n = min(len(block), pos - src)
+            pos -= n
+            fp.seek(pos)
+            n = fp.readinto(block[:n])
+            fp.seek(pos + delta)
+            fp.write(block[:n])
+    elif delta < 0:
+        pos = src
+        while pos < end:
+            fp.seek(pos)
+            n = fp.readinto(block)
+            if not n:
+                break
+            fp.seek(pos + delta)
+            fp.write(block[:n])
+            pos += n
+        fp.truncate(end + delta)
+
+
+def _tempPrefix(path):
+    dirname, basename = os.path.split(os.path.realpath(path))
+    return dirname, f".{basename}."
+
+
+def removeTempFiles(path):
+    """Remove temporary files left in the directory of ``path`` by an
+    interrupted ``WRITE_REWRITE`` of it, returning their paths."""
+    dirname, prefix = _tempPrefix(path)
+    removed = []
+    with os.scandir(dirname) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith(_TEMP_SUFFIX):
+                os.unlink(entry.path)
+                removed.append(entry.path)
+    return removed
+
+
+def _syncDir(dirname):
+    try:
+        fd = os.open(dirname, os.O_RDONLY)
+    except OSError:                                           # pragma: nocover
+        # e.g. Windows, where directories can not be opened.
+        return
+    try:
+        os.fsync(fd)
+    except OSError:                                           # pragma: nocover
+        pass
+    finally:
+        os.close(fd)
+
+
+def _copyOwnership(src, dest):
+    """Copy the permission bits, and where permitted the owner and extended
+    attributes, of ``src`` to ``dest``."""
+    shutil.copymode(src, dest)
+
+    src_stat = os.stat(src)
+    if hasattr(os, "chown"):
+        try:
+            os.chown(dest, src_stat.st_uid, src_stat.st_gid)
+        except OSError as ex:
+            log.debug(f"Unable to copy the owner of {src}: {ex}")
+
+    if hasattr(os, "listxattr"):
+        try:
+            names = os.listxattr(src)
+        except OSError:
+            names = []
+        for name in names:
+            try:
+                os.setxattr(dest, name, os.getxattr(src, name))
+            except OSError as ex:
+                log.debug(f"Unable to copy extended attribute {name} of {src}: {ex}")
+
+
+def _rewrite(path, head, old_size, sync=False):
+    # The file a symbolic link points to is replaced, not the link.
+    path = os.path.realpath(path)
+    dirname, prefix = _tempPrefix(path)
+    with tempfile.NamedTemporaryFile("wb", dir=dirname, prefix=prefix,
+                                     suffix=_TEMP_SUFFIX, delete=False) as tmp_file:
+        try:
+            head.writeTo(tmp_file)
+            with open(path, "rb") as src_file:
+                src_file.seek(old_size)
+                copyFileData(src_file, tmp_file)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+            _copyOwnership(path, tmp_file.name)
+        except BaseException:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+
+    try:
+        os.replace(tmp_file.name, path)
+    except BaseException:
+        os.unlink(tmp_file.name)
+        raise
+    if sync:
+        _syncDir(dirname)
+
+
+# Methods reported by :func:`copyFileData`.
+COPY_REFLINK = "reflink"
+COPY_FILE_RANGE = "copy_file_range"
+COPY_SENDFILE = "sendfile"
+COPY_BUFFERED = "buffered"
+
+_COPY_CHUNK_SIZE = 1024 * 512
+# Kernel copies are done in chunks no larger than this.
+_KERNEL_CHUNK_SIZE = 1024 * 1024 * 1024
+# Errors meaning a kernel copy method is not supported for the files; the next
+# method is tried.
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+                         errno.EOPNOTSUPP, errno.ENOTSUP, errno.ETXTBSY, errno.EPERM}
+# linux/fs.h: _IOW(0x94, 13, struct file_clone_range)
+_FICLONERANGE = 0x4020940d
+_FILE_CLONE_RANGE = struct.Struct("=qQQQ")
+
+try:
+    import fcntl
+    _HAVE_FCNTL = True
+except ImportError:                                           # pragma: nocover
+    _HAVE_FCNTL = False
+
+
+def copyFileData(src_fp, dest_fp):
+    """Copy ``src_fp``, from its current position to the end, to ``dest_fp`` at
+    its current position. Both are binary file objects and are left positioned
+    after the copied data. The method used to copy is returned:
+
+    * ``COPY_REFLINK``: the data blocks are shared (cloned) by the files, on
+      file systems such as Btrfs and XFS, and only when both positions are
+      block aligned.
+    * ``COPY_FILE_RANGE``: ``os.copy_file_range``, the kernel copies the data
+      (and NFS/SMB servers may do the copy server side).
+    * ``COPY_SENDFILE``: ``os.sendfile``, the kernel copies the data.
+    * ``COPY_BUFFERED``: the data is read and written in chunks, used when
+      neither file has a file descriptor or the methods above are unsupported.
+    """
+    try:
+        src_fd, dest_fd = src_fp.fileno(), dest_fp.fileno()
+    except (io.UnsupportedOperation, AttributeError, ValueError):
+        return _copyBuffered(src_fp, dest_fp, None)
+
+    dest_fp.flush()
+    src_pos, dest_pos = src_fp.tell(), dest_fp.tell()
+    remaining = max(os.fstat(src_fd).st_size - src_pos, 0)
+
+    method = COPY_BUFFERED
+    for copy_method, copier in ((COPY_REFLINK, _copyReflink),
+                                (COPY_FILE_RANGE, _copyFileRange),
+                                (COPY_SENDFILE, _copySendfile)):
+        if not remaining:
+            break
+        try:
+            copied = copier(src_fd, dest_fd, src_pos, dest_pos, remaining)
+        except OSError as ex:
+            if ex.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            log.debug(f"{copy_method} copy unsupported: {ex}")
+            continue
+        if copied is None:
+            continue
+
+        method = copy_method
+        src_pos += copied
+        dest_pos += copied
+        remaining -= copied
+
+    src_fp.seek(src_pos)
+    dest_fp.seek(dest_pos)
+    if remaining:
+        _copyBuffered(src_fp, dest_fp, remaining)
+        method = COPY_BUFFERED
+
+    log.debug(f"Copied file data using {method}")
+    return method
+
+
+def _copyBuffered(src_fp, dest_fp, count):
+    while count is None or count > 0:
+        data = src_fp.read(_COPY_CHUNK_SIZE if count is None
+                           else min(count, _COPY_CHUNK_SIZE))
+        if not data:
+            break
+        dest_fp.write(data)
+        if count is not None:
+            count -= len(data)
+    return COPY_BUFFERED
+
+
+def _copyReflink(src_fd, dest_fd, src_pos, dest_pos, count):
+    """Clone the rest of the source file, or return None when not possible."""
+    if not (_HAVE_FCNTL and sys.platform.startswith("linux")):
+        return None
+
+    block_size = os.fstat(dest_fd).st_blksize or 4096
+    if src_pos % block_size or dest_pos % block_size:
+        return None
+    # A length of 0 clones to the end of the source file.
+    fcntl.ioctl(dest_fd, _FICLONERANGE, _FILE_CLONE_RANGE.pack(src_fd, src_pos, 0, dest_pos))
+    return count
+
+
+def _kernelCopy(copy, count):
+    copied = 0
+    while copied < count:
+        n = copy(copied, min(count - copied, _KERNEL_CHUNK_SIZE))
+        if not n:
+            break
+        copied += n
+    return copied
+
+
+def _copyFileRange(src_fd, dest_fd, src_pos, dest_pos, count):
+    if not hasattr(os, "copy_file_range"):
+        return None
+    return _kernelCopy(lambda done, n: os.copy_file_range(src_fd, dest_fd, n,
+                                                          src_pos + done, dest_pos + done),
+                       count)
+
+
+def _copySendfile(src_fd, dest_fd, src_pos, dest_pos, count):
+    # Only Linux supports sendfile to regular files.
+    if not (hasattr(os, "sendfile") and sys.platform.startswith("linux")):
+        return None
+    os.lseek(dest_fd, dest_pos, os.SEEK_SET)
+    return _kernelCopy(lambda done, n: os.sendfile(dest_fd, src_fd, src_pos + done, n), count)
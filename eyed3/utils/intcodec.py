@@ -0,0 +1,93 @@
+"""Fast integer encoding and decoding for ID3 and MPEG headers.
+
+These functions replace the list-of-bits round trips of
+:mod:`eyed3.utils.binfuncs` (``bin2dec(bytes2bin(data))``, etc.) in header
+parsing and rendering. All functions accept any bytes-like object.
+"""
+import struct
+
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+
+# Byte value -> the tuple of its 8 bits, MSB first.
+_BYTE_BITS = tuple(tuple((n >> s) & 1 for s in range(7, -1, -1))
+                   for n in range(256))
+
+
+def bytes2int(bites):
+    """Decode big endian ``bites`` as an unsigned integer."""
+    sz = len(bites)
+    if sz == 4:
+        return _UINT32.unpack(bites)[0]
+    elif sz == 2:
+        return _UINT16.unpack(bites)[0]
+    elif sz == 1:
+        return bites[0]
+    return int.from_bytes(bites, "big")
+
+
+def int2bytes(n, sz=4):
+    """Encode the unsigned integer ``n`` as ``sz`` big endian bytes. A
+    ``ValueError`` is raised when ``n`` does not fit."""
+    try:
+        return int(n).to_bytes(sz, "big")
+    except OverflowError:
+        raise ValueError(f"Value {n} does not fit in {sz} bytes") from None
+
+
+def synchsafe2int(bites):
+    """Decode the synch-safe integer ``bites``, only the low 7 bits of each byte
+    are used (section 6.2 of the ID3 2.4 spec)."""
+    if len(bites) == 4:
+        n = _UINT32.unpack(bites)[0]
+        return (((n & 0x7f000000) >> 3) | ((n & 0x007f0000) >> 2) |
+                ((n & 0x00007f00) >> 1) | (n & 0x0000007f))
+
+    n = 0
+    for b in bites:
+        n = (n << 7) | (b & 0x7f)
+    return n
+
+
+def int2synchsafe(n, sz=4):
+    """Encode the integer ``n`` as ``sz`` synch-safe bytes. A ``ValueError`` is
+    raised when ``n`` does not fit in ``7 * sz`` bits."""
+    n = int(n)
+    if n < 0 or n >> (7 * sz):
+        raise ValueError(f"Invalid synch-safe value: {n}")
+
+    if sz == 4:
+        return _UINT32.pack(((n & 0x0fe00000) << 3) | ((n & 0x001fc000) << 2) |
+                            ((n & 0x00003f80) << 1) | (n & 0x0000007f))
+    return bytes((n >> (7 * i)) & 0x7f for i in range(sz - 1, -1, -1))
+
+
+def bitField(bites, start, length=1):
+    """Return the unsigned value of ``length`` bits beginning at bit ``start``
+    (MSB first) of ``bites``. An ``IndexError`` is raised if the field extends
+    beyond the data."""
+    total = len(bites) * 8
+    if start < 0 or length < 1 or start + length > total:
+        raise IndexError(f"Bit field [{start}:{start + length}] out of range "
+                         f"for {total} bits")
+    return ((int.from_bytes(bites, "big") >> (total - start - length)) &
+            ((1 << length) - 1))
+
+
+def bytes2bits(bites):
+    """Return a list of the bits (MSB first) of ``bites``."""
+    bits = []
+    for b in bites:
+        bits.extend(_BYTE_BITS[b])
+    return bits
+
+
+def bits2bytes(bits):
+    """Convert a list of bits (MSB first) into bytes. The bits are right
+    aligned, so a partial leading byte is zero filled."""
+    n = 0
+    count = 0
+    for b in bits:
+        n = (n << 1) | b
+        count += 1
+    return n.to_bytes((count + 7) // 8, "big")
@@ -0,0 +1,251 @@
+"""A write-ahead journal for crash-safe tag writes.
+
+Before a tag is written the journal records the file's current head (the
+existing tag) and the new tag, and flushes the record to disk. The tag is
+then written in place when it fits exactly, otherwise the file is atomically
+replaced (audio is never shifted in place, since an interrupted shift can not
+be recovered), and a commit record is added. Files with multiple hard links
+can not be replaced without splitting them from their other links, so only
+same sized writes of them are journaled. An interrupted run can be resumed,
+finishing the writes that were in progress, or rolled back, restoring every
+journaled file's original tag.
+"""
+import os
+import struct
+import zlib
+import threading
+import dataclasses
+
+from .. import Error
+from .fileio import replaceHead, removeTempFiles, WriteBuffer, WRITE_IN_PLACE, WRITE_REWRITE
+from .log import getLogger
+
+log = getLogger(__name__)
+
+_MAGIC = b"eyeD3JNL"
+_FORMAT_VERSION = 1
+_FILE_HEADER = struct.Struct(">8sB")
+# record type, sequence number, path length, original head length, new data length,
+# padding size
+_RECORD = struct.Struct(">BQIIQQ")
+_CRC = struct.Struct(">I")
+
+_PLAN = 1
+_COMMIT = 2
+_ROLLBACK = 3
+
+PENDING = "pending"
+COMMITTED = "committed"
+ROLLED_BACK = "rolled back"
+
+
+class JournalException(Error):
+    """Raised for invalid journals and for journaled files that were changed
+    by something else."""
+
+
+@dataclasses.dataclass
+class JournalEntry:
+    """A journaled write of ``data`` plus ``padding_size`` zero bytes over the
+    first ``len(original)`` bytes of the file ``path``, an absolute path."""
+    seq: int
+    path: str
+    original: bytes
+    data: bytes
+    padding_size: int
+    state: str = PENDING
+
+    @property
+    def old_size(self):
+        return len(self.original)
+
+    @property
+    def new_size(self):
+        return len(self.data) + self.padding_size
+
+
+class Journal:
+    """A journal file, created if it does not exist. Journals are append
+    only, use one per job. Writes may be made from multiple threads."""
+    def __init__(self, path):
+        self.path = str(path)
+        self.entries = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            self._read()
+            self._fp = open(self.path, "ab")
+        else:
+            self._fp = open(self.path, "wb")
+            self._fp.write(_FILE_HEADER.pack(_MAGIC, _FORMAT_VERSION))
+            self._sync()
+
+    def _read(self):
+        with open(self.path, "rb") as fp:
+            data = fp.read()
+
+        try:
+            magic, version = _FILE_HEADER.unpack_from(data)
+        except struct.error:
+            magic, version = None, None
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise JournalException(f"Invalid journal file: {self.path}")
+
+        offset = _FILE_HEADER.size
+        while offset < len(data):
+            try:
+                (rtype, seq, path_len, orig_len, data_len,
+                 padding_size) = _RECORD.unpack_from(data, offset)
+                end = offset + _RECORD.size + path_len + orig_len + data_len
+                (crc,) = _CRC.unpack_from(data, end)
+            except struct.error:
+                crc, end = None, None
+            if crc is None or crc != zlib.crc32(data[offset:end]):
+                # A record torn by a crash, it was not acted on.
+                log.warning(f"Truncating incomplete journal record at {offset}: {self.path}")
+                with open(self.path, "r+b") as fp:
+                    fp.truncate(offset)
+                break
+
+            pos = offset + _RECORD.size
+            if rtype == _PLAN:
+                path = os.fsdecode(data[pos:pos + path_len])
+                pos += path_len
+                original = data[pos:pos + orig_len]
+                pos += orig_len
+                self.entries[seq] = JournalEntry(seq, path, original, data[pos:end],
+                                                 padding_size)
+            elif rtype in (_COMMIT, _ROLLBACK) and seq in self.entries:
+                self.entries[seq].state = COMMITTED if rtype == _COMMIT else ROLLED_BACK
+            else:
+                raise JournalException(f"Invalid journal record at {offset}: {self.path}")
+
+            self._seq = max(self._seq, seq)
+            offset = end + _CRC.size
+
+    def _sync(self):
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    def _append(self, rtype, seq, path=b"", original=b"", data=b"", padding_size=0):
+        record = b"".join((_RECORD.pack(rtype, seq, len(path), len(original), len(data),
+                                        padding_size),
+                           path, original, data))
+        self._fp.write(record + _CRC.pack(zlib.crc32(record)))
+        self._sync()
+
+    def begin(self, path, data, old_size, padding_size=0):
+        """Record the planned write of ``data`` (bytes-like or a
+        :class:`eyed3.utils.fileio.WriteBuffer`) and ``padding_size`` zero
+        bytes over the first ``old_size`` bytes of ``path``, returning the
+        :class:`JournalEntry`. A :class:`JournalException` is raised, and
+        nothing recorded, for a write that changes the size of the head of a
+        file with multiple hard links."""
+        with open(path, "rb") as fp:
+            original = fp.read(old_size)
+        if len(original) != old_size:
+            raise JournalException(f"{path} is smaller than {old_size} bytes")
+        data = data.getvalue() if isinstance(data, WriteBuffer) else bytes(data)
+        if len(data) + padding_size != old_size and os.stat(path).st_nlink > 1:
+            raise JournalException(f"{path} has multiple hard links, unable to journal "
+                                   "a write that resizes its tag")
+
+        with self._lock:
+            self._seq += 1
+            entry = JournalEntry(self._seq, os.path.abspath(path), original, data,
+                                 padding_size)
+            self._append(_PLAN, entry.seq, os.fsencode(entry.path), original, data,
+                         padding_size)
+            self.entries[entry.seq] = entry
+        return entry
+
+    def commit(self, entry):
+        """Record that ``entry`` was written."""
+        with self._lock:
+            self._append(_COMMIT, entry.seq)
+            entry.state = COMMITTED
+
+    def write(self, path, data, old_size, padding_size=0):
+        """Journal and write a new head for ``path``, see :meth:`begin` and
+        :func:`eyed3.utils.fileio.replaceHead`. The write strategy used is
+        returned, ``WRITE_IN_PLACE`` or ``WRITE_REWRITE``; the audio is never
+        shifted, resizing writes of files with multiple hard links are refused
+        with a :class:`JournalException` before anything is written."""
+        entry = self.begin(path, data, old_size, padding_size=padding_size)
+        strategy = replaceHead(path, entry.data, old_size, padding_size=padding_size,
+                               strategy=(WRITE_IN_PLACE if entry.new_size == old_size
+                                         else WRITE_REWRITE),
+                               sync=True)
+        self.commit(entry)
+        return strategy
+
+    def pending(self):
+        """Return the entries that were begun but not committed."""
+        return [e for e in self.entries.values() if e.state == PENDING]
+
+    def committedPaths(self):
+        """Return the set of (absolute) paths with committed writes."""
+        return {e.path for e in self.entries.values() if e.state == COMMITTED}
+
+    def resume(self):
+        """Finish the pending writes of an interrupted run, returning their
+        entries. A :class:`JournalException` is raised if a file is in neither
+        its original nor new state."""
+        entries = self.pending()
+        for entry in entries:
+            log.info(f"Resuming journaled write of {entry.path}")
+            self._restore(entry, entry.data, entry.padding_size, entry.original)
+            self.commit(entry)
+        return entries
+
+    def rollback(self):
+        """Restore the original tags of all files written, or pending, in this
+        journal, most recent first, returning their entries."""
+        entries = [e for e in reversed(list(self.entries.values()))
+                   if e.state != ROLLED_BACK]
+        for entry in entries:
+            log.info(f"Rolling back journaled write of {entry.path}")
+            self._restore(entry, entry.original, 0, entry.data + bytes(entry.padding_size))
+            with self._lock:
+                self._append(_ROLLBACK, entry.seq)
+                entry.state = ROLLED_BACK
+        return entries
+
+    def _restore(self, entry, target, target_padding, other):
+        """Make the head of ``entry.path`` ``target`` plus ``target_padding``
+        zero bytes, when it is currently either that or ``other``."""
+        removeTempFiles(entry.path)
+        target_size = len(target) + target_padding
+
+        with open(entry.path, "rb") as fp:
+            head = fp.read(max(target_size, len(other)))
+
+        if entry.old_size == entry.new_size:
+            # Same sized heads are written in place, the audio was not touched. A write torn
+            # by a crash leaves a mix of the two heads.
+            target_head = target + bytes(target_padding)
+            if len(head) != target_size or any(h != t and h != o
+                                                for h, t, o in zip(head, target_head, other)):
+                raise JournalException(f"{entry.path} was modified, unable to restore it")
+            if head != target_head:
+                replaceHead(entry.path, target, target_size, padding_size=target_padding,
+                            strategy=WRITE_IN_PLACE, sync=True)
+            return
+
+        if head[:target_size] == target + bytes(target_padding):
+            return
+        elif head[:len(other)] == other:
+            replaceHead(entry.path, target, len(other), padding_size=target_padding,
+                        strategy=WRITE_REWRITE, sync=True)
+        else:
+            raise JournalException(f"{entry.path} was modified, unable to restore it")
+
+    def close(self):
+        self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,255 @@
+"""A persistent cache of loaded audio files, so unchanged files are not parsed again.
+
+When enabled (see :func:`enable`) :func:`eyed3.core.load` returns the
+:class:`eyed3.core.AudioFile` rebuilt from the cache, for files whose device,
+inode, size, and modification time are those recorded when it was cached.
+The cache is an SQLite database, by default ``$XDG_CACHE_HOME/eyeD3/scan.db``
+(``~/.cache/eyeD3/scan.db`` when ``XDG_CACHE_HOME`` is not set), that may be
+shared by processes. :meth:`eyed3.id3.tag.Tag.save` invalidates the entry for
+the file written.
+
+Entries hold plain data, not objects: the raw bytes of the tag and of the
+first MPEG frame, and the other audio info values as JSON. Tags are parsed
+from their bytes, skipping the file type detection, the search for the audio,
+and frame walks. The cache grows to about the total size of the tags loaded,
+images included; larger entries than ``max_entry_size`` are not cached.
+"""
+import io
+import os
+import json
+import threading
+
+from .log import getLogger
+
+_have_sqlite = False
+try:
+    import sqlite3
+    _have_sqlite = True
+except ImportError:
+    pass
+
+log = getLogger(__name__)
+
+
+def _defaultCachePath():
+    cache_home = (os.environ.get("XDG_CACHE_HOME") or
+                  os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_home, "eyeD3", "scan.db")
+
+
+DEFAULT_CACHE_PATH = _defaultCachePath()
+DEFAULT_MAX_ENTRY_SIZE = 1024 * 1024
+
+_SCHEMA_VERSION = 2
+# ``kind`` is NULL for files that are not audio, ``tag`` for files without a tag, and ``frame``
+# and ``info`` for files without audio info.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    options TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    kind TEXT,
+    tag BLOB,
+    frame BLOB,
+    info TEXT,
+    PRIMARY KEY (dev, ino, options)
+);
+CREATE INDEX IF NOT EXISTS files_path ON files (path);
+"""
+
+_MP3 = "mp3"
+_ID3 = "id3"
+
+_cache = None
+
+
+class ScanCache:
+    """The cache database ``path``, created if it does not exist. Cache
+    errors are logged, they never fail a load."""
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entry_size=DEFAULT_MAX_ENTRY_SIZE):
+        if not _have_sqlite:
+            raise RuntimeError("The scan cache requires Python's sqlite3 module")
+
+        self.path = str(path)
+        self.max_entry_size = max_entry_size
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Each statement is a transaction, and with WAL other processes may read while one writes.
+        self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS files")
+            self._db.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, path, stat_result, options):
+        """Return a ``(found, audio_file)`` pair for ``path``, loaded with
+        ``options`` (a tuple of the :func:`eyed3.core.load` ``tag_version``,
+        ``lazy``, and ``exact_duration`` arguments), where ``stat_result`` is
+        its current ``os.stat_result``. ``audio_file`` is rebuilt from the
+        cached data, and may be None for files that are not audio."""
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT size, mtime_ns, kind, tag, frame, info FROM files "
+                    "WHERE dev = ? AND ino = ? AND options = ?",
+                    (_int64(stat_result.st_dev), _int64(stat_result.st_ino),
+                     repr(options))).fetchone()
+            if row is None or (row[0], row[1]) != (stat_result.st_size, stat_result.st_mtime_ns):
+                return False, None
+            return True, _rebuild(str(path), stat_result, options, *row[2:])
+        except Exception as ex:
+            log.warning(f"Scan cache error for {path}: {ex}")
+            return False, None
+
+    def put(self, path, stat_result, options, audio_file, fileobj=None):
+        """Cache ``audio_file``, the result of loading ``path``, see
+        :meth:`get`. The cached bytes are read from ``fileobj``, the open
+        file, if given."""
+        try:
+            if fileobj is None:
+                with open(str(path), "rb") as fp:
+                    entry = _entry(audio_file, fp)
+            else:
+                entry = _entry(audio_file, fileobj)
+            if entry is None:
+                return
+            size = sum(len(v) for v in entry if v is not None)
+            if size > self.max_entry_size:
+                log.debug(f"Not caching {path}, {size} bytes")
+                return
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (_int64(stat_result.st_dev), _int64(stat_result.st_ino), repr(options),
+                     stat_result.st_size, stat_result.st_mtime_ns, str(path)) + entry)
+        except Exception as ex:
+            log.warning(f"Unable to cache {path}: {ex}")
+
+    def invalidate(self, path):
+        """Remove the entries for ``path``, and for the file it currently is."""
+        try:
+            try:
+                stat_result = os.stat(path)
+                dev, ino = _int64(stat_result.st_dev), _int64(stat_result.st_ino)
+            except OSError:
+                dev, ino = None, None
+            with self._lock:
+                self._db.execute("DELETE FROM files WHERE path = ? OR (dev = ? AND ino = ?)",
+                                 (str(path), dev, ino))
+        except Exception as ex:
+            log.warning(f"Unable to invalidate the scan cache for {path}: {ex}")
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._db.execute("DELETE FROM files")
+
+    def close(self):
+        # A connection inherited by a forked process is not used, nor closed, there.
+        if self._pid == os.getpid():
+            self._db.close()
+
+
+def _entry(audio_file, fp):
+    """Return the (kind, tag, frame, info) values of ``audio_file``, whose
+    bytes are read from ``fp``, or None for types that are not cached."""
+    from .. import mp3, id3
+
+    if audio_file is None:
+        return None, None, None, None
+    elif isinstance(audio_file, mp3.Mp3AudioFile):
+        kind = _MP3
+    elif isinstance(audio_file, id3.TagFile):
+        kind = _ID3
+    else:
+        return None
+
+    tag_data = None
+    if audio_file.tag is not None:
+        if audio_file.tag.isV2():
+            fp.seek(0)
+            tag_data = fp.read(audio_file.tag.file_info.tag_size)
+        else:
+            fp.seek(-128, os.SEEK_END)
+            tag_data = fp.read(128)
+
+    frame, info = None, None
+    if kind == _MP3 and audio_file.info is not None:
+        frame, state = audio_file.info._cacheState(fp)
+        info = json.dumps(state).encode("ascii")
+    return kind, tag_data, frame, info
+
+
+def _rebuild(path, stat_result, options, kind, tag_data, frame, info):
+    """Return the audio file of ``path`` from the values of :func:`_entry`."""
+    from .. import core, mp3, id3
+
+    if kind is None:
+        return None
+
+    tag = None
+    if tag_data is not None:
+        tag_version, lazy, _ = options
+        tag_file = io.BytesIO(tag_data)
+        tag_file.name = path
+        tag = id3.Tag()
+        if not tag.parse(tag_file, tag_version, lazy=lazy, stat_result=stat_result):
+            raise ValueError("Invalid cached tag")
+
+    if kind == _MP3:
+        audio_file = mp3.Mp3AudioFile.__new__(mp3.Mp3AudioFile)
+        audio_file.type = core.AUDIO_MP3
+        audio_file._info = (mp3.Mp3AudioInfo._fromCacheState(path, frame, json.loads(info))
+                            if frame is not None else None)
+    elif kind == _ID3:
+        audio_file = id3.TagFile.__new__(id3.TagFile)
+        audio_file.type = core.AUDIO_NONE
+        audio_file._info = None
+    else:
+        raise ValueError(f"Invalid cached file type: {kind}")
+    # As constructed by the class, without reading the file.
+    audio_file.path = path
+    audio_file._tag = tag
+    return audio_file
+
+
+def _int64(n):
+    # SQLite integers are signed 64 bits, device and inode numbers may not fit.
+    return n - (1 << 64) if n >= (1 << 63) else n
+
+
+def enable(path=DEFAULT_CACHE_PATH, max_entry_size=DEFAULT_MAX_ENTRY_SIZE):
+    """Use the cache ``path`` for all loads, returning the
+    :class:`ScanCache`."""
+    global _cache
+    disable()
+    _cache = ScanCache(path, max_entry_size=max_entry_size)
+    return _cache
+
+
+def disable():
+    """Stop using the cache, if one is enabled."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+
+def getCache():
+    """Return the enabled :class:`ScanCache`, or None."""
+    return _cache
+
+
+def invalidate(path):
+    """Invalidate the entries for ``path`` in the enabled cache, if any."""
+    if _cache is not None:
+        _cache.invalidate(path)
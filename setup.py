@@ -14,6 +14,7 @@ extras_require = \
 {'art-plugin': ['Pillow>=8.0.1,<10.0.0',
                 'pylast>=4.0.0,<5.0.0',
                 'requests>=2.25.0,<3.0.0'],
+ 'numpy': ['numpy>=1.17'],
  'test': ['pytest>=6.2.1,<7.0.0',
           'coverage[toml]>=5.3.1,<6.0.0',
           'pytest-cov>=2.10.1,<3.0.0',
@@ -34,6 +34,12 @@ class RedirectStdStreams(object):
             sys.stdout, sys.stderr = self._orig_stdout, self._orig_stderr
 
 
+def readFile(path):
+    """Returns the contents of the file ``path``."""
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
 class ExternalDataTestCase(unittest.TestCase):
     """Test case for external data files."""
     def setUp(self):
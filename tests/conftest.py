@@ -39,6 +39,30 @@ def id3tag():
     return Tag()
 
 
+@pytest.fixture(scope="function")
+def mp3file(tmpdir):
+    """A factory fixture for making test files in ``tmpdir``.
+    `mp3file(name, audio, title=None, tag=None)` writes ``tag`` (a new
+    eyed3.id3.Tag if only ``title`` is given), with ``title`` set, followed by
+    the ``audio`` bytes, and returns the path. With neither the file is only
+    ``audio``.
+    """
+    from eyed3.id3 import Tag
+
+    def func(name, audio, title=None, tag=None):
+        path = str(tmpdir / name)
+        if title or tag:
+            tag = tag or Tag()
+            if title:
+                tag.title = title
+            tag.save(path)
+        with open(path, "ab") as fp:
+            fp.write(audio)
+        return path
+
+    return func
+
+
 @pytest.fixture(scope="function")
 def image(tmpdir):
     img_file = _tempCopy(DATA_D / "CypressHill3TemplesOfBoom.jpg", tmpdir)
@@ -336,3 +336,49 @@ def test_ObjectFrame_no_mimetype(audiofile, id3tag):
         file = eyed3.load(audiofile.path)
         assert mock.call_count == 1
         assert file
+
+
+def test_unsyncData():
+    from eyed3.id3.frames import unsyncData, deunsyncData
+
+    assert unsyncData(b"") == b""
+    assert unsyncData(b"\xff\xfb\x90") == b"\xff\x00\xfb\x90"
+    assert unsyncData(b"\xff\x00") == b"\xff\x00\x00"
+    assert unsyncData(b"\xff\xff\xff") == b"\xff\x00\xff\x00\xff\x00"
+    assert unsyncData(b"\xff\x7f\xff\xdf") == b"\xff\x7f\xff\xdf"
+    assert unsyncData(memoryview(b"a\xff")) == b"a\xff\x00"
+
+    assert deunsyncData(b"\xff\x00\xfb\x90") == b"\xff\xfb\x90"
+    assert deunsyncData(b"\xff\x00\x00") == b"\xff\x00"
+    assert deunsyncData(memoryview(b"\xff\x00\xff\x00\xff\x00")) == b"\xff\xff\xff"
+
+    data = bytes(range(256)) * 4 + b"\xff\x00\x00\xff\xe0\xff"
+    assert deunsyncData(unsyncData(data)) == data
+    unsynced = unsyncData(data)
+    for i in range(len(unsynced) - 1):
+        if unsynced[i] == 0xff:
+            assert unsynced[i + 1] == 0 or unsynced[i + 1] < 0xe0
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_v24_unsync_format_data(tmpdir, compressed):
+    from eyed3.id3 import Tag
+
+    path = str(tmpdir / "unsync.id3")
+    text = "hello \xff\xfb " * 10
+    for unsync in (False, True):
+        tag = Tag()
+        tag.title = text
+        frame = tag.frame_set[b"TIT2"][0]
+        frame.header = FrameHeader(b"TIT2", ID3_V2_4)
+        frame.header.grouped = True
+        frame.header.data_length_indicator = True
+        frame.header.compressed = compressed
+        frame.group_id = 0xFF
+        frame.encoding = LATIN1_ENCODING
+        tag.save(path, version=ID3_V2_4, unsync=unsync)
+
+        frame = eyed3.load(path).tag.frame_set[b"TIT2"][0]
+        assert frame.text == text
+        assert frame.group_id == 0xFF
+        assert frame.data_len == len(text.encode("latin1")) + 1
@@ -2,6 +2,7 @@ import unittest
 import pytest
 from eyed3.id3.headers import *
 from eyed3.id3 import ID3_DEFAULT_VERSION, TagException
+from eyed3.utils.binfuncs import bin2bytes, bin2synchsafe, dec2bin
 
 from io import BytesIO
 
@@ -73,8 +74,13 @@ class TestTagHeader(unittest.TestCase):
     def testRenderWithUnsyncTrue(self):
         h = TagHeader()
         h.unsync = True
-        with pytest.raises(NotImplementedError):
-            h.render(100)
+        header = h.render(100)
+        assert header[5] == 0x80
+
+        h2 = TagHeader()
+        assert h2.parse(BytesIO(header))
+        assert h2.unsync
+        assert h2.tag_size == 100
 
     def testRender(self):
         h = TagHeader()
@@ -470,5 +476,38 @@ class TestFrameHeader(unittest.TestCase):
     def testRenderWithUnsyncTrue(self):
         h = FrameHeader(b"TIT2", ID3_DEFAULT_VERSION)
         h.unsync = True
-        with pytest.raises(NotImplementedError):
-            h.render(100)
+        header = h.render(100)
+        assert header[-2:] == b"\x00\x02"
+
+        h2 = FrameHeader.parse(BytesIO(header), ID3_DEFAULT_VERSION)
+        assert h2.unsync
+        assert h2.data_size == 100
+
+    def testParseBuffer(self):
+        for version in [(2, 3, 0), (2, 4, 0)]:
+            h = FrameHeader(b"TIT2", version)
+            h.grouped = True
+            data = b"junk" + h.render(300) + b"\x00" * 300
+            buf = memoryview(data)
+
+            h2 = FrameHeader.parseBuffer(buf, 4, version)
+            assert h2.id == b"TIT2"
+            assert type(h2.id) is bytes
+            assert h2.data_size == 300
+            assert h2.grouped
+            assert h2._flags == h._flags
+            assert FrameHeader.parse(BytesIO(data[4:]), version)._flags == h._flags
+
+            # Padding
+            assert FrameHeader.parseBuffer(buf, 14, version) is None
+
+        h = FrameHeader.parseBuffer(memoryview(b"TT2\x00\x01\x02"), 0, (2, 2, 0))
+        assert h.id == b"TIT2"
+        assert h.data_size == 258
+
+
+def test_ExtendedTagHeader_crc_padding():
+    from eyed3.id3.headers import _crc32
+    import binascii
+    for padding in (0, 1, 65536, 200001):
+        assert _crc32(b"frames", padding) == binascii.crc32(b"frames" + b"\x00" * padding)
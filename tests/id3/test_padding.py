@@ -0,0 +1,80 @@
+import pytest
+import eyed3
+from eyed3 import Error
+from eyed3.id3 import Tag
+from eyed3.id3.padding import (getPaddingPolicy, FixedPadding, BlockPadding,
+                               PercentPadding, HistoryPadding, DEFAULT_PADDING)
+
+
+def test_policies():
+    assert FixedPadding().padding(1000, 0) == DEFAULT_PADDING
+    assert FixedPadding(10).padding(1000, 0) == 10
+
+    block = BlockPadding(4096)
+    for tag_size in (1, 1000, 3840, 3841, 4096, 10000):
+        padding = block.padding(tag_size, 0)
+        assert (tag_size + padding) % 4096 == 0
+        assert DEFAULT_PADDING <= padding < 4096 + DEFAULT_PADDING
+
+    assert PercentPadding(25).padding(10000, 0) == 2500
+    assert PercentPadding(25).padding(100, 0) == DEFAULT_PADDING
+
+
+def test_HistoryPadding(tmpdir):
+    path = str(tmpdir / "history.json")
+    history = HistoryPadding(path, percentile=90, max_padding=5000)
+    assert history.padding(1000, 0) == DEFAULT_PADDING
+
+    for growth in [0] * 5 + [100, 200, 3000, 3000, 10000]:
+        history.record(1000 + growth, 1000)
+    history.record(500, 1000)
+    assert history.padding(1000, 0) == 3000
+    history.percentile = 95
+    assert history.padding(1000, 0) == 5000
+    history.percentile = 50
+    assert history.padding(1000, 0) == DEFAULT_PADDING
+
+    history.save()
+    assert list(HistoryPadding(path).growths) == list(history.growths)
+
+
+def test_getPaddingPolicy():
+    assert isinstance(getPaddingPolicy("fixed"), FixedPadding)
+    assert getPaddingPolicy("fixed:1024").size == 1024
+    assert getPaddingPolicy("block:8192").block_size == 8192
+    assert getPaddingPolicy("percent:12.5").percent == 12.5
+    for spec in ("bogus", "fixed:lots", "fixed:-100", "block:0", "percent:-1",
+                 "percent:nan", "percent:inf"):
+        with pytest.raises(Error):
+            getPaddingPolicy(spec)
+
+
+def test_save_padding_policy(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    tag = Tag()
+    tag.title = "War Ensemble"
+    tag.save(test_file, padding_policy=BlockPadding(4096))
+    with open(test_file, "ab") as fp:
+        fp.write(b"\xff\xfb\x90\x64" + b"\x00" * 1000)
+    assert tag.file_info.tag_size == 4096
+
+    # Fits, the policy is not used
+    tag = eyed3.load(test_file).tag
+    tag.artist = "Slayer"
+    plan = tag.save(padding_policy=FixedPadding(0), dry_run=True)
+    assert plan.in_place and plan.tag_size == 4096
+
+    tag.comments.set("X" * 5000)
+    plan = tag.save(padding_policy=BlockPadding(4096), dry_run=True)
+    assert plan.tag_size == 8192 and not plan.in_place
+    # max_padding limits the policy
+    plan = tag.save(padding_policy=PercentPadding(50), max_padding=100, dry_run=True)
+    assert plan.padding_size > 100
+    tag.comments.remove("")
+    plan = tag.save(padding_policy=PercentPadding(50), max_padding=100, dry_run=True)
+    assert plan.padding_size == 100
+
+    history = HistoryPadding()
+    tag.comments.set("X" * 5000)
+    tag.save(padding_policy=history)
+    assert len(history.growths) == 1 and history.growths[0] > 5000
@@ -7,7 +7,7 @@ import deprecation
 import eyed3
 from eyed3.core import Date
 from eyed3.id3 import frames
-from eyed3.id3 import Tag, ID3_DEFAULT_VERSION, ID3_V2_3, ID3_V2_4
+from eyed3.id3 import Tag, ID3_DEFAULT_VERSION, ID3_V1_0, ID3_V2_3, ID3_V2_4
 from .. import DATA_D
 
 
@@ -1268,3 +1268,254 @@ def testReleaseDate_v23_v24():
     assert b"XDOR" in tag.frame_set
     assert tag.original_release_date == date
     assert tag.release_date == Date.parse(str(date))
+
+
+def test_lazy_frame_decoding(tmpdir):
+    test_file = str(tmpdir / "lazy.id3")
+
+    tag = Tag()
+    tag.artist = "Slayer"
+    tag.title = "Raining Blood"
+    tag.images.set(3, b"\xff\xd8\xff\xe0" + b"\x00" * 1024, "image/jpeg")
+    tag.privates.set(b"data", b"owner")
+    tag.save(test_file)
+
+    tag = eyed3.load(test_file, lazy=True).tag
+    frame_set = tag.frame_set
+    assert dict.__len__(frame_set) == 0
+    assert tag.artist == "Slayer"
+    assert dict.__contains__(frame_set, b"TPE1")
+    assert not dict.__contains__(frame_set, b"APIC")
+
+    # New frames follow the lazily decoded ones
+    tag.privates.set(b"more", b"owner2")
+    assert [p.owner_id for p in tag.privates] == [b"owner", b"owner2"]
+
+    assert len(frame_set) == 4
+    assert tag.title == "Raining Blood"
+    assert tag.images[0].image_data == b"\xff\xd8\xff\xe0" + b"\x00" * 1024
+
+    # Saving decodes everything
+    tag = eyed3.load(test_file, lazy=True).tag
+    tag.album = "Reign in Blood"
+    tag.save()
+    tag = eyed3.load(test_file).tag
+    assert (tag.artist, tag.album) == ("Slayer", "Reign in Blood")
+    assert len(tag.images) == 1
+    assert len(tag.privates) == 1
+
+
+@pytest.mark.parametrize("version", [ID3_V2_3, ID3_V2_4])
+def test_unsync_save(tmpdir, version):
+    test_file = str(tmpdir / "unsync.id3")
+    img_data = b"\xff\xd8\xff\xe0" + b"\xff\x00" * 100 + b"\xff"
+
+    tag = Tag()
+    tag.title = "\xff\xff"
+    tag.images.set(3, img_data, "image/jpeg")
+    tag.save(test_file, version=version, unsync=True)
+
+    with open(test_file, "rb") as fp:
+        tag_bytes = fp.read()
+    assert tag_bytes[5] & 0x80
+    frame_bytes = tag_bytes[10:]
+    assert all(frame_bytes[i + 1] == 0 or frame_bytes[i + 1] < 0xe0
+               for i in range(len(frame_bytes) - 1) if frame_bytes[i] == 0xff)
+
+    tag = eyed3.load(test_file).tag
+    assert tag.header.unsync
+    assert tag.title == "\xff\xff"
+    assert tag.images[0].image_data == img_data
+
+    # Saving again without unsync
+    tag.save()
+    tag = eyed3.load(test_file).tag
+    assert not tag.header.unsync
+    assert tag.images[0].image_data == img_data
+
+
+@pytest.mark.parametrize("write_strategy", [None, "rewrite"])
+def test_save_write_strategy(tmpdir, write_strategy):
+    test_file = str(tmpdir / "test.mp3")
+    audio = b"\xff\xfb\x90\x64" + b"\xaa" * 4000
+    tag = Tag()
+    tag.title = "Angel of Death"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(audio)
+    tag_size = tag.file_info.tag_size
+
+    # Fits the padding
+    tag = eyed3.load(test_file).tag
+    tag.artist = "Slayer"
+    tag.save()
+    assert tag.file_info.tag_size == tag_size
+
+    # Grows the tag
+    tag = eyed3.load(test_file).tag
+    tag.comments.set("X" * (tag_size * 2))
+    tag.save(write_strategy=write_strategy)
+    assert tag.file_info.tag_size > tag_size
+
+    with open(test_file, "rb") as fp:
+        data = fp.read()
+    assert data[tag.file_info.tag_size:] == audio
+    tag = eyed3.load(test_file).tag
+    assert (tag.artist, tag.title) == ("Slayer", "Angel of Death")
+    assert tag.comments[0].text == "X" * (tag_size * 2)
+
+
+def test_save_reuses_tag_size(tmpdir, monkeypatch):
+    test_file = str(tmpdir / "test.mp3")
+    tag = Tag()
+    tag.title = "Necrophobic"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(b"\xff\xfb\x90\x64" + b"\x00" * 1000)
+
+    tag = eyed3.load(test_file).tag
+    assert tag.file_info.isCurrent()
+    tag.artist = "Slayer"
+
+    parsed = []
+    tag_parse = Tag.parse
+
+    def _parse(self, *args, **kwargs):
+        parsed.append(args)
+        return tag_parse(self, *args, **kwargs)
+
+    monkeypatch.setattr(Tag, "parse", _parse)
+    tag.save()
+    assert not parsed
+    assert tag.file_info.isCurrent()
+
+    # The file changed underneath, a larger tag was written
+    other = eyed3.load(test_file).tag
+    other.comments.set("X" * 4096)
+    other.save()
+    assert not tag.file_info.isCurrent()
+    parsed.clear()
+    tag.album = "Reign in Blood"
+    tag.save()
+    assert parsed
+
+    tag = eyed3.load(test_file).tag
+    assert (tag.artist, tag.album, tag.title) == ("Slayer", "Reign in Blood", "Necrophobic")
+    assert len(tag.comments) == 0
+
+
+def test_save_dry_run(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    audio = b"\xff\xfb\x90\x64" + b"\xaa" * 4000
+    tag = Tag()
+    tag.title = "Postmortem"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(audio)
+    with open(test_file, "rb") as fp:
+        orig_data = fp.read()
+    tag_size = tag.file_info.tag_size
+
+    tag = eyed3.load(test_file).tag
+    tag.artist = "Slayer"
+    plan = tag.save(dry_run=True)
+    assert (plan.path, plan.strategy, plan.curr_tag_size, plan.tag_size) == \
+        (test_file, "in-place", tag_size, tag_size)
+    assert plan.in_place and not plan.rewrite_required
+    assert (plan.bytes_moved, plan.bytes_written) == (0, tag_size)
+
+    tag.comments.set("X" * (tag_size * 2))
+    plan = tag.save(dry_run=True)
+    assert plan.strategy == "shift" and plan.rewrite_required
+    assert plan.tag_size > tag_size and plan.padding_size > 0
+    assert plan.bytes_moved == len(audio)
+    assert plan.bytes_written == plan.tag_size + len(audio)
+    assert tag.save(dry_run=True, write_strategy="rewrite").strategy == "rewrite"
+
+    plan = tag.save(dry_run=True, version=ID3_V1_0)
+    assert (plan.strategy, plan.curr_tag_size, plan.tag_size) == ("in-place", 0, 128)
+
+    new_file = str(tmpdir / "new.id3")
+    plan = tag.save(new_file, dry_run=True)
+    assert plan.path == new_file and plan.strategy is None
+    assert not os.path.exists(new_file)
+
+    with open(test_file, "rb") as fp:
+        assert fp.read() == orig_data
+    assert tag.file_info.name == test_file
+
+
+def test_save_dry_run_unchanged(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    tag = Tag()
+    tag.title = "Postmortem"
+    tag.recording_date = "1986-10-07"
+    tag.frame_set[b"TSOP"] = frames.TextFrame(b"TSOP", "Slayer")
+    tag.save(test_file, version=ID3_V2_4, encoding="utf8")
+
+    tag = eyed3.load(test_file).tag
+    header_state = dict(vars(tag.header))
+    frame_ids = sorted(tag.frame_set)
+    encodings = [f.encoding for f in tag.frame_set.getAllFrames()]
+
+    plan = tag.save(dry_run=True, version=ID3_V2_3, encoding="latin1", unsync=True,
+                    max_padding=0)
+    assert vars(tag.header) == header_state
+    assert sorted(tag.frame_set) == frame_ids
+    assert [f.encoding for f in tag.frame_set.getAllFrames()] == encodings
+    assert all(f.header.version == ID3_V2_4 for f in tag.frame_set.getAllFrames())
+
+    # The plan is that of the real save, version conversion included.
+    tag.save(version=ID3_V2_3, encoding="latin1", unsync=True, max_padding=0)
+    assert (plan.tag_size, plan.padding_size) == (tag.file_info.tag_size,
+                                                   tag.file_info.tag_padding_size)
+    assert b"TYER" in tag.frame_set and b"TDRC" not in tag.frame_set
+
+
+@pytest.mark.parametrize("strategy", [None, "shift", "rewrite", "in-place"])
+def test_remove(tmpdir, strategy):
+    test_file = str(tmpdir / "test.mp3")
+    audio = b"\xff\xfb\x90\x64" + bytes(range(256)) * 20
+    tag = Tag()
+    tag.title = "Dead Skin Mask"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(audio)
+    tag.save(version=ID3_V1_0)
+    tag_size = tag.file_info.tag_size
+
+    assert Tag.remove(test_file, strategy=strategy)
+    with open(test_file, "rb") as fp:
+        data = fp.read()
+
+    if strategy == "in-place":
+        assert len(data) == tag_size + len(audio)
+        assert data[tag_size:] == audio
+        assert data[:3] == b"ID3" and not any(data[10:tag_size])
+        tag = eyed3.load(test_file).tag
+        assert tag.isV2() and not tag.frame_set
+    else:
+        assert data == audio
+        assert eyed3.load(test_file).tag is None
+
+    assert not Tag.remove(test_file, version=ID3_V1_0)
+    with pytest.raises(ValueError):
+        Tag.remove(test_file, strategy="copy")
+
+
+def test_remove_rewrite_hard_link(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    tag = Tag()
+    tag.title = "Dead Skin Mask"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(b"\xff\xfb\x90\x64" + b"\x00" * 413)
+    tag.save(version=ID3_V1_0)
+    os.link(test_file, str(tmpdir / "hard.mp3"))
+    with open(test_file, "rb") as fp:
+        data = fp.read()
+
+    with pytest.raises(ValueError):
+        Tag.remove(test_file, strategy="rewrite")
+    with open(test_file, "rb") as fp:
+        assert fp.read() == data
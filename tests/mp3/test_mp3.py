@@ -72,6 +72,51 @@ def testFindHeader():
     assert header_int == 0xfffb9064
 
 
+def testFindHeaderConfirmed():
+    from eyed3.mp3.headers import findHeader, _SYNC_CHUNK_SIZE
+
+    # 128 kb/s, 44.1 kHz, MPEG 1 Layer III frames of 417 bytes.
+    frame = b"\xff\xfb\x90\x64" + b"\x00" * 413
+    # A valid header with nothing where its next frame should be.
+    junk = b"\x11" * 100 + b"\xff\xfb\x90\x64" + b"\x22" * 1000
+    # The second prefix puts the header across two read chunks.
+    for prefix in (b"", b"\x33" * (_SYNC_CHUNK_SIZE - 2 - len(junk))):
+        data = prefix + junk + frame * 3
+        (offset, header_int, header_bytes) = findHeader(BytesIO(data), 0)
+        assert offset == len(prefix + junk)
+        assert header_int == 0xfffb9064
+        assert header_bytes == b"\xff\xfb\x90\x64"
+
+        # Not found before start_pos
+        (offset, _, _) = findHeader(BytesIO(data), offset + 1)
+        assert offset == len(prefix + junk) + len(frame)
+
+    # With no confirmed header the first valid one is used.
+    (offset, header_int, _) = findHeader(BytesIO(junk), 0)
+    assert (offset, header_int) == (100, 0xfffb9064)
+
+
+def testFindHeaderMapped(tmpdir):
+    from eyed3.mp3.headers import findHeader
+    from eyed3.utils.fileio import MappedFile
+
+    data = (b'\x11\x12\x23' * 10000 +
+            b"\xff\xea\x00\x00" +  # false sync
+            b"\xfe\xff\xfb\x90\x64" +  # BOM
+            b"\xff\xfb\x90\x64" +
+            b"\x00" * 1024)
+    mp3_file = tmpdir / "mapped.mp3"
+    mp3_file.write_binary(data)
+
+    with open(str(mp3_file), "rb") as fp, MappedFile(fp) as mapped:
+        expected = findHeader(BytesIO(data), 0)
+        assert findHeader(mapped, 0) == expected
+        assert expected[0] == len(data) - 1028
+        assert expected[1] == 0xfffb9064
+
+        assert findHeader(mapped, len(data) - 1024) == (None, None, None)
+
+
 @unittest.skipIf(not os.path.exists(DATA_D), "test requires data files")
 def testBasicVbrMp3():
     audio_file = eyed3.load(os.path.join(DATA_D, "notag-vbr.mp3"))
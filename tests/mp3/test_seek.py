@@ -0,0 +1,115 @@
+import io
+import os
+import struct
+
+import pytest
+
+import eyed3
+from eyed3.mp3 import Mp3Exception
+from eyed3.mp3.seek import SeekIndex, SIDECAR_SUFFIX, SOURCE_XING, SOURCE_VBRI, SOURCE_WALK
+
+# MPEG 1 Layer III, 128 kb/s, 44.1 kHz, joint stereo frames of 417 bytes.
+FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+SECS_PER_FRAME = 1152 / 44100
+
+
+def _infoFrame(data):
+    # The Xing/VBRI data is 32 bytes after the frame header for (joint) stereo.
+    return (FRAME[:36] + data + FRAME[36 + len(data):])[:len(FRAME)]
+
+
+def testXingIndex(tmpdir):
+    num_frames = 200
+    toc = bytes(int(i * 256 / 100) for i in range(100))
+    xing = (b"Xing" + struct.pack(">III", 0x7, num_frames, num_frames * len(FRAME)) + toc)
+    mp3_file = tmpdir / "xing.mp3"
+    mp3_file.write_binary(_infoFrame(xing) + FRAME * num_frames)
+
+    audio_file = eyed3.load(str(mp3_file))
+    index = audio_file.info.seekIndex()
+    assert index.source == SOURCE_XING
+    assert len(index) == 100
+    assert index.offset(0) == 0
+    assert index.offset(-1) == 0
+    half = index.offset(audio_file.info.time_secs / 2)
+    assert abs(half - num_frames * len(FRAME) / 2) <= len(FRAME)
+    assert index.offset(audio_file.info.time_secs + 10) == index.audio_end
+    # The index is kept
+    assert audio_file.info.seekIndex() is index
+
+
+def testVbriIndex(tmpdir):
+    num_frames = 100
+    vbri = (b"VBRI" + struct.pack(">HHHII", 1, 0, 75, num_frames * len(FRAME), num_frames) +
+            struct.pack(">HHHH", 10, 1, 2, 10) +
+            b"".join(struct.pack(">H", 10 * len(FRAME)) for _ in range(10)))
+    mp3_file = tmpdir / "vbri.mp3"
+    mp3_file.write_binary(_infoFrame(vbri) + FRAME * num_frames)
+
+    audio_file = eyed3.load(str(mp3_file))
+    assert audio_file.info.vbri_header.toc == [10 * len(FRAME)] * 10
+    index = audio_file.info.seekIndex()
+    assert index.source == SOURCE_VBRI
+    assert len(index) == 10
+    assert index.offset(SECS_PER_FRAME * 20) == 20 * len(FRAME)
+    assert index.offset(SECS_PER_FRAME * 25) == 25 * len(FRAME)
+
+
+def testWalkIndex(tmpdir):
+    num_frames = 1000
+    mp3_file = tmpdir / "walk.mp3"
+    mp3_file.write_binary(b"\x00" * 50 + FRAME * num_frames + b"TAG" + b"\x00" * 125)
+
+    audio_file = eyed3.load(str(mp3_file))
+    index = audio_file.info.seekIndex(interval=2.0)
+    assert index.source == SOURCE_WALK
+    assert not index.interpolated
+    assert index.audio_start == 50
+    assert index.audio_end == 50 + num_frames * len(FRAME)
+    # A point every 2 seconds, 77 frames
+    assert len(index) == 13
+    assert index.points[1] == (77 * SECS_PER_FRAME, 50 + 77 * len(FRAME))
+    # Offsets are those of the frame at or before the time.
+    assert index.offset(10.0) == 50 + 4 * 77 * len(FRAME)
+    assert index.offset(10.1) == 50 + 5 * 77 * len(FRAME)
+    for secs in (0.5, 3.3, 19.9):
+        assert (index.offset(secs) - 50) % len(FRAME) == 0
+
+
+def testIndexSidecar(tmpdir):
+    mp3_file = tmpdir / "sidecar.mp3"
+    mp3_file.write_binary(FRAME * 500)
+    sidecar = str(mp3_file) + SIDECAR_SUFFIX
+
+    index = eyed3.load(str(mp3_file)).info.seekIndex(cache_path=sidecar)
+    assert os.path.getsize(sidecar) < 1024
+    loaded = SeekIndex.load(sidecar)
+    assert loaded == index
+    assert loaded.isCurrent(os.stat(str(mp3_file)))
+    assert eyed3.load(str(mp3_file)).info.seekIndex(cache_path=sidecar) == index
+
+    # Stale indexes are rebuilt
+    mp3_file.write_binary(FRAME * 600)
+    assert not loaded.isCurrent(os.stat(str(mp3_file)))
+    index = eyed3.load(str(mp3_file)).info.seekIndex(cache_path=sidecar)
+    assert index.audio_end == 600 * len(FRAME)
+    assert SeekIndex.load(sidecar) == index
+
+    with open(sidecar, "wb") as fp:
+        fp.write(b"garbage")
+    with pytest.raises(Mp3Exception):
+        SeekIndex.load(sidecar)
+
+
+def testStreamIndex(tmpdir, monkeypatch):
+    data = b"\x00" * 50 + FRAME * 200 + b"TAG" + b"\x00" * 125
+    # A file of the stream's name is not the stream.
+    monkeypatch.chdir(str(tmpdir))
+    (tmpdir / "upload.mp3").write_binary(FRAME * 10)
+
+    audio_file = eyed3.core.loadFileObj(io.BytesIO(data), "upload.mp3")
+    index = audio_file.info.seekIndex(cache_path=str(tmpdir / "upload.idx"))
+    assert index.source == SOURCE_WALK
+    assert (index.audio_start, index.audio_end) == (50, 50 + 200 * len(FRAME))
+    assert index.file_size == len(data)
+    assert not os.path.exists(str(tmpdir / "upload.idx"))
@@ -0,0 +1,91 @@
+from io import BytesIO
+
+import pytest
+
+import eyed3
+from eyed3.mp3.walk import walkFrames
+from eyed3.utils.fileio import MappedFile
+
+# MPEG 1 Layer III, 44.1 kHz frames; 128 kb/s is 417 bytes and 160 kb/s 522.
+FRAME_128 = b"\xff\xfb\x90\x64" + b"\x00" * 413
+FRAME_160 = b"\xff\xfb\xa0\x64" + b"\x00" * 518
+
+
+def testWalkFrames():
+    junk = b"\x11" * 10
+    data = junk + (FRAME_128 + FRAME_160) * 50 + b"APETAGEX" + b"\x00" * 100
+
+    walk = walkFrames(BytesIO(data))
+    assert walk.audio_start == len(junk)
+    assert walk.audio_end == len(junk) + 50 * (len(FRAME_128) + len(FRAME_160))
+    assert walk.frame_count == 100
+    assert walk.sample_count == 115200
+    assert walk.sample_freq == 44100
+    assert walk.bit_rates == {128: 50, 160: 50}
+    assert walk.vbr
+    assert walk.bit_rate == 144
+    assert not walk.info_frame
+    assert round(walk.time_secs, 3) == round(115200 / 44100, 3)
+
+    # Junk between frames is skipped, end_pos limits the walk.
+    data = FRAME_128 * 3 + b"\xff\x00junk" + FRAME_128 * 3 + b"TAG" + b"\x00" * 125
+    walk = walkFrames(BytesIO(data), end_pos=len(data) - 128)
+    assert walk.frame_count == 6
+    assert walk.junk_bytes == 6
+    assert walk.audio_end == len(data) - 128
+    assert not walk.vbr
+
+    # Xing frames are not audio
+    xing = FRAME_128[:36] + b"Xing" + FRAME_128[40:]
+    walk = walkFrames(BytesIO(xing + FRAME_128 * 4))
+    assert walk.info_frame
+    assert walk.frame_count == 4
+
+    assert walkFrames(BytesIO(b"\x00" * 1024)) is None
+
+
+def testExactDuration(tmpdir):
+    test_file = tmpdir / "exact.mp3"
+    # Trailing data throws off the estimated time.
+    test_file.write_binary(FRAME_128 * 100 + b"LYRICSBEGIN" + b"\x00" * 20000)
+
+    estimated = eyed3.load(str(test_file))
+    exact = eyed3.load(str(test_file), exact_duration=True)
+    assert estimated.info.frame_walk is None
+    assert exact.info.frame_walk.frame_count == 100
+    assert exact.info.time_secs == int(100 * 1152 / 44100 * 100) / 100
+    assert exact.info.time_secs < estimated.info.time_secs
+    assert exact.info.bit_rate == (False, 128)
+
+
+def testFrameTable(tmpdir):
+    numpy = pytest.importorskip("numpy")
+    from eyed3.mp3.walk import frameTable
+
+    xing = FRAME_128[:36] + b"Xing" + FRAME_128[40:]
+    data = (b"\x11" * 10 + xing + (FRAME_128 + FRAME_160) * 20 + b"\xff\xfb\x00junk" +
+            FRAME_160 * 5 + FRAME_128[:100])
+
+    table = frameTable(BytesIO(data))
+    assert len(table) == 45
+    assert table.walk.info_frame
+    assert table.offsets[0] == 10 + len(xing)
+    assert (numpy.diff(table.offsets)[:39] == table.lengths[:39]).all()
+    assert set(table.bit_rates.tolist()) == {128, 160}
+    assert table.summary() == walkFrames(BytesIO(data), use_numpy=False)
+    assert walkFrames(BytesIO(data)) == walkFrames(BytesIO(data), use_numpy=False)
+
+    assert frameTable(BytesIO(b"\x00" * 1024)) is None
+
+    # Frames past end_pos are not walked, mapped or read.
+    path = tmpdir / "table.mp3"
+    path.write_binary(data)
+    with open(str(path), "rb") as fp:
+        mapped = MappedFile(fp)
+        try:
+            for f in (mapped, BytesIO(data)):
+                table = frameTable(f, end_pos=5)
+                assert len(table) == 0 and table.summary().frame_count == 0
+                assert table.summary() == walkFrames(f, end_pos=5, use_numpy=False)
+        finally:
+            mapped.close()
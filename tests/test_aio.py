@@ -0,0 +1,94 @@
+import io
+import asyncio
+
+import pytest
+
+import eyed3
+from eyed3 import aio
+from eyed3.id3.tag import TagException
+
+AUDIO = (b"\xff\xfb\x90\x64" + b"\x00" * 413) * 10
+
+
+def test_load_save(mp3file):
+    path = mp3file("a.mp3", AUDIO, "Reign in Blood")
+
+    async def _edit():
+        audio_file = await aio.load(path)
+        audio_file.tag.artist = "Slayer"
+        return await aio.save(audio_file.tag)
+
+    asyncio.run(_edit())
+    tag = eyed3.load(path).tag
+    assert (tag.artist, tag.title) == ("Slayer", "Reign in Blood")
+
+
+def test_loadMany(tmpdir, mp3file):
+    paths = [mp3file(f"{i:02d}.mp3", AUDIO, f"Track {i}") for i in range(10)]
+    missing = str(tmpdir / "missing.mp3")
+
+    async def _paths():
+        for path in paths[:5] + [missing] + paths[5:]:
+            yield path
+
+    async def _loadAll(source, **kwargs):
+        return [(path, result) async for path, result in aio.loadMany(source, concurrency=3,
+                                                                      **kwargs)]
+
+    results = asyncio.run(_loadAll(_paths(), return_exceptions=True))
+    assert [path for path, _ in results] == paths[:5] + [missing] + paths[5:]
+    assert isinstance(results[5][1], IOError)
+    del results[5]
+    assert [f.tag.title for _, f in results] == [f"Track {i}" for i in range(10)]
+
+    with pytest.raises(IOError):
+        asyncio.run(_loadAll([missing] + paths))
+
+
+def test_loadStream(mp3file):
+    with open(mp3file("a.mp3", AUDIO, "Angel of Death"), "rb") as fp:
+        data = fp.read()
+
+    async def _chunks():
+        for i in range(0, len(data), 100):
+            yield data[i:i + 100]
+
+    async def _reader():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await aio.loadStream(reader, "upload.mp3")
+
+    for audio_file in (asyncio.run(aio.loadStream(data, "upload.mp3")),
+                       asyncio.run(aio.loadStream(_chunks(), "upload.mp3")),
+                       asyncio.run(_reader())):
+        assert audio_file.path == "upload.mp3"
+        assert audio_file.tag.title == "Angel of Death"
+        assert audio_file.info.time_secs == pytest.approx(0.26, abs=0.01)
+
+
+def test_loadStream_save(tmpdir, monkeypatch, mp3file):
+    with open(mp3file("a.mp3", AUDIO, "Angel of Death"), "rb") as fp:
+        data = fp.read()
+    # A file of the same name as the stream is not touched.
+    monkeypatch.chdir(str(tmpdir))
+    with open("upload.mp3", "wb") as fp:
+        fp.write(b"unrelated")
+
+    audio_file = asyncio.run(aio.loadStream(data, "upload.mp3"))
+    assert audio_file.stream and audio_file.tag.file_info.stream
+    with pytest.raises(TagException):
+        audio_file.tag.save()
+    audio_file.initTag()
+    with pytest.raises(TagException):
+        audio_file.tag.save()
+    with open("upload.mp3", "rb") as fp:
+        assert fp.read() == b"unrelated"
+
+    buf = io.BytesIO(data)
+    assert eyed3.core.loadFileObj(buf, "upload.mp3").tag.title == "Angel of Death"
+    assert not hasattr(buf, "name")
+
+    audio_file.tag.title = "Jesus Saves"
+    asyncio.run(aio.save(audio_file.tag, filename=str(tmpdir / "saved.mp3")))
+    assert eyed3.load(str(tmpdir / "saved.mp3")).tag.title == "Jesus Saves"
@@ -0,0 +1,67 @@
+import os
+import time
+
+import eyed3
+from eyed3 import batch
+from eyed3.id3 import ID3_V2_3
+from eyed3.utils.fileio import WRITE_IN_PLACE, WRITE_SHIFT
+
+AUDIO = b"\xff\xfb\x90\x64" + b"\x00" * 2000
+
+
+def test_editTags(tmpdir, mp3file):
+    files = [mp3file(f"{i:02d}.mp3", AUDIO, title=f"Track {i}") for i in range(10)]
+    untagged = mp3file("untagged.mp3", AUDIO)
+
+    def _addImage(tag):
+        tag.images.set(3, b"\xff\xd8\xff\xe0" + b"\x00" * 4096, "image/jpeg")
+
+    edits = [(path, {"artist": "Slayer", "track_num": (i + 1, 10)})
+             for i, path in enumerate(files[:-1])]
+    edits += [(files[-1], _addImage), (untagged, {"title": "Untitled"}),
+              (str(tmpdir / "missing.mp3"), {"title": "?"}), (files[0], {"bogus": 1})]
+
+    results = batch.editTags(edits, jobs=3)
+    assert [r.path for r in results] == [str(p) for p, _ in edits]
+
+    for i, result in enumerate(results[:9]):
+        assert result.ok and result.in_place and not result.rewritten
+        assert result.strategy == WRITE_IN_PLACE
+        tag = eyed3.load(result.path).tag
+        assert (tag.artist, tag.title, tuple(tag.track_num)) == ("Slayer", f"Track {i}",
+                                                                 (i + 1, 10))
+
+    assert results[9].rewritten and results[9].strategy == WRITE_SHIFT
+    assert len(eyed3.load(files[-1]).tag.images) == 1
+    assert results[10].ok and eyed3.load(untagged).tag.title == "Untitled"
+
+    assert not results[11].ok and isinstance(results[11].error, IOError)
+    assert not results[12].ok and isinstance(results[12].error, AttributeError)
+
+
+def test_iterEdits_generator(mp3file):
+    files = [mp3file(f"{i:02d}.mp3", AUDIO) for i in range(20)]
+    results = batch.iterEdits(((p, {"title": p}) for p in files), jobs=2,
+                              tag_version=ID3_V2_3)
+    for path, result in zip(files, results):
+        assert result.ok and result.path == path
+        tag = eyed3.load(path).tag
+        assert tag.version == ID3_V2_3 and tag.title == path
+
+
+def test_iterEdits_same_file(tmpdir, mp3file):
+    path = mp3file("a.mp3", AUDIO, title="Angel of Death")
+    link = str(tmpdir / "link.mp3")
+    os.symlink(path, link)
+
+    def _slowEdit(tag):
+        time.sleep(0.2)
+        tag.artist = "Slayer"
+
+    edits = [(path, _slowEdit), (path, {"album": "Reign in Blood"}),
+             (link, {"track_num": (1, 10)})]
+    results = batch.editTags(edits, jobs=3)
+    assert all(r.ok for r in results)
+    tag = eyed3.load(path).tag
+    assert (tag.title, tag.artist, tag.album, tuple(tag.track_num)) == \
+        ("Angel of Death", "Slayer", "Reign in Blood", (1, 10))
@@ -889,3 +889,65 @@ def test_removeUnknownTags(audiofile, eyeD3):
     assert audiofile.tag.frame_set[b"TSSE"] and len(audiofile.tag.frame_set[b"TSSE"]) == 1
     assert audiofile.tag.frame_set[b"TSSE"][0].unknown == False
     assert audiofile.tag.unknown_frame_ids == set()
+
+
+def test_dry_run(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    tag = id3.Tag()
+    tag.title = "Disciple"
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(b"\xff\xfb\x90\x64" + b"\x00" * 1000)
+    with open(test_file, "rb") as fp:
+        orig_data = fp.read()
+
+    with RedirectStdStreams() as out:
+        args, _, config = main.parseCommandLine(["--dry-run", "-a", "Slayer",
+                                                 "--remove-v1", test_file])
+        assert main.main(args, config) == 0
+
+    output = out.stdout.read() + out.stderr.read()
+    assert "Dry run, not removing ID3 v1.x tag" in output
+    assert "would be written in place" in output
+    assert "Dry run: 1 tags would be written, 1 in place" in output
+    with open(test_file, "rb") as fp:
+        assert fp.read() == orig_data
+
+
+def test_dry_run_no_side_files(tmpdir):
+    test_file = str(tmpdir / "test.mp3")
+    tag = id3.Tag()
+    tag.title = "Disciple"
+    tag.objects.set(b"Angel of Death", "text/plain", "lyrics", "lyrics.txt")
+    tag.save(test_file)
+    with open(test_file, "ab") as fp:
+        fp.write(b"\xff\xfb\x90\x64" + b"\x00" * 1000)
+    objects_dir = tmpdir / "objects"
+    objects_dir.mkdir()
+    orig_files = sorted(os.listdir(str(tmpdir)))
+    with open(test_file, "rb") as fp:
+        orig_data = fp.read()
+
+    with RedirectStdStreams() as out:
+        args, _, config = main.parseCommandLine(
+            ["--dry-run", "-a", "Slayer", "--journal", str(tmpdir / "journal"),
+             "--write-objects", str(objects_dir),
+             "--padding-policy", "history:" + str(tmpdir / "history.json"), test_file])
+        assert main.main(args, config) == 0
+
+    assert "Dry run, not using journal" in out.stdout.read() + out.stderr.read()
+    assert sorted(os.listdir(str(tmpdir))) == orig_files
+    assert not os.listdir(str(objects_dir))
+    with open(test_file, "rb") as fp:
+        assert fp.read() == orig_data
+
+
+def test_padding_policy_option():
+    from eyed3.id3.padding import BlockPadding
+    args, _, _ = main.parseCommandLine(["--padding-policy", "block:8192", "file.mp3"])
+    assert isinstance(args.padding_policy, BlockPadding)
+    assert args.padding_policy.block_size == 8192
+
+    with RedirectStdStreams():
+        with pytest.raises(SystemExit):
+            main.parseCommandLine(["--padding-policy", "bogus", "file.mp3"])
@@ -171,3 +171,103 @@ def test_Date():
     assert dp <= dp
 
     assert hash(dt) != hash(dp)
+
+
+def test_probe(tmpdir):
+    from eyed3.id3 import Tag, ID3_V1_1, ID3_V2_3, ID3_V2_4
+    from eyed3.mp3.headers import Mp3Header
+
+    test_file = Path(str(tmpdir)) / "probe.mp3"
+    # 128 kb/s, 44.1 kHz, MPEG 1 Layer III frames of 417 bytes.
+    mp3_frame = b"\xff\xfb\x90\x64" + b"\x00" * 413
+    test_file.write_bytes(mp3_frame * 10)
+
+    info = eyed3.probe(test_file)
+    assert eyed3.probe == core.probe
+    assert info.tag_version is None
+    assert info.mp3_header_pos == 0
+    assert info.mp3_header.bit_rate == 128
+    assert info.mp3_header.sample_freq == 44100
+
+    tag = Tag()
+    tag.title = "Probe"
+    tag.track_num = 1
+    tag.images.set(3, b"\xff\xd8\xff\xe0" + b"\x00" * 1000, "image/jpeg")
+    for version in (ID3_V2_3, ID3_V2_4):
+        tag.save(str(test_file), version=version)
+
+        info = core.probe(str(test_file))
+        audio_file = eyed3.load(test_file)
+        assert info.tag_version == version
+        assert info.tag_size == audio_file.tag.file_info.tag_size
+        assert info.padding_size == audio_file.tag.file_info.tag_padding_size
+        assert sorted(info.frame_ids) == [b"APIC", b"TIT2", b"TRCK"]
+        assert (b"APIC", len(audio_file.tag.images[0].render()) - 10) in info.frames
+        assert info.has_images
+        assert not info.has_v1_tag
+        assert info.mp3_header_pos == info.tag_size
+        assert isinstance(info.mp3_header, Mp3Header)
+        assert info.size_bytes == test_file.stat().st_size
+
+    tag.save(str(test_file), version=ID3_V1_1)
+    info = core.probe(test_file)
+    assert info.has_v1_tag
+    assert info.tag_version == ID3_V2_4
+
+    with pytest.raises(IOError):
+        core.probe("filedoesnotexist.txt")
+
+
+def test_load_single_open(tmpdir, monkeypatch):
+    import builtins
+    from eyed3.id3 import Tag
+
+    test_file = Path(str(tmpdir)) / "load.mp3"
+    test_file.write_bytes(b"\xff\xfb\x90\x64" + b"\x00" * 413)
+    tag = Tag()
+    tag.title = "One open"
+    tag.save(str(test_file))
+
+    opened, stated = [], []
+    real_open, real_stat = builtins.open, os.stat
+
+    def _open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    def _stat(*args, **kwargs):
+        stated.append(args[0])
+        return real_stat(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", _open)
+    monkeypatch.setattr(os, "stat", _stat)
+    audio_file = core.load(test_file)
+    monkeypatch.undo()
+
+    assert opened == [str(test_file)]
+    assert len(stated) == 1
+    assert audio_file.tag.title == "One open"
+    assert audio_file.info.size_bytes == test_file.stat().st_size
+    assert audio_file.tag.file_info.mtime == test_file.stat().st_mtime
+
+
+def test_load_mmap(tmpdir):
+    from eyed3.id3 import Tag, ID3_V1, ID3_V1_1
+
+    test_file = Path(str(tmpdir)) / "mmap.mp3"
+    test_file.write_bytes(b"\xff\xfb\x90\x64" + b"\x00" * 413)
+    tag = Tag()
+    tag.title = "Mapped"
+    tag.save(str(test_file))
+    tag.save(str(test_file), version=ID3_V1_1)
+
+    mapped = core.load(test_file, use_mmap=True)
+    read = core.load(test_file)
+    assert mapped.tag.title == read.tag.title == "Mapped"
+    assert mapped.tag.version == read.tag.version
+    assert mapped.tag.file_info.tag_size == read.tag.file_info.tag_size
+    assert mapped.info.mp3_header.bit_rate == read.info.mp3_header.bit_rate
+
+    v1 = core.load(test_file, tag_version=ID3_V1, use_mmap=True)
+    assert v1.tag.isV1()
+    assert v1.tag.title == "Mapped"
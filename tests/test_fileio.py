@@ -0,0 +1,130 @@
+import io
+import os
+import errno
+import stat
+
+import pytest
+from eyed3.utils import fileio
+from eyed3.utils.fileio import (replaceHead, WRITE_IN_PLACE, WRITE_SHIFT,
+                                WRITE_REWRITE, copyFileData, COPY_BUFFERED,
+                                COPY_SENDFILE, WriteBuffer)
+from . import readFile
+
+AUDIO = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def test_file(tmpdir):
+    path = str(tmpdir / "test.mp3")
+    with open(path, "wb") as fp:
+        fp.write(b"H" * 100 + AUDIO)
+    return path
+
+
+def test_replaceHead_in_place(test_file):
+    ino = os.stat(test_file).st_ino
+    assert replaceHead(test_file, b"N" * 60, 100, padding_size=40) == WRITE_IN_PLACE
+    assert readFile(test_file) == b"N" * 60 + b"\x00" * 40 + AUDIO
+    assert os.stat(test_file).st_ino == ino
+
+    with pytest.raises(ValueError):
+        replaceHead(test_file, b"N" * 60, 100, strategy=WRITE_IN_PLACE)
+    with pytest.raises(ValueError):
+        replaceHead(test_file, b"N" * 60, 100, strategy="copy")
+
+
+@pytest.mark.parametrize("head_size", [0, 10, 100, 5000, 20000])
+def test_replaceHead_shift(test_file, monkeypatch, head_size):
+    # Small blocks to exercise the block moves.
+    monkeypatch.setattr(fileio, "MOVE_BLOCK_SIZE", 1000)
+    ino = os.stat(test_file).st_ino
+
+    assert replaceHead(test_file, b"N" * head_size, 100) == \
+        (WRITE_SHIFT if head_size != 100 else WRITE_IN_PLACE)
+    assert readFile(test_file) == b"N" * head_size + AUDIO
+    assert os.stat(test_file).st_ino == ino
+
+
+def test_replaceHead_rewrite(test_file, tmpdir):
+    os.chmod(test_file, 0o640)
+    ino = os.stat(test_file).st_ino
+
+    assert replaceHead(test_file, b"N" * 200, 100, padding_size=100000,
+                       strategy=WRITE_REWRITE) == WRITE_REWRITE
+    assert readFile(test_file) == b"N" * 200 + b"\x00" * 100000 + AUDIO
+    assert os.stat(test_file).st_ino != ino
+    assert stat.S_IMODE(os.stat(test_file).st_mode) == 0o640
+    assert os.listdir(str(tmpdir)) == ["test.mp3"]
+
+
+def _unsupported(*args):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.mark.parametrize("unsupported, method", [
+    ((), None),
+    (("_copyReflink", "_copyFileRange"), COPY_SENDFILE),
+    (("_copyReflink", "_copyFileRange", "_copySendfile"), COPY_BUFFERED),
+])
+def test_copyFileData(test_file, tmpdir, monkeypatch, unsupported, method):
+    for name in unsupported:
+        monkeypatch.setattr(fileio, name, _unsupported)
+
+    dest_file = str(tmpdir / "dest")
+    with open(test_file, "rb") as src_fp, open(dest_file, "wb") as dest_fp:
+        src_fp.seek(100)
+        dest_fp.write(b"tag")
+        copied_with = copyFileData(src_fp, dest_fp)
+        if method:
+            assert copied_with == method
+        assert src_fp.tell() == len(AUDIO) + 100
+        assert dest_fp.tell() == len(AUDIO) + 3
+        dest_fp.write(b"end")
+
+    assert readFile(dest_file) == b"tag" + AUDIO + b"end"
+
+
+def test_copyFileData_buffered():
+    dest = io.BytesIO()
+    assert copyFileData(io.BytesIO(AUDIO), dest) == COPY_BUFFERED
+    assert dest.getvalue() == AUDIO
+
+
+def test_WriteBuffer(tmpdir, monkeypatch):
+    buf = WriteBuffer([b"ID3", b"", bytearray(b"frames")])
+    buf.appendZeros(100000)
+    buf.append(memoryview(b"end"))
+    assert len(buf) == 100012
+    assert buf.getvalue() == b"ID3frames" + b"\x00" * 100000 + b"end"
+
+    # writev, in batches, with the file object positioned after
+    monkeypatch.setattr(fileio, "_IOV_MAX", 2)
+    path = str(tmpdir / "buf")
+    with open(path, "wb") as fp:
+        fp.write(b"x")
+        assert buf.writeTo(fp) == len(buf)
+        assert fp.tell() == len(buf) + 1
+        fp.write(b"y")
+    assert readFile(path) == b"x" + buf.getvalue() + b"y"
+
+    fp = io.BytesIO()
+    buf.writeTo(fp)
+    assert fp.getvalue() == buf.getvalue()
+
+
+def test_replaceHead_rewrite_links(test_file, tmpdir):
+    link = str(tmpdir / "link.mp3")
+    os.symlink(test_file, link)
+    assert replaceHead(link, b"N" * 200, 100, strategy=WRITE_REWRITE) == WRITE_REWRITE
+    assert os.path.islink(link)
+    assert readFile(test_file) == b"N" * 200 + AUDIO
+
+    hard_link = str(tmpdir / "hard.mp3")
+    os.link(test_file, hard_link)
+    with pytest.raises(ValueError):
+        replaceHead(test_file, b"H" * 100, 200, strategy=WRITE_REWRITE)
+    assert readFile(hard_link) == b"N" * 200 + AUDIO
+    assert replaceHead(test_file, b"H" * 100, 200, strategy=WRITE_REWRITE,
+                       allow_shift=True) == WRITE_SHIFT
+    assert os.path.samefile(test_file, hard_link)
+    assert readFile(hard_link) == b"H" * 100 + AUDIO
@@ -0,0 +1,60 @@
+import pytest
+from eyed3.utils.binfuncs import bin2dec, bytes2bin
+from eyed3.utils.intcodec import *
+
+
+def test_bytes2int():
+    assert bytes2int(b"") == 0
+    assert bytes2int(b"\x7f") == 127
+    assert bytes2int(b"\x01\x00") == 256
+    assert bytes2int(b"\x00\x11\x22") == 0x1122
+    assert bytes2int(b"\x00\x11\x22\x33") == 1122867
+    assert bytes2int(memoryview(b"\xff\xff\xff\xff\xff")) == 2 ** 40 - 1
+
+
+def test_int2bytes():
+    assert int2bytes(1122867) == b"\x00\x11\x22\x33"
+    assert int2bytes(255, 1) == b"\xff"
+    with pytest.raises(ValueError):
+        int2bytes(256, 1)
+
+
+def test_synchsafe():
+    for n in (0, 1, 127, 128, 255, 16383, 16384, 2 ** 28 - 1):
+        data = int2synchsafe(n)
+        assert len(data) == 4
+        assert all(b < 0x80 for b in data)
+        assert synchsafe2int(data) == n
+        assert synchsafe2int(data) == bin2dec(bytes2bin(data, 7))
+
+    assert int2synchsafe(255) == b"\x00\x00\x01\x7f"
+    # 5 byte synch-safe values (the ext. header CRC)
+    assert synchsafe2int(int2synchsafe(2 ** 32 - 1, 5)) == 2 ** 32 - 1
+    # Only the lower 7 bits are used
+    assert synchsafe2int(b"\xff\xff\xff\xff") == 2 ** 28 - 1
+
+    with pytest.raises(ValueError):
+        int2synchsafe(2 ** 28)
+    with pytest.raises(ValueError):
+        int2synchsafe(-1)
+
+
+def test_bitField():
+    assert bitField(b"\xa5", 0) == 1
+    assert bitField(b"\xa5", 1) == 0
+    assert bitField(b"\xa5", 0, 4) == 0xa
+    assert bitField(b"\xa5", 4, 4) == 0x5
+    assert bitField(b"\x12\x34\x56", 0, 12) == 0x123
+    assert bitField(b"\x12\x34\x56", 12, 12) == 0x456
+
+    with pytest.raises(IndexError):
+        bitField(b"", 0)
+    with pytest.raises(IndexError):
+        bitField(b"\x00", 4, 5)
+
+
+def test_bits():
+    assert bytes2bits(b"\x80\x01") == [1] + [0] * 14 + [1]
+    assert bits2bytes([1] + [0] * 14 + [1]) == b"\x80\x01"
+    assert bits2bytes([1, 1]) == b"\x03"
+    assert bits2bytes([]) == b""
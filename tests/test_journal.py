@@ -0,0 +1,177 @@
+import os
+
+import pytest
+import eyed3
+from eyed3 import batch, main
+from eyed3.utils.fileio import WRITE_IN_PLACE, WRITE_REWRITE
+from eyed3.utils.journal import (Journal, JournalException, PENDING, COMMITTED,
+                                 ROLLED_BACK)
+from . import RedirectStdStreams, readFile
+
+AUDIO = b"\xff\xfb\x90\x64" + bytes(range(256)) * 8
+
+
+def test_write_resume_rollback(tmpdir):
+    path1 = str(tmpdir / "1.mp3")
+    path2 = str(tmpdir / "2.mp3")
+    for path in (path1, path2):
+        with open(path, "wb") as fp:
+            fp.write(b"O" * 10 + AUDIO)
+    journal_path = str(tmpdir / "journal")
+
+    with Journal(journal_path) as journal:
+        assert journal.write(path1, b"N" * 6, 10, padding_size=4) == WRITE_IN_PLACE
+        # A crash after the plan was recorded.
+        entry = journal.begin(path2, b"N" * 50, 10)
+        assert entry.state == PENDING
+    assert readFile(path1) == b"N" * 6 + b"\x00" * 4 + AUDIO
+    assert readFile(path2) == b"O" * 10 + AUDIO
+
+    with Journal(journal_path) as journal:
+        assert [e.path for e in journal.pending()] == [path2]
+        assert journal.committedPaths() == {path1}
+        assert [e.path for e in journal.resume()] == [path2]
+        assert readFile(path2) == b"N" * 50 + AUDIO
+        # Resuming again does nothing
+        assert journal.resume() == []
+
+    with Journal(journal_path) as journal:
+        assert not journal.pending()
+        assert journal.committedPaths() == {path1, path2}
+        assert [e.path for e in journal.rollback()] == [path2, path1]
+        assert all(e.state == ROLLED_BACK for e in journal.entries.values())
+    for path in (path1, path2):
+        assert readFile(path) == b"O" * 10 + AUDIO
+
+
+def test_resume_interrupted_rewrite(tmpdir):
+    path = str(tmpdir / "test.mp3")
+    with open(path, "wb") as fp:
+        fp.write(b"O" * 10 + AUDIO)
+
+    with Journal(str(tmpdir / "journal")) as journal:
+        journal.begin(path, b"N" * 20, 10)
+        # The rewrite's temp file was left behind.
+        with open(str(tmpdir / ".test.mp3.abc123.tmp"), "wb") as fp:
+            fp.write(b"N" * 20)
+
+    with Journal(str(tmpdir / "journal")) as journal:
+        journal.resume()
+    assert readFile(path) == b"N" * 20 + AUDIO
+    assert sorted(os.listdir(str(tmpdir))) == ["journal", "test.mp3"]
+
+
+def test_modified_and_torn(tmpdir):
+    path = str(tmpdir / "test.mp3")
+    journal_path = str(tmpdir / "journal")
+    with open(path, "wb") as fp:
+        fp.write(b"O" * 10 + AUDIO)
+
+    with Journal(journal_path) as journal:
+        journal.begin(path, b"N" * 20, 10)
+    with open(journal_path, "ab") as fp:
+        fp.write(b"\x01torn")
+    with open(path, "wb") as fp:
+        fp.write(b"X" * 10 + AUDIO)
+
+    with Journal(journal_path) as journal:
+        assert len(journal.pending()) == 1
+        with pytest.raises(JournalException):
+            journal.resume()
+
+    # The same size, written in place.
+    os.remove(journal_path)
+    with open(path, "wb") as fp:
+        fp.write(b"O" * 10 + AUDIO)
+    with Journal(journal_path) as journal:
+        journal.begin(path, b"N" * 10, 10)
+    with open(path, "r+b") as fp:
+        fp.write(b"NNNX")
+    with Journal(journal_path) as journal:
+        with pytest.raises(JournalException):
+            journal.resume()
+    # A torn write is finished.
+    with open(path, "r+b") as fp:
+        fp.write(b"NNNNOO")
+    with Journal(journal_path) as journal:
+        journal.resume()
+    assert readFile(path) == b"N" * 10 + AUDIO
+
+    with open(journal_path, "wb") as fp:
+        fp.write(b"garbage")
+    with pytest.raises(JournalException):
+        Journal(journal_path)
+
+
+def test_hard_links(tmpdir):
+    path = str(tmpdir / "test.mp3")
+    with open(path, "wb") as fp:
+        fp.write(b"O" * 10 + AUDIO)
+    hard_link = str(tmpdir / "hard.mp3")
+    os.link(path, hard_link)
+
+    with Journal(str(tmpdir / "journal")) as journal:
+        assert journal.write(path, b"N" * 10, 10) == WRITE_IN_PLACE
+        with pytest.raises(JournalException):
+            journal.write(path, b"R" * 50, 10)
+        assert [e.state for e in journal.entries.values()] == [COMMITTED]
+        assert os.path.samefile(path, hard_link)
+        assert readFile(hard_link) == b"N" * 10 + AUDIO
+
+        journal.rollback()
+    assert readFile(hard_link) == b"O" * 10 + AUDIO
+
+
+def test_save_journal(tmpdir, mp3file):
+    path = mp3file("test.mp3", AUDIO, "Raining Blood")
+    journal_path = str(tmpdir / "journal")
+
+    with Journal(journal_path) as journal:
+        tag = eyed3.load(path).tag
+        tag.artist = "Slayer"
+        assert tag.save(journal=journal) == WRITE_IN_PLACE
+        tag.images.set(3, b"\xff\xd8\xff\xe0" + b"\x00" * 4096, "image/jpeg")
+        assert tag.save(journal=journal) == WRITE_REWRITE
+        assert [e.state for e in journal.entries.values()] == [COMMITTED, COMMITTED]
+
+        tag = eyed3.load(path).tag
+        assert (tag.artist, tag.title, len(tag.images)) == ("Slayer", "Raining Blood", 1)
+        assert readFile(path).endswith(AUDIO)
+
+        journal.rollback()
+    tag = eyed3.load(path).tag
+    assert (tag.artist, tag.title, len(tag.images)) == (None, "Raining Blood", 0)
+
+
+def test_batch_journal(tmpdir, monkeypatch, mp3file):
+    files = [mp3file(f"{i}.mp3", AUDIO, f"Track {i}") for i in range(4)]
+    journal_path = str(tmpdir / "journal")
+    # Committed files are skipped by relative path too.
+    monkeypatch.chdir(str(tmpdir))
+
+    with Journal(journal_path) as journal:
+        results = batch.editTags([(p, {"artist": "Slayer"}) for p in files[:2]],
+                                 jobs=2, journal=journal)
+        assert all(r.ok and not r.skipped for r in results)
+
+    with Journal(journal_path) as journal:
+        results = batch.editTags([(os.path.basename(p), {"album": "Hell Awaits"})
+                                  for p in files],
+                                 jobs=2, journal=journal)
+    assert [r.skipped for r in results] == [True, True, False, False]
+    assert [eyed3.load(p).tag.album for p in files] == [None, None, "Hell Awaits",
+                                                        "Hell Awaits"]
+
+
+def test_classic_journal(tmpdir, mp3file):
+    path = mp3file("test.mp3", AUDIO, "Raining Blood")
+    journal_path = str(tmpdir / "journal")
+
+    with RedirectStdStreams():
+        args, _, config = main.parseCommandLine(["--journal", journal_path,
+                                                 "-a", "Slayer", path])
+        assert main.main(args, config) == 0
+
+    assert eyed3.load(path).tag.artist == "Slayer"
+    with Journal(journal_path) as journal:
+        assert journal.committedPaths() == {path}
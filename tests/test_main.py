@@ -97,3 +97,45 @@ def testLoggingOptions():
 @deprecation.fail_if_not_removed
 def testConfigFileDeprecation():
     main._deprecatedConfigFileCheck(None)
+
+
+def testPrefetchExcludes(tmpdir, monkeypatch):
+    from eyed3.plugins import LoaderPlugin
+
+    prefetched = []
+    monkeypatch.setattr(LoaderPlugin, "prefetchFiles",
+                        lambda self, files: prefetched.append(files))
+    paths = [str(tmpdir / name) for name in ("a.mp3", "b.mp3", "c.mp3")]
+    for path in paths:
+        with open(path, "wb"):
+            pass
+
+    args, _, config = main.parseCommandLine(["-P", "stats", "--prefetch", "2",
+                                             "--exclude", r".*/b\.mp3$"] + paths)
+    with RedirectStdStreams():
+        main.main(args, config)
+    assert prefetched == [[paths[0], paths[2]]]
+
+
+def testNegativeJobs():
+    for opt in ("--jobs", "--prefetch"):
+        with open("/dev/null", "w") as devnull:
+            with RedirectStdStreams(stderr=devnull):
+                try:
+                    main.parseCommandLine([opt, "-1", "."])
+                except SystemExit as ex:
+                    assert ex.code == 2
+                else:
+                    assert False, f"{opt} -1 accepted"
+
+
+def testJobsNotSupported(tmpdir):
+    path = str(tmpdir / "a.mp3")
+    with open(path, "wb"):
+        pass
+
+    args, _, config = main.parseCommandLine(["-P", "classic", "--jobs", "2", path])
+    with RedirectStdStreams() as out:
+        main.main(args, config)
+    assert ("classic plugin does not support --jobs, files will be handled serially"
+            in out.stdout.read() + out.stderr.read())
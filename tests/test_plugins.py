@@ -32,3 +32,54 @@ def test_Plugin():
     assert p.handleFile("f.txt") is None
     assert p.handleDone() is None
 
+
+def test_LoaderPlugin_prefetch(tmpdir, monkeypatch):
+    import os
+    import argparse
+    import threading
+    from eyed3 import core
+    from eyed3.utils import walk
+
+    loads = []
+    def _load(path, *args, **kwargs):
+        loads.append((path, kwargs, threading.current_thread().name))
+        return path
+
+    monkeypatch.setattr(core, "load", _load)
+    for i in range(5):
+        (tmpdir / f"{i}.mp3").write_text("", "utf8")
+
+    class MyPlugin(LoaderPlugin):
+        def __init__(self, arg_parser):
+            super().__init__(arg_parser, prefetch=2)
+            self.handled = []
+
+        def handleFile(self, f):
+            super().handleFile(f, tag_version=(2, 4, 0))
+            self.handled.append(self.audio_file)
+
+    p = MyPlugin(argparse.ArgumentParser())
+    p.start(argparse.Namespace(prefetch=None), None)
+    walk(p, str(tmpdir))
+    p.handleDone()
+
+    paths = [str(tmpdir / f"{i}.mp3") for i in range(5)]
+    assert p.handled == paths
+    # The first file is loaded when handled, and with its arguments the rest ahead of time.
+    assert sorted(path for path, _, _ in loads) == paths
+    # With the stat results of the walked directory entries.
+    assert all(kwargs["tag_version"] == (2, 4, 0) and
+               kwargs["stat_result"] == os.stat(path) for path, kwargs, _ in loads)
+    assert all(name.startswith("eyed3-prefetch") == (path != paths[0])
+               for path, _, name in loads)
+
+    # Files that are not handled, e.g. excluded, do not hold prefetch slots.
+    loads.clear()
+    p.prefetchFiles(paths)
+    for path in (paths[0], paths[3], paths[4]):
+        p.handleFile(path)
+    assert p.handled[-3:] == [paths[0], paths[3], paths[4]]
+    assert [name.startswith("eyed3-prefetch") for path, _, name in loads
+            if path == paths[4]] == [True]
+    assert not p._prefetched and not p._upcoming
+    p.handleDone()
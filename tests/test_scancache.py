@@ -0,0 +1,173 @@
+import os
+import json
+import pickle
+import sqlite3
+
+import pytest
+
+import eyed3
+from eyed3 import core
+from eyed3.id3 import Tag, ID3_V1_1
+from eyed3.utils import scancache
+
+AUDIO = (b"\xff\xfb\x90\x64" + b"\x00" * 413) * 10
+
+
+@pytest.fixture
+def cache(tmpdir):
+    cache = scancache.enable(str(tmpdir / "cache" / "scan.db"))
+    yield cache
+    scancache.disable()
+
+
+def _tag():
+    tag = Tag()
+    tag.images.set(3, b"\xff\xd8\xff\xe0" + b"\x00" * 100, "image/jpeg")
+    return tag
+
+
+def _loads(monkeypatch):
+    calls = []
+    _loadFileObj = core._loadFileObj
+
+    def _load(path, *args, **kwargs):
+        calls.append(str(path))
+        return _loadFileObj(path, *args, **kwargs)
+
+    monkeypatch.setattr(core, "_loadFileObj", _load)
+    return calls
+
+
+def test_pickle(mp3file):
+    path = mp3file("a.mp3", AUDIO, "Raining Blood", tag=_tag())
+    for lazy in (False, True):
+        audio_file = pickle.loads(pickle.dumps(core.load(path, lazy=lazy)))
+        assert audio_file.tag.title == "Raining Blood"
+        assert audio_file.tag.images[0].picture_type == 3
+        assert audio_file.info.time_secs == pytest.approx(0.26, abs=0.01)
+
+    audio_file.tag.artist = "Slayer"
+    audio_file.tag.save()
+    tag = eyed3.load(path).tag
+    assert (tag.artist, tag.title, len(tag.images)) == ("Slayer", "Raining Blood", 1)
+
+
+def test_load(tmpdir, cache, monkeypatch, mp3file):
+    path = mp3file("a.mp3", AUDIO, "Raining Blood", tag=_tag())
+    other = str(tmpdir / "notes.txt")
+    with open(other, "w") as fp:
+        fp.write("not audio")
+    loads = _loads(monkeypatch)
+
+    for _ in range(2):
+        audio_file = core.load(path)
+        assert audio_file.tag.title == "Raining Blood"
+        assert audio_file.info.time_secs == pytest.approx(0.26, abs=0.01)
+        assert core.load(other) is None
+    assert loads == [path, other]
+
+    # Other load options are cached separately.
+    assert core.load(path, lazy=True).tag.title == "Raining Blood"
+    assert loads == [path, other, path]
+
+    # Changed files are loaded.
+    with open(path, "ab") as fp:
+        fp.write(AUDIO)
+    assert core.load(path).info.time_secs == pytest.approx(0.52, abs=0.01)
+    assert loads == [path, other, path, path]
+
+    # Moved files are served, with their new path.
+    moved = str(tmpdir / "b.mp3")
+    os.rename(path, moved)
+    audio_file = core.load(moved)
+    assert loads == [path, other, path, path]
+    assert audio_file.path == moved and audio_file.tag.file_info.name == moved
+
+
+def test_save_invalidates(cache, monkeypatch, mp3file):
+    path = mp3file("a.mp3", AUDIO, "Raining Blood", tag=_tag())
+    loads = _loads(monkeypatch)
+
+    audio_file = core.load(path)
+    audio_file.tag.title = "Postmortem"
+    # The same size, written in place, with the file times preserved.
+    audio_file.tag.save(preserve_file_time=True)
+    assert core.load(path).tag.title == "Postmortem"
+    assert loads == [path, path]
+
+    Tag.remove(path, preserve_file_time=True)
+    assert core.load(path).tag is None
+    assert loads == [path, path, path]
+
+
+def test_scan_cache_option(tmpdir, monkeypatch, mp3file):
+    import eyed3.main
+    from . import RedirectStdStreams
+
+    path = mp3file("a.mp3", AUDIO, "Raining Blood", tag=_tag())
+    cache_path = str(tmpdir / "scan.db")
+    loads = _loads(monkeypatch)
+
+    for _ in range(2):
+        args, _, config = eyed3.main.parseCommandLine(["-P", "stats", "--scan-cache",
+                                                       cache_path, path])
+        with RedirectStdStreams():
+            eyed3.main.main(args, config)
+    assert loads == [path]
+    assert scancache.getCache() is None
+
+
+def test_plain_data(tmpdir, cache, monkeypatch, mp3file):
+    path = mp3file("a.mp3", AUDIO, "Raining Blood", tag=_tag())
+    # A Xing header with a frame count.
+    xing = AUDIO[:36] + b"Xing" + (1).to_bytes(4, "big") + (3).to_bytes(4, "big") + AUDIO[48:]
+    with open(path, "ab") as fp:
+        fp.write(b"\x00" * 100)
+    v1_path = str(tmpdir / "v1.mp3")
+    with open(v1_path, "wb") as fp:
+        fp.write(xing + AUDIO)
+    tag = Tag()
+    tag.title = "Criminally Insane"
+    tag.save(v1_path, version=ID3_V1_1)
+    id3_path = str(tmpdir / "a.id3")
+    tag = Tag()
+    tag.title = "Epidemic"
+    tag.save(id3_path)
+    loads = _loads(monkeypatch)
+
+    files = [(path, True), (path, False), (v1_path, False), (id3_path, False)]
+    for f, exact in files:
+        loaded = core.load(f, exact_duration=exact)
+        cached = core.load(f, exact_duration=exact)
+        assert cached is not loaded and type(cached) is type(loaded)
+        assert (cached.path, cached.type, cached.tag.title, cached.tag.version) == \
+            (loaded.path, loaded.type, loaded.tag.title, loaded.tag.version)
+        assert (cached.tag.file_info.tag_size, cached.tag.file_info.mtime_ns) == \
+            (loaded.tag.file_info.tag_size, loaded.tag.file_info.mtime_ns)
+        if loaded.info is None:
+            assert cached.info is None
+            continue
+        for name in ("time_secs", "size_bytes", "bit_rate", "sample_freq", "mode",
+                     "frame_walk", "_header_pos"):
+            assert getattr(cached.info, name) == getattr(loaded.info, name)
+        assert vars(cached.info.mp3_header) == vars(loaded.info.mp3_header)
+        assert (cached.info.xing_header is None) == (loaded.info.xing_header is None)
+        assert vars(cached.info.lame_tag) == vars(loaded.info.lame_tag)
+    assert loads == [f for f, _ in files]
+    assert core.load(path, exact_duration=True).info.frame_walk.frame_count == 10
+    assert core.load(v1_path).info.xing_header.numFrames == 3
+    assert len(core.load(path).tag.images) == 1
+
+    db = sqlite3.connect(cache.path)
+    for kind, tag_data, info in db.execute("SELECT kind, tag, info FROM files"):
+        assert kind in ("mp3", "id3") and tag_data[:3] in (b"ID3", b"TAG")
+        assert info is None or json.loads(info)["size_bytes"]
+    db.close()
+
+
+def test_default_path(monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", "/var/cache/me")
+    assert scancache._defaultCachePath() == "/var/cache/me/eyeD3/scan.db"
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", "/home/me")
+    assert scancache._defaultCachePath() == "/home/me/.cache/eyeD3/scan.db"
@@ -29,3 +29,43 @@ class TestId3FrameRules(unittest.TestCase):
         print(out.stdout.getvalue())
 
         self.assertIn('PRIV frames are bad', out.stdout.getvalue())
+
+    def test_exact_frame_bitrates(self):
+        try:
+            fd, tempf = tempfile.mkstemp(suffix='.mp3')
+            os.close(fd)
+            with open(tempf, "wb") as fp:
+                fp.write((b"\xff\xfb\x90\x64" + b"\x00" * 413) * 10)
+            args = ['--plugin', 'stats', '--exact', tempf]
+            args, _, config = eyed3.main.parseCommandLine(args)
+
+            with RedirectStdStreams() as out:
+                eyed3.main.main(args, config)
+        finally:
+            os.remove(tempf)
+
+        self.assertIn('MP3 frame bitrates:', out.stdout.getvalue())
+        self.assertIn('128 kb/s', out.stdout.getvalue())
+
+    def test_jobs(self):
+        with tempfile.TemporaryDirectory() as tempd:
+            for i, title in enumerate(("one", "two", "three")):
+                path = os.path.join(tempd, f"{i}.id3")
+                open(path, "wb").close()
+                tagfile = eyed3.id3.TagFile(path)
+                tagfile.initTag()
+                tagfile.tag.title = title
+                if i == 1:
+                    tagfile.tag.privates.set(b'mydata', b'onwer0')
+                tagfile.tag.save()
+
+            outputs = []
+            for jobs in ("1", "2"):
+                args, _, config = eyed3.main.parseCommandLine(
+                        ['--plugin', 'stats', '--verbose', '--jobs', jobs, tempd])
+                with RedirectStdStreams() as out:
+                    eyed3.main.main(args, config)
+                outputs.append(out.stdout.getvalue())
+
+        self.assertIn('PRIV frames are bad', outputs[1])
+        self.assertEqual(outputs[0], outputs[1])
@@ -1,7 +1,8 @@
 from unittest.mock import MagicMock, call
 
 import eyed3.utils.console
-from eyed3.utils import walk
+import os
+from eyed3.utils import walk, walkEntries
 from eyed3.utils.console import (
     printMsg, printWarning, printHeader, Fore, WARNING_COLOR, HEADER_COLOR
 )
@@ -117,3 +118,48 @@ def test_walk(tmpdir):
     handler.handleFile.assert_has_calls([call(str(f3)), call(str(f2))], any_order=True)
     handler.handleDirectory.assert_has_calls([call(str(d3), [f3.basename, f2.basename])],
                                              any_order=True)
+
+
+def test_walkEntries(tmpdir):
+    root_d = tmpdir.mkdir("Root")
+    d1 = root_d.mkdir("d1")
+    (d1 / "b.mp3").write_text("b", "utf8")
+    (d1 / "a.mp3").write_text("a", "utf8")
+    (d1 / "cover.jpg").write_text("jpg", "utf8")
+    d2 = root_d.mkdir("d2")
+    (d2 / "c.MP3").write_text("c", "utf8")
+    (d2 / "notes.txt").write_text("txt", "utf8")
+    root_d.mkdir("empty")
+    os.symlink(str(d1 / "a.mp3"), str(root_d / "link.mp3"))
+
+    walked = [(d, [e.name for e in entries])
+              for d, entries in walkEntries(str(root_d), excludes=[r".*\.jpg$", r"(?i).*\.txt"])]
+    assert walked == [(str(root_d), ["link.mp3"]),
+                      (str(d1), ["a.mp3", "b.mp3"]),
+                      (str(d2), ["c.MP3"]),
+                      (str(root_d / "empty"), [])]
+
+    _, entries = next(walkEntries(str(d1)))
+    assert all(isinstance(e, os.DirEntry) for e in entries)
+    assert entries[0].stat().st_size == 1
+
+    assert [d for d, _ in walkEntries(str(root_d), recursive=False)] == [str(root_d)]
+
+    handler = MagicMock()
+    walk(handler, str(root_d), excludes=[r".*/d2/", r".*\.jpg$"], recursive=True)
+    assert handler.handleFile.call_args_list == [call(str(root_d / "link.mp3")),
+                                                 call(str(d1 / "a.mp3")),
+                                                 call(str(d1 / "b.mp3"))]
+    handler.handleDirectory.assert_has_calls([call(str(root_d), ["link.mp3"]),
+                                              call(str(d1), ["a.mp3", "b.mp3"])])
+    assert handler.handleDirectory.call_count == 2
+    entries = handler.fileEntries.call_args_list[1][0][0]
+    assert list(entries) == [str(d1 / "a.mp3"), str(d1 / "b.mp3")]
+    assert entries[str(d1 / "b.mp3")].name == "b.mp3"
+
+    # Backreferences, which do not survive joining the expressions.
+    (d2 / "d2.mp3").write_text("d2", "utf8")
+    walked = [[e.name for e in entries]
+              for _, entries in walkEntries(str(d2), excludes=[r".*/(\w+)/\1\.mp3$",
+                                                               r".*\.txt$"])]
+    assert walked == [["c.MP3"]]